@@ -1,13 +1,23 @@
 # Product Catalog API module for making requests to Product Catalog Component
 import logging
+import asyncio
+import functools
 from pathlib import Path
 import json
+import random
+import re
+import time
 import httpx
 from httpx import Timeout
-from typing import Any, List, Dict
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, List, Dict
+from urllib.parse import parse_qs, urlsplit
 from dotenv import load_dotenv
 import os
 import datetime
+import email.utils
+import hmac
+import secrets
 import uuid
 import warnings
 
@@ -27,12 +37,1831 @@ log_dir.mkdir(exist_ok=True)
 logger = logging.getLogger("product-catalog-api")
 
 # Constants
-if RELEASE_NAME == "local":
+if os.environ.get("TMF620_API_URL"):
+    # Explicit override, e.g. to run against the stub backend in stub_product_catalog_backend.py
+    API_URL = os.environ["TMF620_API_URL"].rstrip("/")
+elif RELEASE_NAME == "local":
     API_URL = "https://localhost/r1-productcatalogmanagement/tmf-api/productCatalogManagement/v4"
 else:
     API_URL = f"http://{RELEASE_NAME}-prodcatapi:8080/{RELEASE_NAME}-productcatalogmanagement/tmf-api/productCatalogManagement/v4"
 logger.info(f"API URL: {API_URL}")
 
+# Shared HTTP connection pool
+# A single long-lived AsyncClient is used for every request so that TCP/TLS connections
+# to the Product Catalog API are reused. Pool size and timeouts (in seconds) can be tuned
+# through environment variables.
+HTTP_TIMEOUT = Timeout(
+    connect=float(os.environ.get("HTTP_CONNECT_TIMEOUT", 10.0)),  # connection timeout
+    read=float(os.environ.get("HTTP_READ_TIMEOUT", 30.0)),  # read timeout
+    write=float(os.environ.get("HTTP_WRITE_TIMEOUT", 10.0)),  # write timeout
+    pool=float(os.environ.get("HTTP_POOL_TIMEOUT", 5.0)),  # pool timeout
+)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.environ.get("HTTP_MAX_CONNECTIONS", 100)),
+    max_keepalive_connections=int(os.environ.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20)),
+    keepalive_expiry=float(os.environ.get("HTTP_KEEPALIVE_EXPIRY", 30.0)),
+)
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use.
+
+    The MCP server opens and closes the client with its lifespan (see open_http_client and
+    close_http_client). Scripts that never call open_http_client get a client lazily.
+
+    Returns:
+        The process-wide httpx.AsyncClient
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+            verify=VALIDATE_SSL,  # SSL certificate verification
+        )
+        logger.info(
+            f"Opened HTTP connection pool (max_connections={HTTP_LIMITS.max_connections}, "
+            f"max_keepalive_connections={HTTP_LIMITS.max_keepalive_connections}, "
+            f"keepalive_expiry={HTTP_LIMITS.keepalive_expiry})"
+        )
+    return _http_client
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    """Open the shared AsyncClient. Called on application startup."""
+    return get_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient and release its pooled connections. Called on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("Closed HTTP connection pool")
+
+
+# ---------------------------------------------------------------------------------------------
+# TMF620 request pipeline
+# Every call to the Product Catalog API goes through Tmf620Client. A request travels through
+# an ordered list of middleware stages (retries, caching, metrics, tracing, ...) before it is
+# sent on the shared connection pool, so each cross-cutting feature is implemented once for
+# all resources.
+
+# @type of each TMF620 resource path handled by this module
+RESOURCE_TYPE_NAMES = {
+    "catalog": "Catalog",
+    "category": "Category",
+    "productSpecification": "ProductSpecification",
+    "productOffering": "ProductOffering",
+    "productOfferingPrice": "ProductOfferingPrice",
+}
+# TMF620 resource paths handled by this module
+RESOURCE_TYPES = tuple(RESOURCE_TYPE_NAMES)
+
+JSON_HEADERS = {
+    "Content-Type": "application/json;charset=utf-8",
+    "Accept": "application/json;charset=utf-8",
+}
+ACCEPT_HEADERS = {"Accept": "application/json;charset=utf-8"}
+
+# Default number of items requested per page when iterating over a collection
+PAGE_SIZE = int(os.environ.get("TMF620_PAGE_SIZE", 100))
+# Maximum number of pages requested concurrently when reading a whole collection
+FETCH_FAN_OUT = int(os.environ.get("TMF620_FETCH_FAN_OUT", 8))
+# Maximum number of concurrent POSTs made by create_many
+CREATE_CONCURRENCY = int(os.environ.get("TMF620_CREATE_CONCURRENCY", 8))
+
+# Status codes accepted as success for each HTTP method
+# (206 is returned by list operations when only part of the collection fits in the page)
+EXPECTED_STATUS = {
+    "GET": (200, 206),
+    "POST": (201,),
+    "PATCH": (200, 201, 202, 204),
+    "DELETE": (200, 202, 204),
+}
+
+
+class Tmf620Error(Exception):
+    """Error raised by the TMF620 request pipeline.
+
+    Args:
+        status: HTTP status code (408 for timeouts, 500 for transport and decoding errors)
+        detail: Error message or response body returned by the API
+        headers: Response headers, if a response was received
+    """
+
+    def __init__(self, status: int, detail: str, headers: httpx.Headers = None):
+        super().__init__(f"{status} - {detail}")
+        self.status = status
+        self.detail = detail
+        self.headers = headers if headers is not None else httpx.Headers()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the error in the structure used by the API functions and MCP tools."""
+        return {"error": {"status": self.status, "detail": self.detail}}
+
+
+class CircuitOpenError(Tmf620Error):
+    """Raised without contacting the API while the circuit breaker of a resource is open.
+
+    Args:
+        resource: TMF620 resource path whose circuit is open
+        retry_after: Seconds until the circuit lets a trial request through
+    """
+
+    def __init__(self, resource: str, retry_after: float):
+        super().__init__(
+            503,
+            f"The Product Catalog API is unavailable for {resource} (circuit breaker open), "
+            f"retry in {retry_after:.0f} seconds",
+        )
+        self.resource = resource
+        self.retry_after = retry_after
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the error in the structure used by the API functions and MCP tools."""
+        error = super().to_dict()
+        error["error"]["retry_after"] = round(self.retry_after, 1)
+        return error
+
+
+class Tmf620Request:
+    """A request to a TMF620 resource as seen by the middleware stages."""
+
+    __slots__ = (
+        "method",
+        "resource",
+        "resource_id",
+        "params",
+        "json",
+        "headers",
+        "extensions",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        resource: str,
+        resource_id: str = None,
+        params: dict = None,
+        json: Any = None,
+        headers: dict = None,
+    ):
+        self.method = method
+        self.resource = resource
+        self.resource_id = resource_id
+        self.params = params if params is not None else {}
+        self.json = json
+        # Extra request headers, e.g. conditional headers added by the response cache
+        self.headers = headers if headers is not None else {}
+        # Free-form storage for middleware stages
+        self.extensions = {}
+
+    @property
+    def path(self) -> str:
+        """Path of the request relative to the API base URL."""
+        if self.resource_id:
+            return f"{self.resource}/{self.resource_id}"
+        return self.resource
+
+    @property
+    def key(self) -> tuple:
+        """Hashable identity of the request (method, resource, ID, query parameters and headers)."""
+        return (
+            self.method,
+            self.resource,
+            self.resource_id,
+            tuple(sorted((k, str(v)) for k, v in self.params.items())),
+            tuple(sorted(self.headers.items())),
+        )
+
+
+class Tmf620Response:
+    """A decoded response from the TMF620 API.
+
+    Attributes:
+        status_code: HTTP status code
+        headers: Response headers
+        data: Decoded JSON body, or None if the response had no body
+        size: Size of the raw response body in bytes
+    """
+
+    __slots__ = ("status_code", "headers", "data", "size")
+
+    def __init__(self, status_code: int, headers: httpx.Headers, data: Any, size: int):
+        self.status_code = status_code
+        self.headers = headers
+        self.data = data
+        self.size = size
+
+
+def build_query_params(
+    fields: str = None, offset: int = None, limit: int = None, filter: dict = None
+) -> dict[str, Any]:
+    """Build TMF620 query parameters for a get/list request.
+
+    Args:
+        fields: Optional comma-separated list of field names to include in the response
+        offset: Optional offset for pagination
+        limit: Optional limit for pagination
+        filter: Optional dictionary of filter criteria (e.g., {"name": "Wholesale"})
+
+    Returns:
+        Dictionary of query parameters
+    """
+    params = {}
+    if fields:
+        params["fields"] = fields
+    if offset is not None:
+        params["offset"] = offset
+    if limit is not None:
+        params["limit"] = limit
+    if filter:
+        # Format as per TMF API filtering convention
+        params.update(filter)
+    return params
+
+
+_LINK_PATTERN = re.compile(r'<([^>]*)>\s*;\s*rel="?([^",;]+)"?')
+
+
+def parse_link_header(value: str) -> dict[str, str]:
+    """Parse an RFC 5988 Link header into a dictionary of URLs keyed by relation type."""
+    return {rel: url for url, rel in _LINK_PATTERN.findall(value or "")}
+
+
+def next_page_offset(
+    response: Tmf620Response, offset: int, count: int, page_size: int
+) -> int | None:
+    """Work out the offset of the page following a list response.
+
+    The Link header (rel="next") is used when present; otherwise the X-Total-Count header
+    and the size of the page decide whether more items remain.
+
+    Args:
+        response: The list response
+        offset: Offset the page was requested with
+        count: Number of items in the page
+        page_size: Limit the page was requested with
+
+    Returns:
+        Offset of the next page, or None if this was the last page
+    """
+    if count == 0:
+        return None
+    links = parse_link_header(response.headers.get("Link"))
+    if links:
+        if "next" not in links:
+            return None
+        next_offset = parse_qs(urlsplit(links["next"]).query).get("offset")
+        if next_offset:
+            return max(int(next_offset[0]), offset + 1)
+    total = response.headers.get("X-Total-Count")
+    if total is not None and offset + count >= int(total):
+        return None
+    if count < page_size:
+        return None
+    return offset + count
+
+
+class Tmf620Client:
+    """Client engine for the TMF620 Product Catalog Management API.
+
+    A middleware stage is an async callable ``stage(request, call_next)`` that receives a
+    Tmf620Request and returns a Tmf620Response, usually by awaiting ``call_next(request)``.
+    Stages run in the order they were added; failures are raised as Tmf620Error.
+
+    Args:
+        base_url: Base URL of the TMF620 API
+        middleware: Optional list of middleware stages
+        http_client: Optional AsyncClient to send requests with (default: the shared pool)
+    """
+
+    def __init__(
+        self,
+        base_url: str = API_URL,
+        middleware: list = None,
+        http_client: httpx.AsyncClient = None,
+    ):
+        self.base_url = base_url
+        self.http_client = http_client
+        self._middleware = list(middleware or [])
+        self._pipeline = self._build_pipeline()
+
+    def use(self, stage) -> None:
+        """Append a middleware stage to the request pipeline."""
+        self._middleware.append(stage)
+        self._pipeline = self._build_pipeline()
+
+    @property
+    def middleware(self) -> tuple:
+        """The middleware stages in pipeline order."""
+        return tuple(self._middleware)
+
+    def without(self, *stage_types: type) -> "Tmf620Client":
+        """Return a client with the same settings and stages, except those of the given types.
+
+        For example, tmf620_client.without(ResponseCache) reads current data from the API
+        while still going through the retry, circuit breaker and rate limiting stages.
+        """
+        return Tmf620Client(
+            self.base_url,
+            [stage for stage in self._middleware if not isinstance(stage, stage_types)],
+            self.http_client,
+        )
+
+    def _build_pipeline(self):
+        # Compose the stages once so that a request does not rebuild the chain
+        handler = self._send
+        for stage in reversed(self._middleware):
+            handler = functools.partial(stage, call_next=handler)
+        return handler
+
+    async def request(self, request: Tmf620Request) -> Tmf620Response:
+        """Send a request through the middleware pipeline.
+
+        Args:
+            request: The request to send
+
+        Returns:
+            The decoded response
+
+        Raises:
+            Tmf620Error: If the request failed or returned an unexpected status code
+        """
+        try:
+            return await self._pipeline(request)
+        except Tmf620Error:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}")
+            logger.exception("Stack trace:")
+            raise Tmf620Error(500, f"Unexpected error: {str(e)}") from e
+
+    async def _send(self, request: Tmf620Request) -> Tmf620Response:
+        """Final pipeline stage: send the request on the shared connection pool."""
+        url = f"{self.base_url}/{request.path}"
+        headers = JSON_HEADERS if request.json is not None else ACCEPT_HEADERS
+        if request.headers:
+            headers = {**headers, **request.headers}
+        logger.info(f"Sending {request.method} request to: {url}")
+        if request.params:
+            logger.info(f"With parameters: {request.params}")
+
+        started = time.monotonic()
+        try:
+            response = await (self.http_client or get_http_client()).request(
+                request.method,
+                url,
+                headers=headers,
+                params=request.params,
+                json=request.json,
+            )
+        except httpx.TimeoutException as e:
+            logger.error(
+                f"Timeout Error: Request timed out after {HTTP_TIMEOUT.read} seconds"
+            )
+            raise Tmf620Error(
+                408, f"Request timed out after {HTTP_TIMEOUT.read} seconds"
+            ) from e
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP Error: {e}")
+            raise Tmf620Error(500, str(e)) from e
+        finally:
+            # Time spent on the network, excluding time queued in middleware stages
+            request.extensions["elapsed"] = time.monotonic() - started
+
+        logger.info(f"Response status: {response.status_code}")
+        if response.status_code == 304 and request.headers:
+            # Not modified: the caller that sent the conditional request reuses its copy
+            return Tmf620Response(304, response.headers, None, 0)
+        if response.is_error:
+            logger.error(f"HTTP Status Error: {response.status_code} - {response.text}")
+            raise Tmf620Error(response.status_code, response.text, response.headers)
+        if response.status_code not in EXPECTED_STATUS.get(request.method, (200,)):
+            logger.warning(f"Unexpected status code: {response.status_code}")
+            raise Tmf620Error(
+                response.status_code,
+                f"Unexpected status code: {response.status_code}",
+                response.headers,
+            )
+
+        content = response.content
+        data = None
+        if content:
+            try:
+                data = json.loads(content)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to decode JSON response: {e}")
+                raise Tmf620Error(
+                    500, f"Failed to decode JSON response: {str(e)}"
+                ) from e
+        return Tmf620Response(
+            response.status_code, response.headers, data, len(content)
+        )
+
+    async def get(
+        self,
+        resource: str,
+        resource_id: str = None,
+        fields: str = None,
+        offset: int = None,
+        limit: int = None,
+        filter: dict = None,
+    ) -> Any:
+        """Retrieve a resource by ID, or list resources when no ID is given.
+
+        Returns:
+            The decoded resource or list of resources
+        """
+        params = build_query_params(fields, offset, limit, filter)
+        response = await self.request(
+            Tmf620Request("GET", resource, resource_id, params=params)
+        )
+        return response.data
+
+    def cached(self, request: Tmf620Request) -> Tmf620Response | None:
+        """Return a response held by a caching stage without sending the request.
+
+        A stage takes part by providing ``lookup(request)``, which returns a fresh cached
+        response or None.
+        """
+        for stage in self._middleware:
+            lookup = getattr(stage, "lookup", None)
+            if lookup is not None:
+                response = lookup(request)
+                if response is not None:
+                    return response
+        return None
+
+    async def get_many(
+        self,
+        resource: str,
+        resource_ids: list[str],
+        fields: str = None,
+        concurrency: int = None,
+    ) -> dict[str, Any]:
+        """Retrieve several resources of one type by ID.
+
+        Duplicate IDs are requested once. Cached resources are returned without waiting for
+        a request slot; the others are fetched concurrently, at most concurrency at a time.
+
+        Args:
+            resource: TMF620 resource path (e.g. "productOffering")
+            resource_ids: IDs of the resources to retrieve
+            fields: Optional comma-separated list of field names to include
+            concurrency: Maximum number of concurrent GETs (default: TMF620_FETCH_FAN_OUT)
+
+        Returns:
+            Mapping of each distinct ID, in input order, to the resource or to an error
+            object; IDs that do not exist map to a 404 error.
+        """
+        params = build_query_params(fields, None, None, None)
+        results: dict[str, Any] = {}
+        missing = []
+        for resource_id in dict.fromkeys(resource_ids):
+            cached = self.cached(Tmf620Request("GET", resource, resource_id, params))
+            results[resource_id] = None if cached is None else cached.data
+            if cached is None:
+                missing.append(resource_id)
+
+        semaphore = asyncio.Semaphore(concurrency or FETCH_FAN_OUT)
+
+        async def fetch(resource_id: str) -> None:
+            async with semaphore:
+                try:
+                    results[resource_id] = await self.get(
+                        resource, resource_id, fields=fields
+                    )
+                except Tmf620Error as e:
+                    results[resource_id] = e.to_dict()
+
+        logger.info(
+            f"Fetching {len(missing)} of {len(results)} {resource} resources by ID"
+        )
+        await asyncio.gather(*(fetch(resource_id) for resource_id in missing))
+        return results
+
+    async def create(self, resource: str, data: dict[str, Any]) -> Any:
+        """Create a resource using POST.
+
+        Returns:
+            The created resource
+        """
+        response = await self.request(Tmf620Request("POST", resource, json=data))
+        return response.data
+
+    async def update(
+        self, resource: str, resource_id: str, data: dict[str, Any]
+    ) -> Any:
+        """Partially update a resource using PATCH.
+
+        Returns:
+            The updated resource, or None if the API returned no body
+        """
+        response = await self.request(
+            Tmf620Request("PATCH", resource, resource_id, json=data)
+        )
+        return response.data
+
+    async def delete(self, resource: str, resource_id: str) -> None:
+        """Delete a resource."""
+        await self.request(Tmf620Request("DELETE", resource, resource_id))
+
+    async def iterate(
+        self,
+        resource: str,
+        page_size: int = None,
+        fields: str = None,
+        filter: dict = None,
+        offset: int = 0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over a collection, requesting one page at a time.
+
+        Pages are only requested as the iterator is consumed, so at most one page is held
+        in memory. Paging follows the Link and X-Total-Count headers returned by the API.
+
+        Args:
+            resource: TMF620 resource path (e.g. "productOffering")
+            page_size: Number of items per page (default: TMF620_PAGE_SIZE)
+            fields: Optional comma-separated list of field names to include
+            filter: Optional dictionary of filter criteria
+            offset: Offset of the first item
+
+        Yields:
+            The items of the collection
+
+        Raises:
+            Tmf620Error: If a page could not be retrieved
+        """
+        page_size = page_size or PAGE_SIZE
+        while offset is not None:
+            params = build_query_params(fields, offset, page_size, filter)
+            response = await self.request(Tmf620Request("GET", resource, params=params))
+            items = response.data or []
+            for item in items:
+                yield item
+            offset = next_page_offset(response, offset, len(items), page_size)
+
+    async def get_all(
+        self,
+        resource: str,
+        page_size: int = None,
+        fan_out: int = None,
+        fields: str = None,
+        filter: dict = None,
+    ) -> list[dict[str, Any]]:
+        """Read a whole collection, fetching pages concurrently.
+
+        The first page is requested on its own to learn the collection size from the
+        X-Total-Count header. The remaining windows, as long as the first page, are then
+        requested concurrently, at most fan_out at a time, and reassembled in order.
+
+        The Product Catalog API reports the size of the whole collection in X-Total-Count,
+        also for filtered requests, so filtered scans and responses without a total count
+        are read page by page instead.
+
+        Args:
+            resource: TMF620 resource path (e.g. "productOffering")
+            page_size: Number of items per page (default: TMF620_PAGE_SIZE)
+            fan_out: Maximum number of concurrent page requests (default: TMF620_FETCH_FAN_OUT)
+            fields: Optional comma-separated list of field names to include
+            filter: Optional dictionary of filter criteria
+
+        Returns:
+            All items of the collection
+
+        Raises:
+            Tmf620Error: If a page could not be retrieved
+        """
+        page_size = page_size or PAGE_SIZE
+        fan_out = fan_out or FETCH_FAN_OUT
+
+        async def fetch_page(offset: int) -> Tmf620Response:
+            params = build_query_params(fields, offset, page_size, filter)
+            return await self.request(Tmf620Request("GET", resource, params=params))
+
+        first = await fetch_page(0)
+        items = list(first.data or [])
+        total = first.headers.get("X-Total-Count")
+        if filter or total is None:
+            if next_page_offset(first, 0, len(items), page_size) is not None:
+                async for item in self.iterate(
+                    resource, page_size, fields=fields, filter=filter, offset=len(items)
+                ):
+                    items.append(item)
+            return items
+        if not items or len(items) >= int(total):
+            return items
+
+        semaphore = asyncio.Semaphore(fan_out)
+
+        async def fetch_window(offset: int) -> list:
+            async with semaphore:
+                return (await fetch_page(offset)).data or []
+
+        # The server may return fewer items than requested per page
+        stride = len(items)
+        offsets = range(stride, int(total), stride)
+        logger.info(
+            f"Fetching {len(offsets)} more pages of {resource} with fan-out {fan_out}"
+        )
+        pages = await asyncio.gather(*(fetch_window(offset) for offset in offsets))
+        for page in pages:
+            items.extend(page)
+
+        # The collection may have grown while the pages were fetched
+        if pages and len(pages[-1]) == stride:
+            async for item in self.iterate(
+                resource,
+                page_size,
+                fields=fields,
+                filter=filter,
+                offset=offsets[-1] + stride,
+            ):
+                items.append(item)
+        return items
+
+    async def create_many(
+        self,
+        resource: str,
+        items: list[dict[str, Any]],
+        concurrency: int = None,
+        stop_on_error: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Create several resources concurrently.
+
+        Args:
+            resource: TMF620 resource path (e.g. "productOffering")
+            items: Resources to create
+            concurrency: Maximum number of concurrent POSTs (default: TMF620_CREATE_CONCURRENCY)
+            stop_on_error: Do not start further creates once one has failed
+
+        Returns:
+            One result per item, in input order: the created resource, or an error object.
+            Items skipped because of stop_on_error get a 424 (Failed Dependency) error.
+        """
+        semaphore = asyncio.Semaphore(concurrency or CREATE_CONCURRENCY)
+        failed = False
+
+        async def create_item(item: dict[str, Any]) -> dict[str, Any]:
+            nonlocal failed
+            async with semaphore:
+                if failed and stop_on_error:
+                    return Tmf620Error(
+                        424, "Not created because an earlier item failed"
+                    ).to_dict()
+                try:
+                    return await self.create(resource, item)
+                except Tmf620Error as e:
+                    failed = True
+                    return e.to_dict()
+
+        logger.info(f"Creating {len(items)} {resource} resources")
+        return await asyncio.gather(*(create_item(item) for item in items))
+
+
+def parse_resource_settings(value: str, cast=float) -> dict[str, Any]:
+    """Parse a per-resource setting such as "catalog=300,productOfferingPrice=30".
+
+    Args:
+        value: Comma-separated list of resource=value pairs
+        cast: Conversion applied to each value
+
+    Returns:
+        Mapping of resource path to converted value
+    """
+    settings = {}
+    for entry in (value or "").split(","):
+        if "=" not in entry:
+            continue
+        resource, setting = entry.split("=", 1)
+        settings[resource.strip()] = cast(setting.strip())
+    return settings
+
+
+# ---------------------------------------------------------------------------------------------
+# Response cache
+# GET responses are kept in memory for a per-resource TTL. The cache is bounded both by number
+# of entries and by the size of the cached response bodies, evicting the least recently used
+# entries first. Cached data is shared between callers and must be treated as read-only.
+# Expired entries whose response carried a validator (ETag or Last-Modified) are revalidated
+# with a conditional GET instead of being refetched in full. The Product Catalog API sends
+# neither, so against it expired entries are always refetched.
+
+CACHE_TTL = float(os.environ.get("TMF620_CACHE_TTL", 30.0))
+# Per-resource TTL overrides, e.g. "catalog=300,category=300,productOfferingPrice=10"
+CACHE_TTLS = parse_resource_settings(os.environ.get("TMF620_CACHE_TTLS", ""))
+CACHE_MAX_ENTRIES = int(os.environ.get("TMF620_CACHE_MAX_ENTRIES", 1000))
+CACHE_MAX_BYTES = int(os.environ.get("TMF620_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+
+
+class ResponseCache:
+    """Read-through TTL/LRU cache middleware for GET requests.
+
+    Entries are keyed by resource type, ID, fields, paging and filter parameters. A
+    successful POST invalidates the cached lists of its resource type; a successful PATCH or
+    DELETE also invalidates every cached view of the modified resource.
+
+    When an entry expires and its response carried an ETag or Last-Modified header, the
+    next request sends If-None-Match or If-Modified-Since. A 304 answer renews the entry and
+    returns the cached, already decoded body. Validators are never derived from the body
+    (e.g. lastUpdate), as the server does not necessarily honour them.
+
+    Args:
+        ttl: Default time-to-live in seconds; 0 disables caching
+        ttls: Per-resource TTL overrides
+        max_entries: Maximum number of cached responses
+        max_bytes: Maximum total size of the cached response bodies
+    """
+
+    def __init__(
+        self,
+        ttl: float = CACHE_TTL,
+        ttls: dict[str, float] = None,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ):
+        self.ttl = ttl
+        self.ttls = dict(CACHE_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (expiry time, response, conditional request headers)
+        self._entries: OrderedDict[tuple, tuple[float, Tmf620Response, dict]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self.hits = dict.fromkeys(RESOURCE_TYPES, 0)
+        self.misses = dict.fromkeys(RESOURCE_TYPES, 0)
+        self.revalidations = dict.fromkeys(RESOURCE_TYPES, 0)
+        self.evictions = 0
+        self.invalidations = 0
+        self.refreshes = 0
+
+    def ttl_for(self, resource: str) -> float:
+        """Time-to-live in seconds of the cached responses of a resource type."""
+        return self.ttls.get(resource, self.ttl)
+
+    async def __call__(self, request: Tmf620Request, call_next) -> Tmf620Response:
+        if request.method != "GET":
+            response = await call_next(request)
+            self.invalidate(request.resource, request.resource_id)
+            return response
+
+        ttl = self.ttl_for(request.resource)
+        if ttl <= 0 or self.max_entries <= 0:
+            return await call_next(request)
+
+        key = request.key
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, cached, conditions = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._count(self.hits, request.resource)
+                return cached
+            if not conditions:
+                self._remove(key)
+            else:
+                response = await call_next(
+                    Tmf620Request(
+                        "GET",
+                        request.resource,
+                        request.resource_id,
+                        params=request.params,
+                        headers={**request.headers, **conditions},
+                    )
+                )
+                if response.status_code == 304:
+                    self._count(self.revalidations, request.resource)
+                    self._store(key, cached, ttl, conditions)
+                    return cached
+                self._count(self.misses, request.resource)
+                self._store(key, response, ttl, self.validators(request, response))
+                return response
+
+        self._count(self.misses, request.resource)
+        response = await call_next(request)
+        self._store(key, response, ttl, self.validators(request, response))
+        return response
+
+    def lookup(self, request: Tmf620Request) -> Tmf620Response | None:
+        """Return the cached response to a GET if it has not expired, without calling the API."""
+        entry = self._entries.get(request.key)
+        if request.method != "GET" or entry is None or entry[0] <= time.monotonic():
+            return None
+        self._entries.move_to_end(request.key)
+        self._count(self.hits, request.resource)
+        return entry[1]
+
+    @staticmethod
+    def validators(request: Tmf620Request, response: Tmf620Response) -> dict[str, str]:
+        """Conditional request headers that revalidate a cached response.
+
+        Only validators sent by the server are used.
+        """
+        conditions = {}
+        if response.headers.get("ETag"):
+            conditions["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            conditions["If-Modified-Since"] = response.headers["Last-Modified"]
+        return conditions
+
+    def _count(self, counter: dict, resource: str) -> None:
+        counter[resource] = counter.get(resource, 0) + 1
+
+    def _store(
+        self, key: tuple, response: Tmf620Response, ttl: float, conditions: dict
+    ) -> None:
+        if response.size > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, response, conditions)
+        self._bytes += response.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1].size
+
+    def invalidate(self, resource: str, resource_id: str = None) -> int:
+        """Drop the cached lists of a resource type and, if given, every view of one resource.
+
+        Args:
+            resource: TMF620 resource path
+            resource_id: Optional ID of a modified resource
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [
+            key
+            for key in self._entries
+            if key[1] == resource and (key[2] is None or key[2] == resource_id)
+        ]
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def refresh(self, resource: str, resource_id: str, data: dict[str, Any]) -> None:
+        """Replace the cached views of one resource with a known current representation.
+
+        Every cached view of the resource and the lists of its type are dropped, then data
+        is cached as the answer to a plain GET of the resource.
+
+        Args:
+            resource: TMF620 resource path
+            resource_id: ID of the resource
+            data: Current representation of the resource, e.g. taken from an event
+        """
+        self.invalidate(resource, resource_id)
+        ttl = self.ttl_for(resource)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        request = Tmf620Request("GET", resource, resource_id)
+        response = Tmf620Response(
+            200, httpx.Headers(), data, len(json.dumps(data).encode("utf-8"))
+        )
+        self._store(request.key, response, ttl, self.validators(request, response))
+        self.refreshes += 1
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Current size and hit/miss counters of the cache."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": dict(self.hits),
+            "misses": dict(self.misses),
+            "revalidations": dict(self.revalidations),
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "refreshes": self.refreshes,
+        }
+
+    def metrics(self) -> list[tuple]:
+        """Metric families in the format expected by render_metrics."""
+        return [
+            (
+                "tmf620_cache_hits_total",
+                "counter",
+                "GET requests served from the response cache",
+                [({"resource": r}, n) for r, n in self.hits.items()],
+            ),
+            (
+                "tmf620_cache_misses_total",
+                "counter",
+                "GET requests forwarded to the API by the response cache",
+                [({"resource": r}, n) for r, n in self.misses.items()],
+            ),
+            (
+                "tmf620_cache_revalidations_total",
+                "counter",
+                "Expired entries renewed by a 304 Not Modified answer",
+                [({"resource": r}, n) for r, n in self.revalidations.items()],
+            ),
+            (
+                "tmf620_cache_evictions_total",
+                "counter",
+                "Entries evicted from the response cache to respect its size limits",
+                [({}, self.evictions)],
+            ),
+            (
+                "tmf620_cache_invalidations_total",
+                "counter",
+                "Entries invalidated by create, update and delete requests or events",
+                [({}, self.invalidations)],
+            ),
+            (
+                "tmf620_cache_refreshes_total",
+                "counter",
+                "Entries replaced with the resource carried by an event",
+                [({}, self.refreshes)],
+            ),
+            (
+                "tmf620_cache_entries",
+                "gauge",
+                "Cached responses",
+                [({}, len(self._entries))],
+            ),
+            (
+                "tmf620_cache_bytes",
+                "gauge",
+                "Size of the cached responses",
+                [({}, self._bytes)],
+            ),
+        ]
+
+
+# ---------------------------------------------------------------------------------------------
+# Request coalescing
+# Identical GETs that are in flight at the same time share one upstream request. Placed
+# behind the response cache, this also prevents a stampede when a popular entry expires.
+
+
+class SingleFlight:
+    """Middleware that coalesces concurrent identical GET requests.
+
+    The first request for a key is sent upstream; requests with the same key that arrive
+    while it is in flight wait for it and receive the same response or error. The upstream
+    request is shielded, so a cancelled caller does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self.shared = 0
+
+    async def __call__(self, request: Tmf620Request, call_next) -> Tmf620Response:
+        if request.method != "GET":
+            return await call_next(request)
+
+        key = request.key
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call_next(request))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def metrics(self) -> list[tuple]:
+        """Metric families in the format expected by render_metrics."""
+        return [
+            (
+                "tmf620_coalesced_requests_total",
+                "counter",
+                "GET requests that shared an identical in-flight request",
+                [({}, self.shared)],
+            ),
+            (
+                "tmf620_inflight_gets",
+                "gauge",
+                "Distinct GET requests currently in flight",
+                [({}, len(self._inflight))],
+            ),
+        ]
+
+
+# ---------------------------------------------------------------------------------------------
+# Retries
+# Transient failures (connection errors, timeouts, 429/502/503/504) of idempotent requests are
+# retried with exponential backoff and full jitter, honouring Retry-After. A retry budget caps
+# retries to a fraction of the traffic so that retries cannot multiply the load on an API that
+# is already struggling.
+
+RETRY_MAX_ATTEMPTS = int(os.environ.get("TMF620_RETRY_MAX_ATTEMPTS", 3))
+RETRY_BASE_DELAY = float(os.environ.get("TMF620_RETRY_BASE_DELAY", 0.1))
+RETRY_MAX_DELAY = float(os.environ.get("TMF620_RETRY_MAX_DELAY", 5.0))
+# Longest Retry-After (seconds) that is waited for; longer requests fail immediately
+RETRY_MAX_RETRY_AFTER = float(os.environ.get("TMF620_RETRY_MAX_RETRY_AFTER", 30.0))
+RETRY_BUDGET_RATIO = float(os.environ.get("TMF620_RETRY_BUDGET_RATIO", 0.2))
+RETRY_BUDGET_MIN = int(os.environ.get("TMF620_RETRY_BUDGET_MIN", 10))
+
+RETRY_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+RETRY_STATUS = (408, 429, 502, 503, 504)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (moment - now).total_seconds())
+
+
+class RetryBudget:
+    """Limit retries to a fraction of the requests made over a sliding time window.
+
+    Args:
+        ratio: Retries allowed per request in the window
+        min_retries: Retries always allowed in the window, so low traffic can still retry
+        window: Length of the window in seconds
+    """
+
+    def __init__(
+        self,
+        ratio: float = RETRY_BUDGET_RATIO,
+        min_retries: int = RETRY_BUDGET_MIN,
+        window: float = 10.0,
+    ):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def _expire(self, now: float) -> None:
+        for events in (self._requests, self._retries):
+            while events and events[0] <= now - self.window:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Record a first attempt."""
+        now = time.monotonic()
+        self._expire(now)
+        self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Take a retry from the budget; returns False if the budget is spent."""
+        now = time.monotonic()
+        self._expire(now)
+        allowed = max(self.min_retries, self.ratio * len(self._requests))
+        if len(self._retries) >= allowed:
+            return False
+        self._retries.append(now)
+        return True
+
+
+class RetryPolicy:
+    """Middleware that retries transient failures with exponential backoff and full jitter.
+
+    Only the methods in ``methods`` are retried (idempotent verbs by default). Each retry waits
+    a random delay between 0 and ``min(max_delay, base_delay * 2 ** retry)`` seconds, or the
+    delay requested by a Retry-After header.
+
+    Args:
+        max_attempts: Maximum number of attempts per request, including the first
+        base_delay: Backoff delay in seconds before the first retry
+        max_delay: Upper bound of the backoff delay in seconds
+        max_retry_after: Longest Retry-After in seconds that is honoured
+        methods: HTTP methods that may be retried
+        budget: Retry budget shared by all requests (default: a new RetryBudget)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        max_retry_after: float = RETRY_MAX_RETRY_AFTER,
+        methods: tuple = RETRY_METHODS,
+        budget: RetryBudget = None,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.methods = methods
+        self.budget = budget or RetryBudget()
+        self.retries: dict[str, int] = {}
+        self.budget_exhausted = 0
+
+    @staticmethod
+    def is_transient(error: Tmf620Error) -> bool:
+        """Whether a failed request may succeed if sent again."""
+        if isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error.__cause__, httpx.TransportError):
+            return True
+        return error.status in RETRY_STATUS
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter backoff delay in seconds before the given retry (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+    async def __call__(self, request: Tmf620Request, call_next) -> Tmf620Response:
+        if request.method not in self.methods or self.max_attempts <= 1:
+            return await call_next(request)
+
+        self.budget.record_request()
+        attempt = 1
+        while True:
+            try:
+                return await call_next(request)
+            except Tmf620Error as e:
+                if attempt >= self.max_attempts or not self.is_transient(e):
+                    raise
+                delay = parse_retry_after(e.headers.get("Retry-After"))
+                if delay is None:
+                    delay = self.backoff(attempt - 1)
+                elif delay > self.max_retry_after:
+                    raise
+                if not self.budget.try_acquire():
+                    self.budget_exhausted += 1
+                    logger.warning("Retry budget exhausted, not retrying")
+                    raise
+                if isinstance(e.__cause__, httpx.TransportError):
+                    reason = "transport"
+                else:
+                    reason = str(e.status)
+                self.retries[reason] = self.retries.get(reason, 0) + 1
+                logger.warning(
+                    f"{request.method} {request.path} failed ({e.status}), "
+                    f"retrying in {delay:.2f}s (attempt {attempt + 1}/{self.max_attempts})"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def metrics(self) -> list[tuple]:
+        """Metric families in the format expected by render_metrics."""
+        return [
+            (
+                "tmf620_retries_total",
+                "counter",
+                "Requests retried after a transient failure, by failure reason",
+                [({"reason": r}, n) for r, n in self.retries.items()],
+            ),
+            (
+                "tmf620_retry_budget_exhausted_total",
+                "counter",
+                "Retries skipped because the retry budget was spent",
+                [({}, self.budget_exhausted)],
+            ),
+        ]
+
+
+# ---------------------------------------------------------------------------------------------
+# Circuit breaker
+# Each resource path has its own circuit. When too many recent calls failed or were slow, the
+# circuit opens and requests fail immediately with CircuitOpenError instead of waiting for
+# connect and read timeouts. After a cool-down a few trial requests are let through
+# (half-open); if they succeed the circuit closes again, otherwise it reopens.
+
+BREAKER_WINDOW = int(os.environ.get("TMF620_BREAKER_WINDOW", 20))
+BREAKER_MIN_CALLS = int(os.environ.get("TMF620_BREAKER_MIN_CALLS", 10))
+BREAKER_FAILURE_RATE = float(os.environ.get("TMF620_BREAKER_FAILURE_RATE", 0.5))
+BREAKER_SLOW_CALL_RATE = float(os.environ.get("TMF620_BREAKER_SLOW_CALL_RATE", 0.8))
+BREAKER_SLOW_CALL_DURATION = float(
+    os.environ.get("TMF620_BREAKER_SLOW_CALL_DURATION", 5.0)
+)
+BREAKER_OPEN_DURATION = float(os.environ.get("TMF620_BREAKER_OPEN_DURATION", 30.0))
+BREAKER_HALF_OPEN_CALLS = int(os.environ.get("TMF620_BREAKER_HALF_OPEN_CALLS", 3))
+
+CIRCUIT_STATES = {"closed": 0, "open": 1, "half_open": 2}
+
+
+class _Circuit:
+    """State of the circuit of one resource path."""
+
+    __slots__ = ("state", "opened_at", "outcomes", "trials", "trial_successes")
+
+    def __init__(self, window: int):
+        self.state = "closed"
+        self.opened_at = 0.0
+        # (failed, slow) for the most recent calls while closed
+        self.outcomes: deque[tuple[bool, bool]] = deque(maxlen=window)
+        self.trials = 0
+        self.trial_successes = 0
+
+
+class CircuitBreaker:
+    """Middleware with a circuit breaker per resource path.
+
+    Connection errors, timeouts and 5xx responses count as failures; calls that take longer
+    than ``slow_call_duration`` count as slow. The circuit opens when, over the last
+    ``window`` calls (and at least ``min_calls``), the failure rate or the slow call rate
+    reaches its threshold.
+
+    Args:
+        window: Number of recent calls evaluated
+        min_calls: Calls needed before the rates are evaluated
+        failure_rate: Failure rate (0-1) that opens the circuit
+        slow_call_rate: Slow call rate (0-1) that opens the circuit
+        slow_call_duration: Duration in seconds above which a call is slow
+        open_duration: Seconds the circuit stays open before trial calls are allowed
+        half_open_calls: Trial calls that must succeed to close the circuit
+    """
+
+    def __init__(
+        self,
+        window: int = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        failure_rate: float = BREAKER_FAILURE_RATE,
+        slow_call_rate: float = BREAKER_SLOW_CALL_RATE,
+        slow_call_duration: float = BREAKER_SLOW_CALL_DURATION,
+        open_duration: float = BREAKER_OPEN_DURATION,
+        half_open_calls: int = BREAKER_HALF_OPEN_CALLS,
+    ):
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_rate = slow_call_rate
+        self.slow_call_duration = slow_call_duration
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self._circuits: dict[str, _Circuit] = {}
+        self.rejected: dict[str, int] = {}
+
+    def _circuit(self, resource: str) -> _Circuit:
+        if resource not in self._circuits:
+            self._circuits[resource] = _Circuit(self.window)
+        return self._circuits[resource]
+
+    def state(self, resource: str) -> str:
+        """Current state of a circuit: "closed", "open" or "half_open"."""
+        circuit = self._circuits.get(resource)
+        return circuit.state if circuit else "closed"
+
+    def rejection(self, resource: str) -> CircuitOpenError | None:
+        """The error a request for resource would fail with right now, or None.
+
+        Unlike sending a request, this does not take one of the half-open trial calls, so it
+        can be used to fail fast before doing any work.
+        """
+        circuit = self._circuits.get(resource)
+        if circuit is None or circuit.state == "closed":
+            return None
+        if circuit.state == "open":
+            remaining = circuit.opened_at + self.open_duration - time.monotonic()
+            return CircuitOpenError(resource, remaining) if remaining > 0 else None
+        if circuit.trials >= self.half_open_calls:
+            return CircuitOpenError(resource, 0)
+        return None
+
+    def _open(self, resource: str, circuit: _Circuit, reason: str) -> None:
+        circuit.state = "open"
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+        logger.warning(
+            f"Circuit breaker for {resource} opened ({reason}), "
+            f"failing fast for {self.open_duration:.0f} seconds"
+        )
+
+    def _record(self, resource: str, circuit: _Circuit, failed: bool, slow: bool):
+        if circuit.state == "half_open":
+            circuit.trials -= 1
+            if failed or slow:
+                self._open(resource, circuit, "trial call failed")
+                return
+            circuit.trial_successes += 1
+            if circuit.trial_successes >= self.half_open_calls:
+                circuit.state = "closed"
+                logger.info(f"Circuit breaker for {resource} closed")
+            return
+        if circuit.state != "closed":
+            return
+
+        circuit.outcomes.append((failed, slow))
+        calls = len(circuit.outcomes)
+        if calls < self.min_calls:
+            return
+        failures = sum(1 for f, _ in circuit.outcomes if f)
+        slow_calls = sum(1 for _, s in circuit.outcomes if s)
+        if failures / calls >= self.failure_rate:
+            self._open(resource, circuit, f"{failures}/{calls} calls failed")
+        elif slow_calls / calls >= self.slow_call_rate:
+            self._open(resource, circuit, f"{slow_calls}/{calls} calls were slow")
+
+    async def __call__(self, request: Tmf620Request, call_next) -> Tmf620Response:
+        resource = request.resource
+        circuit = self._circuit(resource)
+        error = self.rejection(resource)
+        if error is not None:
+            self.rejected[resource] = self.rejected.get(resource, 0) + 1
+            raise error
+        if circuit.state == "open":
+            circuit.state = "half_open"
+            circuit.trials = 0
+            circuit.trial_successes = 0
+            logger.info(
+                f"Circuit breaker for {resource} half-open, sending trial calls"
+            )
+        if circuit.state == "half_open":
+            circuit.trials += 1
+
+        request.extensions.pop("elapsed", None)
+        started = time.monotonic()
+        try:
+            response = await call_next(request)
+        except Tmf620Error as e:
+            failed = isinstance(e.__cause__, httpx.TransportError) or e.status >= 500
+            slow = self._elapsed(request, started) >= self.slow_call_duration
+            self._record(resource, circuit, failed, slow)
+            raise
+        except BaseException:
+            # Cancelled: neither a success nor a failure, but release the trial slot
+            if circuit.state == "half_open":
+                circuit.trials -= 1
+            raise
+        slow = self._elapsed(request, started) >= self.slow_call_duration
+        self._record(resource, circuit, False, slow)
+        return response
+
+    @staticmethod
+    def _elapsed(request: Tmf620Request, started: float) -> float:
+        # Prefer the network time recorded by the client, so that time spent waiting in
+        # the rate limiter or other inner stages does not count as a slow call
+        return request.extensions.get("elapsed", time.monotonic() - started)
+
+    def metrics(self) -> list[tuple]:
+        """Metric families in the format expected by render_metrics."""
+        resources = list(dict.fromkeys([*RESOURCE_TYPES, *self._circuits]))
+        return [
+            (
+                "tmf620_circuit_state",
+                "gauge",
+                "Circuit breaker state per resource (0 closed, 1 open, 2 half-open)",
+                [({"resource": r}, CIRCUIT_STATES[self.state(r)]) for r in resources],
+            ),
+            (
+                "tmf620_circuit_rejected_total",
+                "counter",
+                "Requests failed fast because the circuit breaker was open",
+                [({"resource": r}, n) for r, n in self.rejected.items()],
+            ),
+        ]
+
+
+# ---------------------------------------------------------------------------------------------
+# Rate limiting
+# Token buckets cap the request rate sent to the Product Catalog API, per HTTP method, per
+# resource path or per method and resource. Requests wait for a token instead of being
+# rejected, so bulk loads and cleanups run at the configured rate and no faster.
+
+# Requests per second, optionally followed by /burst. Keys are a method ("POST"), a resource
+# path ("productOffering") or both ("POST:productOffering"); every matching bucket applies.
+RATE_LIMITS = os.environ.get("TMF620_RATE_LIMITS", "POST=20,PATCH=20,DELETE=20")
+
+
+class TokenBucket:
+    """Async token bucket.
+
+    Args:
+        rate: Tokens added per second
+        burst: Maximum number of tokens (default: rate, at least 1)
+    """
+
+    def __init__(self, rate: float, burst: float = None):
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a token.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= 1
+        return waited
+
+
+def parse_rate_limits(value: str) -> dict[str, TokenBucket]:
+    """Parse rate limits such as "POST=20,DELETE=10/20,GET:productOffering=50"."""
+    buckets = {}
+    for key, setting in parse_resource_settings(value, str).items():
+        rate, _, burst = setting.partition("/")
+        buckets[key] = TokenBucket(float(rate), float(burst) if burst else None)
+    return buckets
+
+
+class RateLimiter:
+    """Middleware that paces requests with token buckets.
+
+    Args:
+        limits: Mapping of bucket key (method, resource path or "METHOD:resource") to
+            TokenBucket, or a string in the TMF620_RATE_LIMITS format
+    """
+
+    def __init__(self, limits: dict[str, TokenBucket] | str = RATE_LIMITS):
+        if isinstance(limits, str):
+            limits = parse_rate_limits(limits)
+        self.buckets = dict(limits)
+        self.delayed: dict[str, int] = {}
+        self.wait_seconds: dict[str, float] = {}
+
+    async def __call__(self, request: Tmf620Request, call_next) -> Tmf620Response:
+        for key in (
+            request.method,
+            request.resource,
+            f"{request.method}:{request.resource}",
+        ):
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                continue
+            waited = await bucket.acquire()
+            if waited:
+                self.delayed[key] = self.delayed.get(key, 0) + 1
+                self.wait_seconds[key] = self.wait_seconds.get(key, 0.0) + waited
+        return await call_next(request)
+
+    def metrics(self) -> list[tuple]:
+        """Metric families in the format expected by render_metrics."""
+        return [
+            (
+                "tmf620_rate_limit_delayed_total",
+                "counter",
+                "Requests that waited for a rate limit token, by bucket",
+                [({"bucket": k}, n) for k, n in self.delayed.items()],
+            ),
+            (
+                "tmf620_rate_limit_wait_seconds_total",
+                "counter",
+                "Time spent waiting for rate limit tokens, by bucket",
+                [({"bucket": k}, round(n, 3)) for k, n in self.wait_seconds.items()],
+            ),
+        ]
+
+
+# ---------------------------------------------------------------------------------------------
+# Adaptive concurrency
+# The number of requests in flight to the Product Catalog API is limited, and the limit adapts
+# to the API's health (AIMD): it grows by one per round of successful, fast responses and is
+# cut multiplicatively on 429/5xx responses, timeouts, or when latency rises well above the
+# lowest latency recently observed for the same kind of request. A healthy API is driven to
+# full throughput while a struggling one gets fewer concurrent requests.
+
+CONCURRENCY_INITIAL = int(os.environ.get("TMF620_CONCURRENCY_INITIAL", 20))
+CONCURRENCY_MIN = int(os.environ.get("TMF620_CONCURRENCY_MIN", 2))
+CONCURRENCY_MAX = int(
+    os.environ.get("TMF620_CONCURRENCY_MAX", HTTP_LIMITS.max_connections or 100)
+)
+# Average latency, as a multiple of the baseline latency, that signals congestion
+CONCURRENCY_LATENCY_TOLERANCE = float(
+    os.environ.get("TMF620_CONCURRENCY_LATENCY_TOLERANCE", 2.0)
+)
+CONCURRENCY_BACKOFF = float(os.environ.get("TMF620_CONCURRENCY_BACKOFF", 0.9))
+
+
+class AdaptiveConcurrencyLimiter:
+    """Middleware that limits in-flight requests with an AIMD-adjusted limit.
+
+    Args:
+        initial_limit: Starting limit
+        min_limit: Lowest limit
+        max_limit: Highest limit
+        latency_tolerance: Average latency, as a multiple of the baseline, above which the
+            API is considered congested
+        backoff: Factor applied to the limit on congestion
+        baseline_samples: Number of responses after which the baseline latencies are
+            re-measured, so that they follow lasting changes
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = CONCURRENCY_INITIAL,
+        min_limit: int = CONCURRENCY_MIN,
+        max_limit: int = CONCURRENCY_MAX,
+        latency_tolerance: float = CONCURRENCY_LATENCY_TOLERANCE,
+        backoff: float = CONCURRENCY_BACKOFF,
+        baseline_samples: int = 500,
+    ):
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.baseline_samples = baseline_samples
+        self.inflight = 0
+        self.queued = 0
+        self.decreases = 0
+        # Lowest latency per kind of request (method, resource, single or list), and a
+        # moving average of latency relative to it
+        self._baselines: dict[tuple, float] = {}
+        self._latency_ratio = 1.0
+        self._samples = 0
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    async def __call__(self, request: Tmf620Request, call_next) -> Tmf620Response:
+        async with self._condition:
+            if self.inflight >= int(self.limit):
+                self.queued += 1
+                await self._condition.wait_for(lambda: self.inflight < int(self.limit))
+            self.inflight += 1
+
+        started = time.monotonic()
+        congested = False
+        try:
+            return await call_next(request)
+        except Tmf620Error as e:
+            congested = (
+                isinstance(e.__cause__, httpx.TransportError)
+                or e.status == 429
+                or e.status >= 500
+            )
+            raise
+        finally:
+            latency = time.monotonic() - started
+            async with self._condition:
+                self.inflight -= 1
+                kind = (request.method, request.resource, request.resource_id is None)
+                self._update(kind, latency, congested)
+                self._condition.notify_all()
+
+    def _update(self, kind: tuple, latency: float, congested: bool) -> None:
+        self._samples += 1
+        if self._samples >= self.baseline_samples:
+            self._baselines.clear()
+            self._samples = 0
+        baseline = min(self._baselines.get(kind, latency), latency)
+        self._baselines[kind] = baseline
+        ratio = latency / baseline if baseline > 0 else 1.0
+        self._latency_ratio = 0.9 * self._latency_ratio + 0.1 * ratio
+        if self._latency_ratio > self.latency_tolerance:
+            congested = True
+
+        now = time.monotonic()
+        if congested:
+            # Decrease at most once per baseline latency, so that one burst of slow
+            # responses does not collapse the limit
+            if now - self._last_decrease >= baseline:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+                self.decreases += 1
+        elif self.inflight + 1 >= int(self.limit) / 2:
+            # Grow only while the limit is actually used: about +1 per round of requests
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def metrics(self) -> list[tuple]:
+        """Metric families in the format expected by render_metrics."""
+        return [
+            (
+                "tmf620_concurrency_limit",
+                "gauge",
+                "Current adaptive limit on requests in flight to the API",
+                [({}, int(self.limit))],
+            ),
+            (
+                "tmf620_concurrency_inflight",
+                "gauge",
+                "Requests currently in flight to the API",
+                [({}, self.inflight)],
+            ),
+            (
+                "tmf620_concurrency_queued_total",
+                "counter",
+                "Requests that waited for the concurrency limit",
+                [({}, self.queued)],
+            ),
+            (
+                "tmf620_concurrency_decreases_total",
+                "counter",
+                "Times the concurrency limit was reduced after congestion",
+                [({}, self.decreases)],
+            ),
+        ]
+
+
+# Middleware shared by the module-level API functions below
+response_cache = ResponseCache()
+single_flight = SingleFlight()
+retry_policy = RetryPolicy()
+circuit_breaker = CircuitBreaker()
+rate_limiter = RateLimiter()
+concurrency_limiter = AdaptiveConcurrencyLimiter()
+
+# Client used by the module-level API functions below. Stages run in this order.
+tmf620_client = Tmf620Client(
+    middleware=[
+        response_cache,
+        single_flight,
+        retry_policy,
+        circuit_breaker,
+        rate_limiter,
+        concurrency_limiter,
+    ]
+)
+
+
+def render_metrics(client: Tmf620Client = None, sources: list = None) -> str:
+    """Render the metrics of the client's middleware stages in Prometheus text format.
+
+    A stage contributes metrics by providing a ``metrics()`` method that returns a list of
+    ``(name, type, help, samples)`` tuples, where samples is a list of ``(labels, value)``.
+
+    Args:
+        client: Client to report on (default: the module client)
+        sources: Further objects with a ``metrics()`` method, such as a catalog graph
+
+    Returns:
+        The metrics in Prometheus exposition format
+    """
+    client = client or tmf620_client
+    lines = []
+    for stage in [*client.middleware, *(sources or [])]:
+        if not hasattr(stage, "metrics"):
+            continue
+        for name, kind, help_text, samples in stage.metrics():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(
+                    f"{name}{{{label_text}}} {value}"
+                    if label_text
+                    else f"{name} {value}"
+                )
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------------------------
+# Event subscriptions
+# The MCP server registers a listener with the TMF620 event hub. Create, change and delete
+# events keep the response cache current, so it can use a long TTL while subscribed.
+# The callback URL registered with the hub carries a secret; events without it are rejected,
+# as their payloads are cached and served as catalog data.
+
+# Cache TTL in seconds used while the event subscription is active
+EVENT_CACHE_TTL = float(os.environ.get("TMF620_EVENT_CACHE_TTL", 600.0))
+# Secret the hub must send back with every event; random per process unless configured
+EVENT_LISTENER_SECRET = os.environ.get(
+    "TMF620_EVENT_LISTENER_SECRET"
+) or secrets.token_urlsafe(32)
+# Query parameter of the callback URL that carries the secret
+EVENT_SECRET_PARAM = "secret"
+
+# Event type suffixes (TMF notification names and TMF event names) and the change they signal
+EVENT_KINDS = (
+    ("CreationNotification", "create"),
+    ("CreateEvent", "create"),
+    ("RemoveNotification", "delete"),
+    ("DeleteEvent", "delete"),
+    ("AttributeValueChangeNotification", "change"),
+    ("AttributeValueChangeEvent", "change"),
+    ("StateChangeNotification", "change"),
+    ("StateChangeEvent", "change"),
+)
+
+_event_listener_id: str | None = None
+_ttl_before_subscription: float | None = None
+
+
+async def register_event_listener(callback: str, query: str = None) -> str:
+    """Register a listener with the TMF620 event hub and extend the cache TTL.
+
+    The secret checked by event_authorized is added to the callback URL.
+
+    Args:
+        callback: URL the hub posts event messages to
+        query: Optional hub query restricting the events delivered
+
+    Returns:
+        ID of the hub subscription
+
+    Raises:
+        Tmf620Error: If the hub rejected the registration
+    """
+    global _event_listener_id, _ttl_before_subscription
+    signed = httpx.URL(callback).copy_merge_params(
+        {EVENT_SECRET_PARAM: EVENT_LISTENER_SECRET}
+    )
+    subscription = {"callback": str(signed)}
+    if query:
+        subscription["query"] = query
+    listener = await tmf620_client.create("hub", subscription)
+    _event_listener_id = listener.get("id")
+    logger.info(f"Registered event listener {_event_listener_id} for {callback}")
+
+    if _ttl_before_subscription is None:
+        _ttl_before_subscription = response_cache.ttl
+        response_cache.ttl = max(response_cache.ttl, EVENT_CACHE_TTL)
+    return _event_listener_id
+
+
+async def unregister_event_listener() -> None:
+    """Remove the hub subscription made by register_event_listener and restore the cache TTL."""
+    global _event_listener_id, _ttl_before_subscription
+    if _ttl_before_subscription is not None:
+        response_cache.ttl = _ttl_before_subscription
+        _ttl_before_subscription = None
+    if _event_listener_id is None:
+        return
+    try:
+        await tmf620_client.delete("hub", _event_listener_id)
+        logger.info(f"Unregistered event listener {_event_listener_id}")
+    except Tmf620Error as e:
+        logger.warning(
+            f"Failed to unregister event listener {_event_listener_id}: {e.detail}"
+        )
+    _event_listener_id = None
+
+
+def event_authorized(secret: str | None) -> bool:
+    """Check the secret sent with an event against the one registered with the hub."""
+    return secret is not None and hmac.compare_digest(
+        secret.encode(), EVENT_LISTENER_SECRET.encode()
+    )
+
+
+def parse_event(message: dict[str, Any]) -> tuple[str, str, dict] | None:
+    """Extract the kind, resource path and resource from a TMF620 event message.
+
+    Args:
+        message: Event message as posted by the hub (eventType and event)
+
+    Returns:
+        ("create" | "change" | "delete", resource path, resource), or None if the event is
+        not supported
+    """
+    event_type = message.get("eventType") or ""
+    kind = next((k for suffix, k in EVENT_KINDS if event_type.endswith(suffix)), None)
+    payload = message.get("event") or {}
+    resource = next((r for r in RESOURCE_TYPES if r in payload), None)
+    if kind is None or resource is None or not isinstance(payload[resource], dict):
+        logger.warning(f"Ignoring unsupported event {event_type}")
+        return None
+
+    # Top-level attributes starting with "_" are internal to the Product Catalog API
+    document = {k: v for k, v in payload[resource].items() if not k.startswith("_")}
+    logger.info(f"Received {event_type} for {resource} {document.get('id')}")
+    return kind, resource, document
+
+
+def apply_event(message: dict[str, Any], cache: ResponseCache = None) -> bool:
+    """Update the response cache from a TMF620 event message.
+
+    Creation events invalidate the cached lists of the resource type. Change events replace
+    the cached resource with the one carried by the event, and delete events drop it.
+
+    Args:
+        message: Event message as posted by the hub (eventType and event)
+        cache: Cache to update (default: the module cache)
+
+    Returns:
+        True if the event was recognised and applied
+    """
+    cache = cache or response_cache
+    event = parse_event(message)
+    if event is None:
+        return False
+    kind, resource, document = event
+    resource_id = document.get("id")
+    if kind == "change" and resource_id and "lastUpdate" in document:
+        cache.refresh(resource, resource_id, document)
+    else:
+        cache.invalidate(resource, resource_id)
+    return True
+
 
 async def get_catalog(
     catalog_id: str = None,
@@ -51,97 +1880,25 @@ async def get_catalog(
         filter: Optional dictionary of filter criteria to narrow down the results (e.g., {"name": "Wholesale"})
 
     Returns:
-        Dict containing the response data or None if an error occurred
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        Dict containing the response data or None if an error occurred.
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is mapped to None.
     """
-    logger.info(
-        "+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++"
-    )  # Construct the URL based on whether we're getting a specific catalog or listing catalogs
-    base_url = f"{API_URL}/catalog"
-
     if catalog_id:
-        url = f"{base_url}/{catalog_id}"
         logger.info(f"Getting catalog with ID: {catalog_id}")
     else:
-        url = base_url
         logger.info("Listing catalogs")
 
-    # Add query parameters if provided
-    params = {}
-    if fields:
-        params["fields"] = fields
-    if offset is not None:
-        params["offset"] = offset
-    if limit is not None:
-        params["limit"] = limit
-
-    # Apply filters if provided
-    if filter:
-        for key, value in filter.items():
-            # Format as per TMF API filtering convention
-            params[key] = value
-        logger.info(f"Applied filters: {filter}")
-
-    if params:
-        logger.info(f"With parameters: {params}")
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending GET request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.get(url, headers=headers, params=params)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 200:
-                    try:
-                        response_json = response.json()
-                        logger.info("Response received successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return None
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return None
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return None
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return None
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        return await tmf620_client.get(
+            "catalog",
+            catalog_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    except Tmf620Error:
         return None
 
 
@@ -153,93 +1910,16 @@ async def create_catalog(catalog_data: dict[str, Any]) -> dict[str, Any]:
 
     Returns:
         Dict containing the created catalog data,
-        or a dict with error details containing 'error.status' (HTTP status code) and 'error.detail' (error message)
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        or a dict with error details containing 'error.status' (HTTP status code) and 'error.detail' (error message).
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is returned as this error dict.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info("Creating a new catalog")
 
-    url = f"{API_URL}/catalog"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending POST request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {catalog_data}")
-
-                response = await client.post(url, headers=headers, json=catalog_data)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 201:
-                    try:
-                        response_json = response.json()
-                        logger.info("Catalog created successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return {
-                            "error": {
-                                "status": 500,
-                                "detail": f"Failed to decode JSON response: {str(e)}",
-                            }
-                        }
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return {
-                        "error": {
-                            "status": response.status_code,
-                            "detail": f"Unexpected status code: {response.status_code}",
-                        }
-                    }
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return {
-                    "error": {
-                        "status": 408,
-                        "detail": f"Request timed out after {timeout.read} seconds",
-                    }
-                }
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return {
-                    "error": {
-                        "status": e.response.status_code,
-                        "detail": e.response.text,
-                    }
-                }
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return {"error": {"status": 500, "detail": str(e)}}
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return {"error": {"status": 500, "detail": f"Unexpected error: {str(e)}"}}
+        return await tmf620_client.create("catalog", catalog_data)
+    except Tmf620Error as e:
+        return e.to_dict()
 
 
 async def update_catalog(
@@ -252,72 +1932,15 @@ async def update_catalog(
         catalog_data: Dictionary containing the catalog data to update according to the TMF620 specification
 
     Returns:
-        Dict containing the updated catalog data or None if an error occurred
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        Dict containing the updated catalog data or None if an error occurred.
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is mapped to None.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info(f"Updating catalog with ID: {catalog_id}")
 
-    url = f"{API_URL}/catalog/{catalog_id}"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending PATCH request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {catalog_data}")
-
-                response = await client.patch(url, headers=headers, json=catalog_data)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code in (200, 201, 202, 204):
-                    try:
-                        response_json = response.json()
-                        logger.info("Catalog updated successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return None
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return None
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return None
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return None
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        return await tmf620_client.update("catalog", catalog_id, catalog_data)
+    except Tmf620Error:
         return None
 
 
@@ -328,66 +1951,17 @@ async def delete_catalog(catalog_id: str) -> bool:
         catalog_id: ID of the catalog to delete
 
     Returns:
-        True if deletion was successful, False otherwise
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        True if deletion was successful, False otherwise.
+        Errors are not raised: a Tmf620Error from the client (error status, including
+        404, timeout, transport error or open circuit breaker) is mapped to False.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info(f"Deleting catalog with ID: {catalog_id}")
 
-    url = f"{API_URL}/catalog/{catalog_id}"
-
-    headers = {
-        "Accept": "application/json;charset=utf-8"
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending DELETE request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.delete(url, headers=headers)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 204:
-                    logger.info("Catalog deleted successfully")
-                    return True
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return False
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return False
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return False
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return False
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        await tmf620_client.delete("catalog", catalog_id)
+    except Tmf620Error:
         return False
+    return True
 
 
 async def get_category(
@@ -407,97 +1981,25 @@ async def get_category(
         filter: Optional dictionary of filter criteria to narrow down the results (e.g., {"name": "Wholesale"})
 
     Returns:
-        Dict containing the response data or None if an error occurred
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        Dict containing the response data or None if an error occurred.
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is mapped to None.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
-
-    # Construct the URL based on whether we're getting a specific category or listing categories
-    base_url = f"{API_URL}/category"
-
     if category_id:
-        url = f"{base_url}/{category_id}"
         logger.info(f"Getting category with ID: {category_id}")
     else:
-        url = base_url
         logger.info("Listing categories")
 
-    # Add query parameters if provided
-    params = {}
-    if fields:
-        params["fields"] = fields
-    if offset is not None:
-        params["offset"] = offset
-    if limit is not None:
-        params["limit"] = limit
-
-    # Apply filters if provided
-    if filter:
-        for key, value in filter.items():
-            # Format as per TMF API filtering convention
-            params[key] = value
-        logger.info(f"Applied filters: {filter}")
-
-    if params:
-        logger.info(f"With parameters: {params}")
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending GET request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.get(url, headers=headers, params=params)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 200:
-                    try:
-                        response_json = response.json()
-                        logger.info("Response received successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return None
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return None
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return None
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return None
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        return await tmf620_client.get(
+            "category",
+            category_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    except Tmf620Error:
         return None
 
 
@@ -516,87 +2018,10 @@ async def create_category(category_data: dict[str, Any]) -> dict[str, Any]:
     """
     logger.info("Creating a new category")
 
-    url = f"{API_URL}/category"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }
-
-    # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending POST request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {category_data}")
-
-                response = await client.post(url, headers=headers, json=category_data)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 201:
-                    try:
-                        response_json = response.json()
-                        logger.info("Category created successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return {
-                            "error": {
-                                "status": 500,
-                                "detail": f"Failed to decode JSON response: {str(e)}",
-                            }
-                        }
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return {
-                        "error": {
-                            "status": response.status_code,
-                            "detail": f"Unexpected status code: {response.status_code}",
-                        }
-                    }
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return {
-                    "error": {
-                        "status": 408,
-                        "detail": f"Request timed out after {timeout.read} seconds",
-                    }
-                }
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return {
-                    "error": {
-                        "status": e.response.status_code,
-                        "detail": e.response.text,
-                    }
-                }
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return {"error": {"status": 500, "detail": str(e)}}
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return {"error": {"status": 500, "detail": f"Unexpected error: {str(e)}"}}
+        return await tmf620_client.create("category", category_data)
+    except Tmf620Error as e:
+        return e.to_dict()
 
 
 async def update_category(
@@ -614,77 +2039,10 @@ async def update_category(
     """
     logger.info(f"Updating category with ID: {category_id}")
 
-    url = f"{API_URL}/category/{category_id}"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }
-
-    # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending PATCH request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {category_data}")
-
-                response = await client.patch(url, headers=headers, json=category_data)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                try:
-                    response_json = response.json()
-                    logger.info("Category updated successfully")
-                    return response_json
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to decode JSON response: {e}")
-                    return {
-                        "error": {
-                            "status": 500,
-                            "detail": f"Failed to decode JSON response: {str(e)}",
-                        }
-                    }
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return {
-                    "error": {
-                        "status": 408,
-                        "detail": f"Request timed out after {timeout.read} seconds",
-                    }
-                }
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return {
-                    "error": {
-                        "status": e.response.status_code,
-                        "detail": e.response.text,
-                    }
-                }
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return {"error": {"status": 500, "detail": str(e)}}
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return {"error": {"status": 500, "detail": f"Unexpected error: {str(e)}"}}
+        return await tmf620_client.update("category", category_id, category_data)
+    except Tmf620Error as e:
+        return e.to_dict()
 
 
 async def delete_category(category_id: str) -> dict[str, Any]:
@@ -699,90 +2057,12 @@ async def delete_category(category_id: str) -> dict[str, Any]:
     """
     logger.info(f"Deleting category with ID: {category_id}")
 
-    url = f"{API_URL}/category/{category_id}"
-
-    headers = {
-        "Accept": "application/json;charset=utf-8",
-    }
-
-    # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending DELETE request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.delete(url, headers=headers)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                # For DELETE operations, a 204 No Content response is common
-                if response.status_code == 204:
-                    logger.info("Category deleted successfully")
-                    return {
-                        "status": "success",
-                        "detail": "Category deleted successfully",
-                    }
-
-                try:
-                    response_json = response.json()
-                    logger.info("Category deleted successfully")
-                    return response_json
-                except json.JSONDecodeError as e:
-                    # If we get here with a successful status code but no JSON, it's still a success
-                    if response.status_code in (200, 202, 204):
-                        return {
-                            "status": "success",
-                            "detail": "Category deleted successfully",
-                        }
-
-                    logger.error(f"Failed to decode JSON response: {e}")
-                    return {
-                        "error": {
-                            "status": 500,
-                            "detail": f"Failed to decode JSON response: {str(e)}",
-                        }
-                    }
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return {
-                    "error": {
-                        "status": 408,
-                        "detail": f"Request timed out after {timeout.read} seconds",
-                    }
-                }
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return {
-                    "error": {
-                        "status": e.response.status_code,
-                        "detail": e.response.text,
-                    }
-                }
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return {"error": {"status": 500, "detail": str(e)}}
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return {"error": {"status": 500, "detail": f"Unexpected error: {str(e)}"}}
+        await tmf620_client.delete("category", category_id)
+    except Tmf620Error as e:
+        return e.to_dict()
+    logger.info("Category deleted successfully")
+    return {"status": "success", "detail": "Category deleted successfully"}
 
 
 async def create_product_specification(
@@ -795,95 +2075,18 @@ async def create_product_specification(
 
     Returns:
         Dict containing the created productSpecification data,
-        or a dict with error details containing 'error.status' (HTTP status code) and 'error.detail' (error message)
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        or a dict with error details containing 'error.status' (HTTP status code) and 'error.detail' (error message).
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is returned as this error dict.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info("Creating a new productSpecification")
 
-    url = f"{API_URL}/productSpecification"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending POST request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {product_specification_data}")
-
-                response = await client.post(
-                    url, headers=headers, json=product_specification_data
-                )
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 201:
-                    try:
-                        response_json = response.json()
-                        logger.info("ProductSpecification created successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return {
-                            "error": {
-                                "status": 500,
-                                "detail": f"Failed to decode JSON response: {str(e)}",
-                            }
-                        }
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return {
-                        "error": {
-                            "status": response.status_code,
-                            "detail": f"Unexpected status code: {response.status_code}",
-                        }
-                    }
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return {
-                    "error": {
-                        "status": 408,
-                        "detail": f"Request timed out after {timeout.read} seconds",
-                    }
-                }
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return {
-                    "error": {
-                        "status": e.response.status_code,
-                        "detail": e.response.text,
-                    }
-                }
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return {"error": {"status": 500, "detail": str(e)}}
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return {"error": {"status": 500, "detail": f"Unexpected error: {str(e)}"}}
+        return await tmf620_client.create(
+            "productSpecification", product_specification_data
+        )
+    except Tmf620Error as e:
+        return e.to_dict()
 
 
 async def update_product_specification(
@@ -896,74 +2099,17 @@ async def update_product_specification(
         product_specification_data: Dictionary containing the productSpecification data to update according to the TMF620 specification
 
     Returns:
-        Dict containing the updated productSpecification data or None if an error occurred
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        Dict containing the updated productSpecification data or None if an error occurred.
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is mapped to None.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info(f"Updating productSpecification with ID: {product_specification_id}")
 
-    url = f"{API_URL}/productSpecification/{product_specification_id}"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending PATCH request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {product_specification_data}")
-
-                response = await client.patch(
-                    url, headers=headers, json=product_specification_data
-                )
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code in (200, 201, 202, 204):
-                    try:
-                        response_json = response.json()
-                        logger.info("ProductSpecification updated successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return None
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return None
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return None
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return None
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        return await tmf620_client.update(
+            "productSpecification", product_specification_id, product_specification_data
+        )
+    except Tmf620Error:
         return None
 
 
@@ -974,66 +2120,17 @@ async def delete_product_specification(product_specification_id: str) -> bool:
         product_specification_id: ID of the productSpecification to delete
 
     Returns:
-        True if deletion was successful, False otherwise
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        True if deletion was successful, False otherwise.
+        Errors are not raised: a Tmf620Error from the client (error status, including
+        404, timeout, transport error or open circuit breaker) is mapped to False.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info(f"Deleting productSpecification with ID: {product_specification_id}")
 
-    url = f"{API_URL}/productSpecification/{product_specification_id}"
-
-    headers = {
-        "Accept": "application/json;charset=utf-8"
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending DELETE request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.delete(url, headers=headers)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 204:
-                    logger.info("ProductSpecification deleted successfully")
-                    return True
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return False
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return False
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return False
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return False
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        await tmf620_client.delete("productSpecification", product_specification_id)
+    except Tmf620Error:
         return False
+    return True
 
 
 async def get_product_specification(
@@ -1054,104 +2151,27 @@ async def get_product_specification(
 
     Returns:
         Dict containing the product specification data,
-        or a dict with error details containing 'error.status' (HTTP status code) and 'error.detail' (error message)
+        or a dict with error details containing 'error.status' (HTTP status code) and 'error.detail' (error message).
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is returned as this error dict. Unlike
+        the other get_* functions, which return None, it reports why the request failed.
     """
-    logger.info(f"Getting product specification with ID: {product_specification_id}")
-
-    # Construct the URL based on whether we're getting a specific productSpecification or listing productSpecifications
-    base_url = f"{API_URL}/productSpecification"
-
     if product_specification_id:
-        url = f"{base_url}/{product_specification_id}"
         logger.info(f"Getting productSpecification with ID: {product_specification_id}")
     else:
-        url = base_url
         logger.info("Listing product specifications")
 
-    # Add query parameters if provided
-    params = {}
-    if fields:
-        params["fields"] = fields
-    if offset is not None:
-        params["offset"] = offset
-    if limit is not None:
-        params["limit"] = limit
-
-    # Apply filters if provided
-    if filter:
-        for key, value in filter.items():
-            # Format as per TMF API filtering convention
-            params[key] = value
-        logger.info(f"Applied filters: {filter}")
-
-    if params:
-        logger.info(f"With parameters: {params}")
-
-    headers = {
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending GET request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.get(url, headers=headers, params=params)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                try:
-                    response_json = response.json()
-                    logger.info("Product specification retrieved successfully")
-                    return response_json
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to decode JSON response: {e}")
-                    return {
-                        "error": {
-                            "status": 500,
-                            "detail": f"Failed to decode JSON response: {str(e)}",
-                        }
-                    }
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return {
-                    "error": {
-                        "status": 408,
-                        "detail": f"Request timed out after {timeout.read} seconds",
-                    }
-                }
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return {
-                    "error": {
-                        "status": e.response.status_code,
-                        "detail": e.response.text,
-                    }
-                }
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return {"error": {"status": 500, "detail": str(e)}}
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return {"error": {"status": 500, "detail": f"Unexpected error: {str(e)}"}}
+        return await tmf620_client.get(
+            "productSpecification",
+            product_specification_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    except Tmf620Error as e:
+        return e.to_dict()
 
 
 async def get_product_offering(
@@ -1171,97 +2191,25 @@ async def get_product_offering(
         filter: Optional dictionary of filter criteria to narrow down the results (e.g., {"name": "Basic Internet"})
 
     Returns:
-        Dict containing the response data or None if an error occurred
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        Dict containing the response data or None if an error occurred.
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is mapped to None.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
-
-    # Construct the URL based on whether we're getting a specific productOffering or listing productOfferings
-    base_url = f"{API_URL}/productOffering"
-
     if product_offering_id:
-        url = f"{base_url}/{product_offering_id}"
         logger.info(f"Getting productOffering with ID: {product_offering_id}")
     else:
-        url = base_url
-        logger.info("Listing productOfferings")
-
-    # Add query parameters if provided
-    params = {}
-    if fields:
-        params["fields"] = fields
-    if offset is not None:
-        params["offset"] = offset
-    if limit is not None:
-        params["limit"] = limit
-
-    # Apply filters if provided
-    if filter:
-        for key, value in filter.items():
-            # Format as per TMF API filtering convention
-            params[key] = value
-        logger.info(f"Applied filters: {filter}")
-
-    if params:
-        logger.info(f"With parameters: {params}")
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
+        logger.info("Listing product offerings")
 
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending GET request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.get(url, headers=headers, params=params)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 200:
-                    try:
-                        response_json = response.json()
-                        logger.info("Response received successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return None
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return None
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return None
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return None
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        return await tmf620_client.get(
+            "productOffering",
+            product_offering_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    except Tmf620Error:
         return None
 
 
@@ -1275,95 +2223,16 @@ async def create_product_offering(
 
     Returns:
         Dict containing the created productOffering data,
-        or a dict with error details containing 'error.status' (HTTP status code) and 'error.detail' (error message)
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        or a dict with error details containing 'error.status' (HTTP status code) and 'error.detail' (error message).
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is returned as this error dict.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info("Creating a new productOffering")
 
-    url = f"{API_URL}/productOffering"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending POST request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {product_offering_data}")
-
-                response = await client.post(
-                    url, headers=headers, json=product_offering_data
-                )
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 201:
-                    try:
-                        response_json = response.json()
-                        logger.info("ProductOffering created successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return {
-                            "error": {
-                                "status": 500,
-                                "detail": f"Failed to decode JSON response: {str(e)}",
-                            }
-                        }
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return {
-                        "error": {
-                            "status": response.status_code,
-                            "detail": f"Unexpected status code: {response.status_code}",
-                        }
-                    }
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return {
-                    "error": {
-                        "status": 408,
-                        "detail": f"Request timed out after {timeout.read} seconds",
-                    }
-                }
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return {
-                    "error": {
-                        "status": e.response.status_code,
-                        "detail": e.response.text,
-                    }
-                }
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return {"error": {"status": 500, "detail": str(e)}}
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return {"error": {"status": 500, "detail": f"Unexpected error: {str(e)}"}}
+        return await tmf620_client.create("productOffering", product_offering_data)
+    except Tmf620Error as e:
+        return e.to_dict()
 
 
 async def update_product_offering(
@@ -1376,74 +2245,17 @@ async def update_product_offering(
         product_offering_data: Dictionary containing the productOffering data to update according to the TMF620 specification
 
     Returns:
-        Dict containing the updated productOffering data or None if an error occurred
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        Dict containing the updated productOffering data or None if an error occurred.
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is mapped to None.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info(f"Updating productOffering with ID: {product_offering_id}")
 
-    url = f"{API_URL}/productOffering/{product_offering_id}"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending PATCH request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {product_offering_data}")
-
-                response = await client.patch(
-                    url, headers=headers, json=product_offering_data
-                )
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code in (200, 201, 202, 204):
-                    try:
-                        response_json = response.json()
-                        logger.info("ProductOffering updated successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return None
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return None
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return None
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return None
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        return await tmf620_client.update(
+            "productOffering", product_offering_id, product_offering_data
+        )
+    except Tmf620Error:
         return None
 
 
@@ -1454,66 +2266,17 @@ async def delete_product_offering(product_offering_id: str) -> bool:
         product_offering_id: ID of the productOffering to delete
 
     Returns:
-        True if deletion was successful, False otherwise
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        True if deletion was successful, False otherwise.
+        Errors are not raised: a Tmf620Error from the client (error status, including
+        404, timeout, transport error or open circuit breaker) is mapped to False.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info(f"Deleting productOffering with ID: {product_offering_id}")
 
-    url = f"{API_URL}/productOffering/{product_offering_id}"
-
-    headers = {
-        "Accept": "application/json;charset=utf-8"
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending DELETE request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.delete(url, headers=headers)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 204:
-                    logger.info("ProductOffering deleted successfully")
-                    return True
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return False
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return False
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return False
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return False
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        await tmf620_client.delete("productOffering", product_offering_id)
+    except Tmf620Error:
         return False
+    return True
 
 
 async def get_product_offering_price(
@@ -1533,99 +2296,27 @@ async def get_product_offering_price(
         filter: Optional dictionary of filter criteria to narrow down the results (e.g., {"name": "Monthly Fee"})
 
     Returns:
-        Dict containing the response data or None if an error occurred
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        Dict containing the response data or None if an error occurred.
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is mapped to None.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
-
-    # Construct the URL based on whether we're getting a specific productOfferingPrice or listing productOfferingPrices
-    base_url = f"{API_URL}/productOfferingPrice"
-
     if product_offering_price_id:
-        url = f"{base_url}/{product_offering_price_id}"
         logger.info(
             f"Getting productOfferingPrice with ID: {product_offering_price_id}"
         )
     else:
-        url = base_url
-        logger.info("Listing productOfferingPrices")
-
-    # Add query parameters if provided
-    params = {}
-    if fields:
-        params["fields"] = fields
-    if offset is not None:
-        params["offset"] = offset
-    if limit is not None:
-        params["limit"] = limit
-
-    # Apply filters if provided
-    if filter:
-        for key, value in filter.items():
-            # Format as per TMF API filtering convention
-            params[key] = value
-        logger.info(f"Applied filters: {filter}")
-
-    if params:
-        logger.info(f"With parameters: {params}")
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
+        logger.info("Listing product offering prices")
 
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending GET request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.get(url, headers=headers, params=params)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 200:
-                    try:
-                        response_json = response.json()
-                        logger.info("Response received successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return None
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return None
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return None
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return None
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
+        return await tmf620_client.get(
+            "productOfferingPrice",
+            product_offering_price_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    except Tmf620Error:
         return None
 
 
@@ -1644,90 +2335,14 @@ async def create_product_offering_price(
     Notes:
         All exceptions are caught and returned as structured error objects with appropriate HTTP status codes
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info("Creating a new productOfferingPrice")
 
-    url = f"{API_URL}/productOfferingPrice"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending POST request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {product_offering_price_data}")
-
-                response = await client.post(
-                    url, headers=headers, json=product_offering_price_data
-                )
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 201:
-                    try:
-                        response_json = response.json()
-                        logger.info("ProductOfferingPrice created successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return {
-                            "error": {
-                                "status": 500,
-                                "detail": f"Failed to decode JSON response: {str(e)}",
-                            }
-                        }
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return {
-                        "error": {
-                            "status": response.status_code,
-                            "detail": f"Unexpected status code: {response.status_code}",
-                        }
-                    }
-
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return {
-                    "error": {
-                        "status": 408,
-                        "detail": f"Request timed out after {timeout.read} seconds",
-                    }
-                }
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return {
-                    "error": {
-                        "status": e.response.status_code,
-                        "detail": e.response.text,
-                    }
-                }
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return {"error": {"status": 500, "detail": str(e)}}
-
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return {"error": {"status": 500, "detail": f"Unexpected error: {str(e)}"}}
+        return await tmf620_client.create(
+            "productOfferingPrice", product_offering_price_data
+        )
+    except Tmf620Error as e:
+        return e.to_dict()
 
 
 async def update_product_offering_price(
@@ -1740,144 +2355,738 @@ async def update_product_offering_price(
         product_offering_price_data: Dictionary containing the productOfferingPrice data to update according to the TMF620 specification
 
     Returns:
-        Dict containing the updated productOfferingPrice data or None if an error occurred
-
-    Raises:
-        Various httpx exceptions are caught and logged
+        Dict containing the updated productOfferingPrice data or None if an error occurred.
+        Errors are not raised: a Tmf620Error from the client (error status, timeout,
+        transport error or open circuit breaker) is mapped to None.
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
     logger.info(f"Updating productOfferingPrice with ID: {product_offering_price_id}")
 
-    url = f"{API_URL}/productOfferingPrice/{product_offering_price_id}"
-
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
+    try:
+        return await tmf620_client.update(
+            "productOfferingPrice",
+            product_offering_price_id,
+            product_offering_price_data,
+        )
+    except Tmf620Error:
+        return None
+
+
+async def delete_product_offering_price(product_offering_price_id: str) -> bool:
+    """Delete a productOfferingPrice from the TM Forum Product Catalog Management API.
+
+    Args:
+        product_offering_price_id: ID of the productOfferingPrice to delete
+
+    Returns:
+        True if deletion was successful, False otherwise.
+        Errors are not raised: a Tmf620Error from the client (error status, including
+        404, timeout, transport error or open circuit breaker) is mapped to False.
+    """
+    logger.info(f"Deleting productOfferingPrice with ID: {product_offering_price_id}")
 
-    # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending PATCH request to: {url}")
-                logger.info(f"Headers: {headers}")
-                logger.info(f"Data: {product_offering_price_data}")
+        await tmf620_client.delete("productOfferingPrice", product_offering_price_id)
+    except Tmf620Error:
+        return False
+    return True
 
-                response = await client.patch(
-                    url, headers=headers, json=product_offering_price_data
-                )
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code in (200, 201, 202, 204):
-                    try:
-                        response_json = response.json()
-                        logger.info("ProductOfferingPrice updated successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return None
+
+# ---------------------------------------------------------------------------------------------
+# Paginated iteration
+# Async generators that stream every item of a collection page by page. Unlike the get_*
+# functions they raise Tmf620Error if a page cannot be retrieved.
+
+
+def iter_catalogs(
+    page_size: int = None, fields: str = None, filter: dict = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Iterate over all catalogs, fetching pages lazily.
+
+    Args:
+        page_size: Optional number of catalogs requested per page
+        fields: Optional comma-separated list of field names to include in the response
+        filter: Optional dictionary of filter criteria (e.g., {"lifecycleStatus": "Active"})
+    """
+    return tmf620_client.iterate("catalog", page_size, fields=fields, filter=filter)
+
+
+def iter_categories(
+    page_size: int = None, fields: str = None, filter: dict = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Iterate over all categories, fetching pages lazily.
+
+    Args:
+        page_size: Optional number of categories requested per page
+        fields: Optional comma-separated list of field names to include in the response
+        filter: Optional dictionary of filter criteria (e.g., {"lifecycleStatus": "Active"})
+    """
+    return tmf620_client.iterate("category", page_size, fields=fields, filter=filter)
+
+
+def iter_product_specifications(
+    page_size: int = None, fields: str = None, filter: dict = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Iterate over all product specifications, fetching pages lazily.
+
+    Args:
+        page_size: Optional number of product specifications requested per page
+        fields: Optional comma-separated list of field names to include in the response
+        filter: Optional dictionary of filter criteria (e.g., {"lifecycleStatus": "Active"})
+    """
+    return tmf620_client.iterate(
+        "productSpecification", page_size, fields=fields, filter=filter
+    )
+
+
+def iter_product_offerings(
+    page_size: int = None, fields: str = None, filter: dict = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Iterate over all product offerings, fetching pages lazily.
+
+    Args:
+        page_size: Optional number of product offerings requested per page
+        fields: Optional comma-separated list of field names to include in the response
+        filter: Optional dictionary of filter criteria (e.g., {"lifecycleStatus": "Active"})
+    """
+    return tmf620_client.iterate(
+        "productOffering", page_size, fields=fields, filter=filter
+    )
+
+
+def iter_product_offering_prices(
+    page_size: int = None, fields: str = None, filter: dict = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Iterate over all product offering prices, fetching pages lazily.
+
+    Args:
+        page_size: Optional number of product offering prices requested per page
+        fields: Optional comma-separated list of field names to include in the response
+        filter: Optional dictionary of filter criteria (e.g., {"priceType": "recurring"})
+    """
+    return tmf620_client.iterate(
+        "productOfferingPrice", page_size, fields=fields, filter=filter
+    )
+
+
+async def get_all(
+    resource: str,
+    page_size: int = None,
+    fan_out: int = None,
+    fields: str = None,
+    filter: dict = None,
+) -> list[dict[str, Any]]:
+    """Read every item of a collection, fetching pages concurrently.
+
+    Intended for full scans such as cleanup, reporting or snapshot builds. Raises
+    Tmf620Error if a page cannot be retrieved.
+
+    Args:
+        resource: TMF620 resource path, one of RESOURCE_TYPES (e.g. "productOffering")
+        page_size: Optional number of items requested per page
+        fan_out: Optional maximum number of concurrent page requests
+        fields: Optional comma-separated list of field names to include in the response
+        filter: Optional dictionary of filter criteria
+    """
+    return await tmf620_client.get_all(
+        resource, page_size, fan_out, fields=fields, filter=filter
+    )
+
+
+async def get_many(
+    resource: str, resource_ids: list[str], fields: str = None
+) -> dict[str, Any]:
+    """Retrieve several resources of one type by ID.
+
+    Duplicate IDs are fetched once, cached resources are served from the cache and the
+    others are fetched concurrently over the shared connection pool.
+
+    Args:
+        resource: TMF620 resource path, one of RESOURCE_TYPES (e.g. "productOffering")
+        resource_ids: IDs of the resources to retrieve
+        fields: Optional comma-separated list of field names to include in the response
+
+    Returns:
+        A dictionary mapping each distinct ID to the resource, or to an error object with
+        status code and detail message (status 404 if the resource does not exist)
+    """
+    return await tmf620_client.get_many(resource, resource_ids, fields=fields)
+
+
+# Reference expansion
+# Reference fields that can be expanded, per resource path, with the resource path of the
+# referenced resources. Expanding a field replaces each reference (id, href, name) with the
+# referenced resource.
+EXPANDABLE_FIELDS = {
+    "catalog": {"category": "category"},
+    "category": {"subCategory": "category", "productOffering": "productOffering"},
+    "productSpecification": {"bundledProductSpecification": "productSpecification"},
+    "productOffering": {
+        "productSpecification": "productSpecification",
+        "productOfferingPrice": "productOfferingPrice",
+        "category": "category",
+        "bundledProductOffering": "productOffering",
+    },
+    "productOfferingPrice": {},
+}
+
+
+class ReferenceLoader:
+    """DataLoader-style batcher for resolving references.
+
+    Every reference requested with load() during one iteration of the event loop is queued;
+    the queue is then sent as one get_many call per resource type, so resolving the references
+    of a whole result set takes one concurrent batch per type instead of one request per
+    reference. Each resource is fetched at most once per loader.
+
+    Args:
+        client: Client used to fetch the resources (default: the shared tmf620_client)
+    """
+
+    def __init__(self, client: Tmf620Client = None):
+        self.client = client or tmf620_client
+        self._futures: dict[tuple[str, str], asyncio.Future] = {}
+        self._queue: dict[str, list[str]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, resource: str, resource_id: str) -> asyncio.Future:
+        """Request a resource; the future resolves to the resource or an error object."""
+        key = (resource, resource_id)
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.setdefault(resource, []).append(resource_id)
+        return future
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, {}
+        for resource, resource_ids in queue.items():
+            task = asyncio.ensure_future(self._fetch(resource, resource_ids))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, resource: str, resource_ids: list[str]) -> None:
+        results = {}
+        try:
+            results = await self.client.get_many(resource, resource_ids)
+        except Exception as e:
+            error = Tmf620Error(500, f"Failed to resolve {resource} references: {e}")
+            results = dict.fromkeys(resource_ids, error.to_dict())
+        finally:
+            # Every waiter is released, also when the fetch is cancelled. Cancelled
+            # requests are forgotten, so that a later load() fetches them again.
+            for resource_id in resource_ids:
+                key = (resource, resource_id)
+                future = self._futures[key]
+                if future.done():
+                    continue
+                if resource_id in results:
+                    future.set_result(results[resource_id])
                 else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return None
+                    del self._futures[key]
+                    future.cancel()
 
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
+
+def parse_expand(resource: str, expand: str | list[str]) -> dict[str, dict]:
+    """Parse reference paths such as "productOfferingPrice,category.productOffering".
+
+    Args:
+        resource: Resource path of the documents the paths start from
+        expand: Comma-separated string or list of dotted reference paths
+
+    Returns:
+        Tree of field names to expand
+
+    Raises:
+        Tmf620Error: 400 if a path names a field that cannot be expanded
+    """
+    if isinstance(expand, str):
+        expand = expand.split(",")
+    tree: dict[str, dict] = {}
+    for path in filter(None, (p.strip() for p in expand)):
+        node, current = tree, resource
+        for field in path.split("."):
+            if field not in EXPANDABLE_FIELDS[current]:
+                valid = ", ".join(EXPANDABLE_FIELDS[current]) or "none"
+                raise Tmf620Error(
+                    400,
+                    f"Cannot expand {field} of {current} in {path} (expandable: {valid})",
                 )
-                return None
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return None
+            node, current = (
+                node.setdefault(field, {}),
+                EXPANDABLE_FIELDS[current][field],
+            )
+    return tree
 
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return None
 
+async def expand_references(
+    data: Any,
+    resource: str,
+    expand: str | list[str],
+    client: Tmf620Client = None,
+) -> Any:
+    """Replace references in a resource or list of resources with the referenced resources.
 
-async def delete_product_offering_price(product_offering_price_id: str) -> bool:
-    """Delete a productOfferingPrice from the TM Forum Product Catalog Management API.
+    All references of one type across the result set are fetched as one concurrent batch
+    through a ReferenceLoader, using the GET cache. The documents are copied, so cached
+    responses are not modified. A reference that cannot be resolved is kept, with the error
+    added to it.
 
     Args:
-        product_offering_price_id: ID of the productOfferingPrice to delete
+        data: A resource or a list of resources
+        resource: Resource path of data (e.g. "productOffering")
+        expand: Reference paths to expand, e.g. "productSpecification,category.productOffering"
+        client: Client used to fetch the references (default: the shared tmf620_client)
 
     Returns:
-        True if deletion was successful, False otherwise
+        The expanded copy of data
 
     Raises:
-        Various httpx exceptions are caught and logged
+        Tmf620Error: 400 if a path names a field that cannot be expanded
     """
-    logger.info("+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
-    logger.info(f"Deleting productOfferingPrice with ID: {product_offering_price_id}")
+    tree = parse_expand(resource, expand)
+    loader = ReferenceLoader(client)
+
+    async def expand_reference(reference: Any, target: str, subtree: dict) -> Any:
+        if not isinstance(reference, dict) or not reference.get("id"):
+            return reference
+        result = await loader.load(target, reference["id"])
+        if not isinstance(result, dict):
+            # An empty or null response body leaves the reference as it is
+            return reference
+        if set(result) == {"error"}:
+            return {**reference, **result}
+        return await expand_document(result, target, subtree)
+
+    async def expand_document(document: Any, current: str, tree: dict) -> Any:
+        if not isinstance(document, dict) or not tree:
+            return document
+        expanded = dict(document)
+
+        async def expand_field(field: str, subtree: dict) -> None:
+            value = document[field]
+            target = EXPANDABLE_FIELDS[current][field]
+            references = value if isinstance(value, list) else [value]
+            resolved = await asyncio.gather(
+                *(expand_reference(r, target, subtree) for r in references)
+            )
+            expanded[field] = resolved if isinstance(value, list) else resolved[0]
+
+        await asyncio.gather(
+            *(
+                expand_field(field, subtree)
+                for field, subtree in tree.items()
+                if document.get(field)
+            )
+        )
+        return expanded
+
+    if isinstance(data, list):
+        return await asyncio.gather(*(expand_document(d, resource, tree) for d in data))
+    return await expand_document(data, resource, tree)
+
+
+async def create_many(
+    resource: str,
+    items: list[dict[str, Any]],
+    concurrency: int = None,
+    stop_on_error: bool = False,
+) -> list[dict[str, Any]]:
+    """Create several resources of one type concurrently.
+
+    Args:
+        resource: TMF620 resource path, one of RESOURCE_TYPES (e.g. "productOffering")
+        items: List of resources to create according to the TMF620 specification
+        concurrency: Optional maximum number of concurrent create requests
+        stop_on_error: If True, no further creates are started once one has failed
 
-    url = f"{API_URL}/productOfferingPrice/{product_offering_price_id}"
+    Returns:
+        A list with one entry per item, in the same order: the created resource, or an
+        error object with status code and detail message
+    """
+    return await tmf620_client.create_many(resource, items, concurrency, stop_on_error)
+
+
+# Cleanup and cascade delete
+# Resources are deleted in reverse dependency order: catalogs and offerings, which refer to
+# the other resources, go first, then categories, specifications and prices. The resources of
+# a level are deleted concurrently, so a large catalog is bound by API throughput rather than by
+# the latency of sequential deletes.
+CLEANUP_LEVELS = (
+    ("catalog", "productOffering"),
+    ("category", "productSpecification", "productOfferingPrice"),
+)
+# Maximum number of concurrent DELETEs made by a cleanup
+DELETE_CONCURRENCY = int(os.environ.get("TMF620_DELETE_CONCURRENCY", 8))
+# Number of deletions between two progress reports
+CLEANUP_PROGRESS_INTERVAL = 100
+
+
+def reference_ids(document: dict[str, Any], field: str) -> set[str]:
+    """IDs of the resources referenced by a field holding one reference or a list of them."""
+    value = document.get(field)
+    references = value if isinstance(value, list) else [value]
+    return {r["id"] for r in references if isinstance(r, dict) and r.get("id")}
+
+
+async def plan_cleanup(
+    catalog_id: str = None, client: Tmf620Client = None
+) -> dict[str, list[str]]:
+    """Find the resources removed by a cleanup.
+
+    Without a catalog ID every resource is selected. With one, the catalog is selected with
+    everything reachable from it: its categories and their sub-categories, the offerings in
+    those categories, and the specifications and prices of those offerings. Resources that are
+    also used outside the catalog (a category listed by another catalog, an offering in a
+    category of another catalog, a specification or price of another offering) are kept.
+
+    Args:
+        catalog_id: Optional ID of the catalog to delete with its content
+        client: Client used to read the catalog (default: the shared tmf620_client). Its
+            response cache is bypassed, so the plan reflects the current catalog.
 
-    headers = {
-        "Accept": "application/json;charset=utf-8"
-    }  # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
+    Returns:
+        IDs to delete per resource path
+
+    Raises:
+        Tmf620Error: If the catalog does not exist or a collection could not be read
+    """
+    client = (client or tmf620_client).without(ResponseCache)
+    if catalog_id is None:
+        collections = await asyncio.gather(
+            *(client.get_all(resource, fields="id") for resource in RESOURCE_TYPES)
+        )
+        return {
+            resource: [item["id"] for item in items if item.get("id")]
+            for resource, items in zip(RESOURCE_TYPES, collections)
+        }
+
+    catalog = await client.get("catalog", catalog_id)
+    catalogs, categories, offerings = await asyncio.gather(
+        client.get_all("catalog", fields="category"),
+        client.get_all("category", fields="subCategory,parentId,productOffering"),
+        client.get_all(
+            "productOffering",
+            fields="category,productSpecification,productOfferingPrice",
+        ),
     )
 
-    # Make the request
-    try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending DELETE request to: {url}")
-                logger.info(f"Headers: {headers}")
+    # Categories of the catalog that no other catalog lists, and their sub-categories
+    shared = set()
+    for other in catalogs:
+        if other.get("id") != catalog_id:
+            shared |= reference_ids(other, "category")
+    children: dict[str, set[str]] = {}
+    for category in categories:
+        children.setdefault(category["id"], set()).update(
+            reference_ids(category, "subCategory")
+        )
+        if category.get("parentId"):
+            children.setdefault(category["parentId"], set()).add(category["id"])
+    selected_categories = set()
+    pending = list(reference_ids(catalog, "category") - shared)
+    while pending:
+        category_id = pending.pop()
+        if category_id not in selected_categories:
+            selected_categories.add(category_id)
+            pending.extend(children.get(category_id, set()) - shared)
+
+    # Offerings that only belong to selected categories
+    listed = set()
+    for category in categories:
+        if category["id"] in selected_categories:
+            listed |= reference_ids(category, "productOffering")
+    selected_offerings = set()
+    for offering in offerings:
+        offering_categories = reference_ids(offering, "category")
+        if (offering["id"] in listed or offering_categories & selected_categories) and (
+            offering_categories <= selected_categories
+        ):
+            selected_offerings.add(offering["id"])
+
+    # Specifications and prices only used by selected offerings
+    used: dict[str, set[str]] = {
+        "productSpecification": set(),
+        "productOfferingPrice": set(),
+    }
+    kept: dict[str, set[str]] = {
+        "productSpecification": set(),
+        "productOfferingPrice": set(),
+    }
+    for offering in offerings:
+        target = used if offering["id"] in selected_offerings else kept
+        for resource in target:
+            target[resource] |= reference_ids(offering, resource)
+
+    plan = {
+        "catalog": [catalog_id],
+        "category": sorted(selected_categories),
+        "productOffering": sorted(selected_offerings),
+    }
+    for resource in used:
+        plan[resource] = sorted(used[resource] - kept[resource])
+    return {resource: plan[resource] for resource in RESOURCE_TYPES}
 
-                response = await client.delete(url, headers=headers)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
 
-                if response.status_code == 204:
-                    logger.info("ProductOfferingPrice deleted successfully")
-                    return True
+async def run_cleanup(
+    plan: dict[str, list[str]],
+    client: Tmf620Client = None,
+    concurrency: int = None,
+    progress=None,
+) -> dict[str, Any]:
+    """Delete the resources of a cleanup plan in reverse dependency order.
+
+    Resources that are already gone (404) count as deleted, so an interrupted cleanup can
+    simply be run again.
+
+    Args:
+        plan: IDs to delete per resource path, as returned by plan_cleanup
+        client: Client used for the deletes (default: the shared tmf620_client)
+        concurrency: Maximum number of concurrent deletes (default: TMF620_DELETE_CONCURRENCY)
+        progress: Optional async callable receiving the number of resources deleted so far
+            and the total, every CLEANUP_PROGRESS_INTERVAL deletions and after each level
+
+    Returns:
+        {"deleted": {resource: count}, "failed": [{"resource", "id", "error"}]}
+    """
+    client = client or tmf620_client
+    semaphore = asyncio.Semaphore(concurrency or DELETE_CONCURRENCY)
+    total = sum(len(ids) for ids in plan.values())
+    done = 0
+    deleted = {resource: 0 for resource in plan}
+    failed = []
+
+    async def report() -> None:
+        if progress is not None:
+            await progress(done, total)
+
+    async def delete_item(resource: str, resource_id: str) -> None:
+        nonlocal done
+        async with semaphore:
+            try:
+                await client.delete(resource, resource_id)
+                deleted[resource] += 1
+            except Tmf620Error as e:
+                if e.status == 404:
+                    deleted[resource] += 1
                 else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return False
+                    failed.append(
+                        {"resource": resource, "id": resource_id, **e.to_dict()}
+                    )
+        done += 1
+        if done % CLEANUP_PROGRESS_INTERVAL == 0:
+            await report()
+
+    logger.info(f"Deleting {total} resources")
+    for level in CLEANUP_LEVELS:
+        await asyncio.gather(
+            *(
+                delete_item(resource, resource_id)
+                for resource in level
+                for resource_id in plan.get(resource, [])
+            )
+        )
+        await report()
+    logger.info(f"Deleted {sum(deleted.values())} resources, {len(failed)} failed")
+    return {"deleted": deleted, "failed": failed}
 
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return False
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return False
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
-                return False
 
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        logger.exception("Stack trace:")
-        return False
+async def cleanup(
+    catalog_id: str = None, concurrency: int = None, progress=None
+) -> dict[str, Any]:
+    """Delete every resource, or one catalog and everything reachable from it.
+
+    See plan_cleanup for the resources selected for a catalog. Raises Tmf620Error if the
+    catalog does not exist or a collection could not be read.
+
+    Args:
+        catalog_id: Optional ID of the catalog to delete; all resources are deleted without it
+        concurrency: Optional maximum number of concurrent delete requests
+        progress: Optional async callable receiving the number of resources deleted so far
+            and the total
+
+    Returns:
+        A dictionary with the number of deleted resources per resource type ("deleted") and
+        the resources that could not be deleted ("failed")
+    """
+    plan = await plan_cleanup(catalog_id)
+    return await run_cleanup(plan, concurrency=concurrency, progress=progress)
+
+
+# ---------------------------------------------------------------------------------------------
+# Delta sync
+# A local copy of the catalog is kept current without re-listing it: each cycle lists only the
+# resources whose lastUpdate is at or after the newest one already seen. The Product Catalog API
+# parses filters with query-to-mongo, so the filter is lastUpdate>="<newest>"; the value is
+# quoted because lastUpdate is stored as a string. The API sets lastUpdate on create and on
+# PATCH; against a deployment that does not bump it on PATCH, only creations and deletions are
+# seen. Deletions leave no trace in such a listing, so every few minutes the IDs of each
+# collection are listed with fields=id and compared with the known ones.
+# Seconds between two ID-only scans that detect deleted resources
+SYNC_DELETION_SCAN_INTERVAL = float(
+    os.environ.get("TMF620_SYNC_DELETION_SCAN_INTERVAL", 300.0)
+)
+
+
+class DeltaSync:
+    """Incremental sync of the catalog into a response cache and other local copies.
+
+    The sync remembers the lastUpdate of every known resource and, per resource type, the
+    newest lastUpdate seen (the high-water mark). A cycle lists the resources updated since
+    the high-water mark; the filter includes the mark itself so that a resource updated in
+    the same millisecond is not missed, and resources whose lastUpdate is unchanged are
+    skipped. Resources that are new or changed are passed to the sinks, and replace their
+    cached views in the cache. Deleted resources are found by ID-only scans.
+
+    Sinks are objects with upsert(resource, document) and remove(resource, resource_id)
+    methods, such as a catalog graph or snapshot.
+
+    Args:
+        client: Client used to list the catalog (default: tmf620_client without its
+            response cache, so that listings are never served from it)
+        cache: Optional response cache to update with changed and deleted resources
+        sinks: Local copies to update
+        deletion_scan_interval: Seconds between two ID-only scans
+    """
+
+    def __init__(
+        self,
+        client: Tmf620Client = None,
+        cache: ResponseCache = None,
+        sinks: list = None,
+        deletion_scan_interval: float = SYNC_DELETION_SCAN_INTERVAL,
+    ):
+        self.client = client
+        self.cache = cache
+        self.sinks = list(sinks or [])
+        self.deletion_scan_interval = deletion_scan_interval
+        # resource -> {ID: lastUpdate}
+        self.versions: dict[str, dict[str, str | None]] = {}
+        # resource -> newest lastUpdate seen
+        self.high_water: dict[str, str] = {}
+        self.last_scan: dict[str, float] = {}
+        self.cycles = 0
+        self.totals = {"added": 0, "changed": 0, "removed": 0}
+
+    def _client(self) -> Tmf620Client:
+        return self.client or tmf620_client.without(ResponseCache)
+
+    def seed(self, resource: str, documents: list[dict[str, Any]]) -> None:
+        """Start from a complete listing of one resource type that the sinks already hold."""
+        self.versions[resource] = {
+            d["id"]: d.get("lastUpdate") for d in documents if d.get("id")
+        }
+        self.high_water[resource] = max(
+            (v for v in self.versions[resource].values() if v), default=None
+        )
+        self.last_scan[resource] = time.monotonic()
+
+    def _upsert(self, resource: str, document: dict[str, Any], notify_cache: bool):
+        last_update = document.get("lastUpdate")
+        self.versions.setdefault(resource, {})[document["id"]] = last_update
+        if last_update and last_update > (self.high_water.get(resource) or ""):
+            self.high_water[resource] = last_update
+        if notify_cache and self.cache is not None:
+            self.cache.refresh(resource, document["id"], document)
+        for sink in self.sinks:
+            sink.upsert(resource, document)
+
+    def _remove(self, resource: str, resource_id: str) -> None:
+        self.versions.get(resource, {}).pop(resource_id, None)
+        if self.cache is not None:
+            self.cache.invalidate(resource, resource_id)
+        for sink in self.sinks:
+            sink.remove(resource, resource_id)
+
+    async def sync_resource(
+        self, resource: str, scan_deletions: bool = None
+    ) -> dict[str, int]:
+        """Run one sync cycle for one resource type.
+
+        The first cycle without a seed lists the whole collection.
+
+        Args:
+            resource: TMF620 resource path
+            scan_deletions: Scan the IDs for deletions; by default when the last scan is
+                older than deletion_scan_interval
+
+        Returns:
+            Number of resources added, changed and removed
+
+        Raises:
+            Tmf620Error: If the collection could not be listed
+        """
+        client = self._client()
+        counts = {"added": 0, "changed": 0, "removed": 0}
+        if resource not in self.versions:
+            documents = await client.get_all(resource)
+            self.versions[resource] = {}
+            for document in documents:
+                if document.get("id"):
+                    self._upsert(resource, document, notify_cache=False)
+            counts["added"] = len(self.versions[resource])
+            self.last_scan[resource] = time.monotonic()
+            return counts
+
+        known = self.versions[resource]
+        high_water = self.high_water.get(resource)
+        if high_water:
+            documents = await client.get_all(
+                resource, filter={"lastUpdate>": f'"{high_water}"'}
+            )
+        else:
+            documents = await client.get_all(resource)
+        for document in documents:
+            resource_id = document.get("id")
+            if not resource_id:
+                continue
+            if resource_id in known:
+                if document.get("lastUpdate") == known[resource_id]:
+                    continue
+                counts["changed"] += 1
+            else:
+                counts["added"] += 1
+            self._upsert(resource, document, notify_cache=True)
+
+        if scan_deletions is None:
+            elapsed = time.monotonic() - self.last_scan.get(resource, 0.0)
+            scan_deletions = elapsed >= self.deletion_scan_interval
+        if scan_deletions:
+            listing = await client.get_all(resource, fields="id")
+            current = {item.get("id") for item in listing}
+            for resource_id in [i for i in known if i not in current]:
+                self._remove(resource, resource_id)
+                counts["removed"] += 1
+            self.last_scan[resource] = time.monotonic()
+        return counts
+
+    async def sync(self, scan_deletions: bool = None) -> dict[str, int]:
+        """Run one sync cycle for every resource type, concurrently.
+
+        Args:
+            scan_deletions: Scan the IDs for deletions (see sync_resource)
+
+        Returns:
+            Number of resources added, changed and removed in this cycle
+
+        Raises:
+            Tmf620Error: If a collection could not be listed
+        """
+        results = await asyncio.gather(
+            *(self.sync_resource(r, scan_deletions) for r in RESOURCE_TYPES)
+        )
+        counts = {"added": 0, "changed": 0, "removed": 0}
+        for resource, result in zip(RESOURCE_TYPES, results):
+            for name, count in result.items():
+                counts[name] += count
+            if any(result.values()):
+                logger.info(f"Synced {resource}: {result}")
+        for name, count in counts.items():
+            self.totals[name] += count
+        self.cycles += 1
+        return counts
 
 
 async def get_access_token() -> str:
@@ -2255,6 +3464,8 @@ async def main():
     except Exception as e:
         logger.error(f"Error in main function: {e}")
         logger.exception("Stack trace:")
+    finally:
+        await close_http_client()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,348 @@
+# Product Catalog graph
+# An optional in-process copy of the whole product catalog (catalogs, categories, product
+# specifications, offerings and prices) with adjacency indexes in both directions, so questions
+# that walk the catalog ("which offerings under category X have a price below Y") are answered
+# from memory instead of with several round trips to the Product Catalog API.
+#
+# The graph is built from paginated list calls and kept fresh incrementally: hub events are
+# applied as they arrive, and a periodic DeltaSync cycle fetches only the resources changed
+# since the last one.
+import asyncio
+import logging
+import time
+from typing import Any
+
+from product_catalog_api import (
+    DeltaSync,
+    EXPANDABLE_FIELDS,
+    RESOURCE_TYPES,
+    ResponseCache,
+    Tmf620Client,
+    parse_event,
+    reference_ids,
+    tmf620_client,
+)
+
+logger = logging.getLogger("product-catalog-graph")
+
+# Reference fields indexed as edges, per resource path, with the referenced resource path
+GRAPH_EDGES = {
+    resource: dict(
+        fields,
+        **(
+            {"productOffering": "productOffering"}
+            if resource == "productOfferingPrice"
+            else {}
+        ),
+    )
+    for resource, fields in EXPANDABLE_FIELDS.items()
+}
+
+
+def project(document: dict[str, Any], fields: str | None) -> dict[str, Any]:
+    """Apply a fields selection the way the Product Catalog API does."""
+    if not fields:
+        return document
+    selected = {"id", "href"} | {f.strip() for f in fields.split(",")}
+    return {k: v for k, v in document.items() if k in selected}
+
+
+def matches(document: dict[str, Any], filter: dict | None) -> bool:
+    """Check a document against attribute filters (equality on top-level fields)."""
+    return all(
+        str(document.get(name)) == str(value) for name, value in (filter or {}).items()
+    )
+
+
+class CatalogGraph:
+    """In-memory catalog with adjacency indexes in both directions.
+
+    Nodes are keyed by (resource path, ID). For every reference field in GRAPH_EDGES the
+    graph keeps the outgoing edge from the referring resource and the incoming edge on the
+    referenced one, so both "the prices of this offering" and "the offerings using this
+    specification" are dictionary lookups.
+
+    Args:
+        client: Client used to read the catalog (default: tmf620_client without its response
+            cache, so that refreshes see the current data)
+        cache: Optional response cache that the refreshes keep current as well
+    """
+
+    def __init__(self, client: Tmf620Client = None, cache: ResponseCache = None):
+        self.client = client
+        self.sync = DeltaSync(client, cache, sinks=[self])
+        self.documents: dict[str, dict[str, dict]] = {r: {} for r in RESOURCE_TYPES}
+        self._out: dict[tuple[str, str], set[tuple[str, str]]] = {}
+        self._in: dict[tuple[str, str], set[tuple[str, str]]] = {}
+        self.ready = False
+        self.built_at: float | None = None
+        self.refreshed_at: float | None = None
+
+    def _client(self) -> Tmf620Client:
+        return self.client or tmf620_client.without(ResponseCache)
+
+    # -- Maintenance ------------------------------------------------------------------------
+
+    async def build(self) -> "CatalogGraph":
+        """Load every resource with paginated list calls and index the references.
+
+        Raises:
+            Tmf620Error: If a collection could not be read
+        """
+        started = time.monotonic()
+        client = self._client()
+        collections = await asyncio.gather(
+            *(client.get_all(resource) for resource in RESOURCE_TYPES)
+        )
+        self.load(dict(zip(RESOURCE_TYPES, collections)))
+        logger.info(
+            f"Built catalog graph with {self.size()} resources "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+        return self
+
+    def load(self, collections: dict[str, list[dict[str, Any]]]) -> "CatalogGraph":
+        """Replace the graph with complete collections, e.g. read from a snapshot.
+
+        The collections also seed the delta sync, so that the next refresh fetches only the
+        resources changed since they were read.
+        """
+        self.documents = {r: {} for r in RESOURCE_TYPES}
+        self._out, self._in = {}, {}
+        for resource in RESOURCE_TYPES:
+            items = list(collections.get(resource, []))
+            for document in items:
+                self.upsert(resource, document)
+            self.sync.seed(resource, items)
+        self.ready = True
+        self.built_at = self.refreshed_at = time.time()
+        return self
+
+    def upsert(self, resource: str, document: dict[str, Any]) -> None:
+        """Add or replace a resource and its outgoing references."""
+        resource_id = document.get("id")
+        if not resource_id or resource not in self.documents:
+            return
+        key = (resource, resource_id)
+        self._unlink(key)
+        self.documents[resource][resource_id] = document
+        targets = {
+            (target_resource, target_id)
+            for field, target_resource in GRAPH_EDGES[resource].items()
+            for target_id in reference_ids(document, field)
+        }
+        if resource == "category" and document.get("parentId"):
+            # Sub-categories may only name their parent
+            targets.add(("category", document["parentId"]))
+        self._out[key] = targets
+        for target in targets:
+            self._in.setdefault(target, set()).add(key)
+
+    def remove(self, resource: str, resource_id: str) -> None:
+        """Remove a resource and its outgoing references."""
+        if self.documents.get(resource, {}).pop(resource_id, None) is not None:
+            self._unlink((resource, resource_id))
+            self._out.pop((resource, resource_id), None)
+
+    def _unlink(self, key: tuple[str, str]) -> None:
+        for target in self._out.get(key, ()):
+            sources = self._in.get(target)
+            if sources is not None:
+                sources.discard(key)
+                if not sources:
+                    del self._in[target]
+        self._out[key] = set()
+
+    def apply_event(self, message: dict[str, Any]) -> bool:
+        """Apply a TMF620 hub event message (see product_catalog_api.apply_event).
+
+        Returns:
+            True if the event was recognised and applied
+        """
+        event = parse_event(message)
+        if event is None:
+            return False
+        kind, resource, document = event
+        if kind == "delete":
+            self.remove(resource, document.get("id"))
+        else:
+            self.upsert(resource, document)
+        return True
+
+    async def refresh(self, scan_deletions: bool = None) -> dict[str, int]:
+        """Bring the graph up to date with one DeltaSync cycle.
+
+        Only the resources updated since the last cycle are listed; deleted resources are
+        found by the periodic ID-only scans of the sync.
+
+        Args:
+            scan_deletions: Scan the IDs for deletions now (default: when due)
+
+        Returns:
+            Number of resources added, changed and removed
+
+        Raises:
+            Tmf620Error: If a collection could not be read
+        """
+        counts = await self.sync.sync(scan_deletions)
+        self.refreshed_at = time.time()
+        return counts
+
+    # -- Queries ----------------------------------------------------------------------------
+
+    def size(self) -> int:
+        """Number of resources in the graph."""
+        return sum(len(documents) for documents in self.documents.values())
+
+    def metrics(self) -> list[tuple]:
+        """Metric families in the format expected by render_metrics."""
+        return [
+            (
+                "tmf620_catalog_graph_resources",
+                "gauge",
+                "Resources held by the catalog graph",
+                [({"resource": r}, len(d)) for r, d in self.documents.items()],
+            ),
+            (
+                "tmf620_catalog_graph_built_timestamp_seconds",
+                "gauge",
+                "Time the catalog graph was last loaded completely",
+                [({}, self.built_at or 0)],
+            ),
+            (
+                "tmf620_catalog_graph_refreshed_timestamp_seconds",
+                "gauge",
+                "Time of the last delta sync of the catalog graph",
+                [({}, self.refreshed_at or 0)],
+            ),
+        ]
+
+    def get(self, resource: str, resource_id: str) -> dict[str, Any] | None:
+        """A resource by ID, or None if the graph does not hold it."""
+        return self.documents.get(resource, {}).get(resource_id)
+
+    def select(
+        self,
+        resource: str,
+        fields: str = None,
+        offset: int = None,
+        limit: int = None,
+        filter: dict = None,
+    ) -> list[dict[str, Any]]:
+        """Resources of one type, with the fields, paging and filter semantics of the API."""
+        documents = [d for d in self.documents[resource].values() if matches(d, filter)]
+        start = offset or 0
+        documents = documents[start : start + limit if limit is not None else None]
+        return [project(d, fields) for d in documents]
+
+    def related(
+        self, resource: str, resource_id: str, target: str = None
+    ) -> list[dict[str, Any]]:
+        """Resources referenced by, or referring to, a resource.
+
+        Args:
+            resource: Resource path of the start resource
+            resource_id: ID of the start resource
+            target: Optional resource path to restrict the result to
+
+        Returns:
+            The related resources held by the graph, in both directions
+        """
+        key = (resource, resource_id)
+        keys = self._out.get(key, set()) | self._in.get(key, set())
+        return [
+            self.documents[r][i]
+            for r, i in sorted(keys)
+            if (target is None or r == target) and i in self.documents.get(r, {})
+        ]
+
+    def subcategories(self, category_id: str) -> list[str]:
+        """IDs of a category and of all its sub-categories, at any depth."""
+        found, pending = [], [category_id]
+        while pending:
+            current = pending.pop()
+            if current in found:
+                continue
+            found.append(current)
+            category = self.documents["category"].get(current, {})
+            pending.extend(reference_ids(category, "subCategory"))
+            pending.extend(
+                d["id"]
+                for d in self.related("category", current, "category")
+                if d.get("parentId") == current
+            )
+        return found
+
+    def offerings_in_category(
+        self, category_id: str, include_subcategories: bool = True
+    ) -> list[dict[str, Any]]:
+        """Offerings listed by a category, or referring to it."""
+        categories = (
+            self.subcategories(category_id) if include_subcategories else [category_id]
+        )
+        offerings = {}
+        for current in categories:
+            for offering in self.related("category", current, "productOffering"):
+                offerings[offering["id"]] = offering
+        return list(offerings.values())
+
+    def prices(self, offering_id: str) -> list[dict[str, Any]]:
+        """Prices of an offering."""
+        return self.related("productOffering", offering_id, "productOfferingPrice")
+
+    def offering_summary(self, offering: dict[str, Any]) -> dict[str, Any]:
+        """Offering reduced to its identity, status, specification and price amounts."""
+        specification = sorted(reference_ids(offering, "productSpecification"))
+        return {
+            "id": offering["id"],
+            "name": offering.get("name"),
+            "lifecycleStatus": offering.get("lifecycleStatus"),
+            "productSpecification": specification[0] if specification else None,
+            "prices": [
+                {
+                    "id": price["id"],
+                    "name": price.get("name"),
+                    "priceType": price.get("priceType"),
+                    **(price.get("price") or {}),
+                }
+                for price in self.prices(offering["id"])
+            ],
+        }
+
+    def find_offerings(
+        self,
+        category_id: str = None,
+        max_price: float = None,
+        unit: str = None,
+        lifecycle_status: str = None,
+    ) -> list[dict[str, Any]]:
+        """Offerings matching category, price and status criteria, as summaries.
+
+        Args:
+            category_id: Optional category; its sub-categories are included
+            max_price: Optional upper bound; an offering matches if one of its prices is
+                at or below it
+            unit: Optional currency of the prices compared with max_price (e.g. "USD")
+            lifecycle_status: Optional lifecycleStatus of the offerings
+
+        Returns:
+            Matching offerings reduced by offering_summary
+        """
+        if category_id is not None:
+            offerings = self.offerings_in_category(category_id)
+        else:
+            offerings = list(self.documents["productOffering"].values())
+        results = []
+        for offering in offerings:
+            if lifecycle_status and offering.get("lifecycleStatus") != lifecycle_status:
+                continue
+            summary = self.offering_summary(offering)
+            if max_price is not None and not any(
+                isinstance(price.get("value"), (int, float))
+                and price["value"] <= max_price
+                and (unit is None or price.get("unit") == unit)
+                for price in summary["prices"]
+            ):
+                continue
+            results.append(summary)
+        return results
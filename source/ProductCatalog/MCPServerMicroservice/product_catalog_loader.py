@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# Product Catalog loader
+# Loads a directory of TMF620 JSON payloads (such as test_payloads or example_payloads) into the
+# Product Catalog API. The payloads reference each other by name: an offering names its product
+# specification and categories, a price names the offering it belongs to. The loader builds the
+# reference graph, orders it topologically and creates each dependency level concurrently through
+# Tmf620Client.create_many. References are rewritten to the IDs and hrefs assigned by the API as
+# the referenced resources are created, so no second pass is needed to link them.
+#
+# Examples:
+#   python product_catalog_loader.py test_payloads
+#   python product_catalog_loader.py test_payloads /data/catalogs --concurrency 32
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from typing import Any
+
+from product_catalog_api import (
+    CREATE_CONCURRENCY,
+    RESOURCE_TYPE_NAMES,
+    Tmf620Client,
+    Tmf620Error,
+    close_http_client,
+    tmf620_client,
+)
+
+logger = logging.getLogger("product-catalog-loader")
+
+# Resource path for the file name suffixes used in test_payloads (e.g. enterprise_ddos_spec.json)
+FILE_SUFFIXES = {
+    "catalog": "catalog",
+    "category": "category",
+    "spec": "productSpecification",
+    "offering": "productOffering",
+    "price": "productOfferingPrice",
+}
+
+_FILE_PATTERN = re.compile(r"^(?:(.+)_)?([A-Za-z]+)\.json$")
+
+# Fields holding references that must exist before a resource is created, per resource path.
+# The value is the resource path of the referenced resources.
+REFERENCE_FIELDS = {
+    "catalog": {"category": "category"},
+    "category": {"subCategory": "category"},
+    "productSpecification": {"bundledProductSpecification": "productSpecification"},
+    "productOffering": {
+        "productSpecification": "productSpecification",
+        "category": "category",
+        "productOfferingPrice": "productOfferingPrice",
+        "bundledProductOffering": "productOffering",
+    },
+    "productOfferingPrice": {"bundledPopRelationship": "productOfferingPrice"},
+}
+
+# Back references that would make the graph cyclic. A price naming its offering is turned into a
+# productOfferingPrice reference on the offering, so references only point from offering to price.
+BACK_REFERENCES = {
+    "productOfferingPrice": (
+        "productOffering",
+        "productOffering",
+        "productOfferingPrice",
+    ),
+}
+
+
+class PayloadNode:
+    """A payload to create, with the payloads it references."""
+
+    __slots__ = (
+        "resource",
+        "document",
+        "source",
+        "references",
+        "dependents",
+        "result",
+    )
+
+    def __init__(self, resource: str, document: dict[str, Any], source: str = None):
+        self.resource = resource
+        self.document = document
+        self.source = source
+        # (field, index or None, referenced node) for every reference to another payload
+        self.references: list[tuple[str, int | None, PayloadNode]] = []
+        self.dependents: list[PayloadNode] = []
+        # Created resource, or an error object once the create has failed or been skipped
+        self.result: dict[str, Any] | None = None
+
+    @property
+    def name(self) -> str:
+        return self.document.get("name", "")
+
+    @property
+    def failed(self) -> bool:
+        return self.result is not None and "error" in self.result
+
+    def __repr__(self) -> str:
+        return f"PayloadNode({self.resource}, {self.name!r})"
+
+
+def payload_resource(document: dict[str, Any], filename: str) -> str | None:
+    """Determine the resource path of a payload from its @type or its file name."""
+    for resource, type_name in RESOURCE_TYPE_NAMES.items():
+        if document.get("@type") == type_name:
+            return resource
+    match = _FILE_PATTERN.match(filename)
+    if match:
+        suffix = match.group(2)
+        return FILE_SUFFIXES.get(suffix) or (
+            suffix if suffix in RESOURCE_TYPE_NAMES else None
+        )
+    return None
+
+
+def load_payloads(*directories: str) -> list[PayloadNode]:
+    """Read the JSON payloads in one or more directories.
+
+    A file holds one resource or a list of resources. The resource path is taken from the
+    @type of each document, or from the file name (enterprise_ddos_spec.json,
+    productOffering.json, ...).
+
+    Args:
+        directories: Directories to read, in order
+
+    Returns:
+        One node per payload, in file name order
+    """
+    nodes = []
+    for directory in directories:
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(directory, filename)
+            with open(path, "r") as f:
+                data = json.load(f)
+            for document in data if isinstance(data, list) else [data]:
+                resource = payload_resource(document, filename)
+                if resource is None:
+                    logger.warning(f"Skipping {filename}: unknown resource type")
+                    continue
+                nodes.append(PayloadNode(resource, document, path))
+    logger.info(f"Loaded {len(nodes)} payloads from {', '.join(directories)}")
+    return nodes
+
+
+def _file_base(node: PayloadNode) -> str | None:
+    """Path shared by related payload files (.../enterprise_ddos_advanced for *_price.json)."""
+    directory, filename = os.path.split(node.source or "")
+    match = _FILE_PATTERN.match(filename)
+    return os.path.join(directory, match.group(1)) if match and match.group(1) else None
+
+
+def build_graph(nodes: list[PayloadNode]) -> None:
+    """Resolve the references between payloads.
+
+    A reference is resolved to a payload of the referenced resource type with the same ID
+    or, failing that, the same name. References to resources outside the payload set are
+    left as they are. A price is also linked to the offering in the file with the same
+    base name (enterprise_ddos_advanced_price.json and enterprise_ddos_advanced_offering.json)
+    when both files hold a single payload.
+
+    Args:
+        nodes: Payloads returned by load_payloads. Back references are moved to the
+            referenced document in place.
+    """
+    by_id: dict[tuple[str, str], PayloadNode] = {}
+    by_name: dict[tuple[str, str], PayloadNode] = {}
+    by_file: dict[tuple[str, str], PayloadNode] = {}
+    # Files are only paired by name when they hold a single payload
+    documents_per_file = Counter(node.source for node in nodes)
+    for node in nodes:
+        if node.document.get("id"):
+            by_id.setdefault((node.resource, node.document["id"]), node)
+        by_name.setdefault((node.resource, node.name), node)
+        if documents_per_file[node.source] == 1 and _file_base(node):
+            by_file.setdefault((node.resource, _file_base(node)), node)
+
+    def resolve(resource: str, reference: Any) -> PayloadNode | None:
+        if not isinstance(reference, dict):
+            return None
+        return by_id.get((resource, reference.get("id"))) or by_name.get(
+            (resource, reference.get("name"))
+        )
+
+    def link(node: PayloadNode, field: str, index: int | None, target: PayloadNode):
+        node.references.append((field, index, target))
+        target.dependents.append(node)
+
+    for node in nodes:
+        for field, target_resource in REFERENCE_FIELDS[node.resource].items():
+            value = node.document.get(field)
+            references = value if isinstance(value, list) else [value]
+            for index, reference in enumerate(references):
+                target = resolve(target_resource, reference)
+                if target is not None and target is not node:
+                    link(
+                        node, field, index if isinstance(value, list) else None, target
+                    )
+
+    # Turn back references into forward references
+    for node in nodes:
+        if node.resource not in BACK_REFERENCES:
+            continue
+        field, target_resource, target_field = BACK_REFERENCES[node.resource]
+        target = resolve(target_resource, node.document.get(field))
+        if target is None and documents_per_file[node.source] == 1:
+            target = by_file.get((target_resource, _file_base(node)))
+        if target is None:
+            continue
+        node.document.pop(field, None)
+        if any(t is node for _, _, t in target.references):
+            continue
+        references = target.document.setdefault(target_field, [])
+        references.append(
+            {"name": node.name, "@referredType": RESOURCE_TYPE_NAMES[node.resource]}
+        )
+        link(target, target_field, len(references) - 1, node)
+
+
+def dependency_levels(nodes: list[PayloadNode]) -> list[list[PayloadNode]]:
+    """Order the payloads so that every payload comes after the payloads it references.
+
+    Args:
+        nodes: Payloads with resolved references (see build_graph)
+
+    Returns:
+        Levels of payloads. The payloads of a level only reference payloads of earlier
+        levels, so they can be created concurrently.
+
+    Raises:
+        ValueError: If the references form a cycle
+    """
+    pending = {node: len({t for _, _, t in node.references}) for node in nodes}
+    level = [node for node in nodes if pending[node] == 0]
+    levels = []
+    while level:
+        levels.append(level)
+        next_level = []
+        for node in level:
+            for dependent in dict.fromkeys(node.dependents):
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    ordered = sum(len(level) for level in levels)
+    if ordered < len(nodes):
+        cycle = [node for node in nodes if pending[node] > 0]
+        raise ValueError(f"Payload references form a cycle: {cycle[:10]}")
+    return levels
+
+
+def entity_reference(node: PayloadNode, client: Tmf620Client) -> dict[str, Any]:
+    """Build a reference to a created payload."""
+    created = node.result
+    return {
+        "id": created["id"],
+        "href": created.get("href")
+        or f"{client.base_url}/{node.resource}/{created['id']}",
+        "name": created.get("name", node.name),
+        "@referredType": RESOURCE_TYPE_NAMES[node.resource],
+    }
+
+
+def resolved_document(node: PayloadNode, client: Tmf620Client) -> dict[str, Any]:
+    """Copy a payload with its references rewritten to the created resources."""
+    document = dict(node.document)
+    for field, index, target in node.references:
+        reference = entity_reference(target, client)
+        if index is None:
+            document[field] = reference
+        else:
+            if document[field] is node.document[field]:
+                document[field] = list(document[field])
+            document[field][index] = reference
+    return document
+
+
+async def load_catalog(
+    nodes: list[PayloadNode],
+    client: Tmf620Client = None,
+    concurrency: int = None,
+) -> dict[str, Any]:
+    """Create payloads level by level, each level concurrently.
+
+    Payloads that reference a payload which could not be created are skipped and reported
+    with a 424 (Failed Dependency) error.
+
+    Args:
+        nodes: Payloads returned by load_payloads
+        client: Client used to create the resources (default: the shared tmf620_client)
+        concurrency: Maximum number of concurrent creates per resource type
+            (default: TMF620_CREATE_CONCURRENCY)
+
+    Returns:
+        {"created": {resource: {name: id}}, "failed": [{"resource", "name", "error"}],
+        "duplicates": [{"resource", "name", "created": [{"source", "id"}]}]}. When
+        several payloads of a resource type share a name, "created" holds the ID of the
+        first one and "duplicates" lists all of them.
+
+    Raises:
+        ValueError: If the references form a cycle
+    """
+    client = client or tmf620_client
+    build_graph(nodes)
+    levels = dependency_levels(nodes)
+    logger.info(f"Creating {len(nodes)} resources in {len(levels)} dependency levels")
+
+    for number, level in enumerate(levels, 1):
+        batches: dict[str, list[PayloadNode]] = defaultdict(list)
+        for node in level:
+            failed = [t for _, _, t in node.references if t.failed]
+            if failed:
+                node.result = Tmf620Error(
+                    424, f"Not created because {failed[0]!r} could not be created"
+                ).to_dict()
+            else:
+                batches[node.resource].append(node)
+
+        async def create_resources(resource: str, batch: list[PayloadNode]) -> None:
+            documents = [resolved_document(node, client) for node in batch]
+            results = await client.create_many(
+                resource, documents, concurrency or CREATE_CONCURRENCY
+            )
+            for node, result in zip(batch, results):
+                node.result = result
+
+        logger.info(
+            f"Level {number}: "
+            + ", ".join(f"{len(b)} {resource}" for resource, b in batches.items())
+        )
+        await asyncio.gather(*(create_resources(r, b) for r, b in batches.items()))
+
+    created: dict[str, dict[str, str]] = {
+        resource: {} for resource in RESOURCE_TYPE_NAMES
+    }
+    by_name: dict[tuple[str, str], list[PayloadNode]] = defaultdict(list)
+    failed = []
+    for node in nodes:
+        if node.failed:
+            failed.append({"resource": node.resource, "name": node.name, **node.result})
+        else:
+            created[node.resource].setdefault(node.name, node.result.get("id"))
+            by_name[node.resource, node.name].append(node)
+    duplicates = [
+        {
+            "resource": resource,
+            "name": name,
+            "created": [{"source": n.source, "id": n.result.get("id")} for n in same],
+        }
+        for (resource, name), same in by_name.items()
+        if len(same) > 1
+    ]
+    if duplicates:
+        logger.warning(
+            f"{len(duplicates)} names are shared by several created resources"
+        )
+    logger.info(f"Created {len(nodes) - len(failed)} resources, {len(failed)} failed")
+    return {"created": created, "failed": failed, "duplicates": duplicates}
+
+
+async def load_directories(*directories: str, **kwargs) -> dict[str, Any]:
+    """Load the payloads in one or more directories (see load_catalog for the arguments)."""
+    return await load_catalog(load_payloads(*directories), **kwargs)
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Load TMF620 JSON payloads into the Product Catalog API"
+    )
+    parser.add_argument("directories", nargs="+", help="Directories of JSON payloads")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=CREATE_CONCURRENCY,
+        help="Maximum number of concurrent creates per resource type",
+    )
+    args = parser.parse_args()
+
+    try:
+        result = await load_directories(*args.directories, concurrency=args.concurrency)
+    finally:
+        await close_http_client()
+
+    extra = Counter()
+    for duplicate in result["duplicates"]:
+        extra[duplicate["resource"]] += len(duplicate["created"]) - 1
+    for resource, created in result["created"].items():
+        print(f"{resource}: {len(created) + extra[resource]} created")
+    for duplicate in result["duplicates"]:
+        print(
+            f"{duplicate['resource']} '{duplicate['name']}' created "
+            f"{len(duplicate['created'])} times: "
+            + ", ".join(d["id"] for d in duplicate["created"])
+        )
+    for failure in result["failed"]:
+        print(
+            f"Failed to create {failure['resource']} '{failure['name']}': "
+            f"{failure['error']['detail']}"
+        )
+    return not result["failed"]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    sys.exit(0 if asyncio.run(main()) else 1)
@@ -12,15 +12,28 @@
 import logging
 import os
 import sys
+import time
 import argparse
+import asyncio
+import csv
+import functools
+import inspect
+import io
+import json
+import re
 from pathlib import Path
+from contextlib import aclosing
 
 # MCP Server imports
 from typing import Any, Dict, List, Optional
-from mcp.server.fastmcp import FastMCP
+from mcp import types
+from mcp.server.fastmcp import Context, FastMCP
+import tiktoken
 import uvicorn
 from starlette.applications import Starlette
-from starlette.routing import Mount
+from starlette.routing import Mount, Route
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 from starlette.middleware.cors import CORSMiddleware
 
 
@@ -46,7 +59,35 @@ from product_catalog_api import (
     create_product_offering_price,
     update_product_offering_price,
     delete_product_offering_price,
+    iter_catalogs,
+    iter_categories,
+    iter_product_specifications,
+    iter_product_offerings,
+    iter_product_offering_prices,
+    get_many,
+    expand_references,
+    create_many,
+    plan_cleanup,
+    run_cleanup,
+    open_http_client,
+    close_http_client,
+    render_metrics,
+    register_event_listener,
+    unregister_event_listener,
+    event_authorized,
+    EVENT_SECRET_PARAM,
+    apply_event,
+    circuit_breaker,
+    DeltaSync,
+    reference_ids,
+    tmf620_client,
+    response_cache,
+    RELEASE_NAME,
+    RESOURCE_TYPES,
+    Tmf620Error,
 )
+from product_catalog_graph import CatalogGraph, project
+from product_catalog_snapshot import CatalogSnapshot
 
 # ---------------------------------------------------------------------------------------------
 # Configure logging
@@ -77,30 +118,709 @@ mcp = FastMCP(
 # MCP tools
 # This section defines the tools for the MCP server to interact with the TM Forum Product Catalog Management API.
 
+# Maximum number of items a list tool returns when no offset or limit is given.
+# Collections are streamed page by page and cut off at this size to bound memory use.
+MCP_LIST_MAX_ITEMS = int(os.environ.get("MCP_LIST_MAX_ITEMS", 1000))
+# Maximum number of items accepted by a *_create_batch tool, or IDs by resource_get_many, in one call
+MCP_BATCH_MAX_ITEMS = int(os.environ.get("MCP_BATCH_MAX_ITEMS", 500))
+# Keep an in-memory graph of the whole catalog and answer the read tools from it
+MCP_CATALOG_GRAPH = os.environ.get("MCP_CATALOG_GRAPH", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Default token budget of a list result returned by a tool (0: no budget)
+MCP_MAX_TOKENS = int(os.environ.get("MCP_MAX_TOKENS", 20000))
+# tiktoken encoding used to count the tokens of tool results
+MCP_TOKEN_ENCODING = os.environ.get("MCP_TOKEN_ENCODING", "cl100k_base")
+# Fields stripped from compact tool output; references are reduced to their ID and name
+COMPACT_DROPPED_FIELDS = ("href", "@schemaLocation", "@baseType", "@referredType")
+# Fields kept in the summary of each resource type (references are reduced to IDs)
+SUMMARY_FIELDS = {
+    "catalog": ("id", "name", "lifecycleStatus", "category"),
+    "category": (
+        "id",
+        "name",
+        "lifecycleStatus",
+        "parentId",
+        "isRoot",
+        "subCategory",
+        "productOffering",
+    ),
+    "productSpecification": (
+        "id",
+        "name",
+        "lifecycleStatus",
+        "brand",
+        "productNumber",
+        "version",
+    ),
+    "productOffering": (
+        "id",
+        "name",
+        "lifecycleStatus",
+        "productSpecification",
+        "category",
+        "productOfferingPrice",
+    ),
+    "productOfferingPrice": (
+        "id",
+        "name",
+        "lifecycleStatus",
+        "priceType",
+        "price",
+        "recurringChargePeriodType",
+        "recurringChargePeriodLength",
+    ),
+}
+# Default columns of format="table" list results, per resource path (dotted paths)
+TABLE_COLUMNS = {
+    "catalog": ("id", "name", "lifecycleStatus", "version", "category.id"),
+    "category": ("id", "name", "lifecycleStatus", "isRoot", "parentId"),
+    "productSpecification": (
+        "id",
+        "name",
+        "lifecycleStatus",
+        "brand",
+        "productNumber",
+        "version",
+    ),
+    "productOffering": (
+        "id",
+        "name",
+        "lifecycleStatus",
+        "productSpecification.id",
+        "category.id",
+        "productOfferingPrice.id",
+    ),
+    "productOfferingPrice": (
+        "id",
+        "name",
+        "lifecycleStatus",
+        "priceType",
+        "price.value",
+        "price.unit",
+        "recurringChargePeriodType",
+    ),
+    # Offering summaries returned by product_offering_search
+    "offeringSummary": (
+        "id",
+        "name",
+        "lifecycleStatus",
+        "productSpecification",
+        "prices.value",
+        "prices.unit",
+    ),
+}
+# Separator of the values of a table cell taken from a list
+TABLE_LIST_SEPARATOR = "|"
+# Values of the format argument of the read tools
+OUTPUT_FORMATS = ("json", "table")
+# File the catalog is persisted to and warm-started from (empty: no snapshot)
+MCP_CATALOG_SNAPSHOT = os.environ.get("MCP_CATALOG_SNAPSHOT", "")
+# Seconds between delta syncs that refresh the catalog graph or snapshot and the response
+# cache (0 relies on hub events only)
+MCP_CATALOG_REFRESH_INTERVAL = float(
+    os.environ.get("MCP_CATALOG_REFRESH_INTERVAL", 60.0)
+)
+# Minimum seconds between two writes of the catalog snapshot
+MCP_CATALOG_SNAPSHOT_SAVE_INTERVAL = float(
+    os.environ.get("MCP_CATALOG_SNAPSHOT_SAVE_INTERVAL", 300.0)
+)
+
+# Loaded in the background on startup; the read tools use the API until one is ready
+catalog_graph = CatalogGraph(cache=response_cache) if MCP_CATALOG_GRAPH else None
+catalog_snapshot = (
+    CatalogSnapshot(MCP_CATALOG_SNAPSHOT) if MCP_CATALOG_SNAPSHOT else None
+)
+
+
+def fail_fast(resource: str):
+    """Decorate a tool so it returns a structured error at once while the API is failing.
+
+    While the circuit breaker for the resource is open the tool is not run; it returns
+    {"error": {"status": 503, "detail": ..., "retry_after": seconds}} instead of waiting for
+    the Product Catalog API to time out.
+
+    Args:
+        resource: TMF620 resource path the tool operates on (e.g. "productOffering")
+    """
+
+    def decorator(tool):
+        @functools.wraps(tool)
+        async def wrapper(*args, **kwargs):
+            error = circuit_breaker.rejection(resource)
+            if error is not None:
+                logger.warning(
+                    f"MCP Tool - {tool.__name__} failed fast: {error.detail}"
+                )
+                return error.to_dict()
+            return await tool(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def collect_items(items, max_items: int = MCP_LIST_MAX_ITEMS):
+    """Collect the items of a paginated iterator into a list tool response.
+
+    Args:
+        items: Async iterator over the items of a collection (see iter_catalogs etc.)
+        max_items: Maximum number of items to return
+
+    Returns:
+        The list of items. If the collection holds more than max_items items, a dictionary
+        with the first max_items items and the offset to continue from.
+        None if a page could not be retrieved.
+    """
+    results = []
+    try:
+        async with aclosing(items):
+            async for item in items:
+                if len(results) == max_items:
+                    return truncated(results, max_items)
+                results.append(item)
+    except Tmf620Error as e:
+        logger.warning(f"Failed to list items: {e.detail}")
+        return None
+    return results
+
+
+def truncated(results: list, max_items: int) -> dict:
+    """List tool response for a collection cut off after max_items items."""
+    logger.info(f"List truncated at {max_items} items")
+    return {
+        "items": results,
+        "truncated": True,
+        "next_offset": max_items,
+        "detail": f"Only the first {max_items} items are returned. Use offset and limit to page through the rest.",
+    }
+
+
+@functools.cache
+def token_counter(encoding: str):
+    """Get a function counting the tokens of a text, with the encoder loaded only once.
+
+    tiktoken downloads an encoding on first use. If it cannot be loaded (e.g. without internet
+    access and no TIKTOKEN_CACHE_DIR), tokens are estimated as four bytes each.
+    """
+    try:
+        encoder = tiktoken.get_encoding(encoding)
+    except Exception as e:
+        logger.warning(f"Estimating token counts, encoding {encoding} unavailable: {e}")
+        return lambda text: (len(text.encode("utf-8")) + 3) // 4
+    return lambda text: len(encoder.encode_ordinary(text))
+
+
+def fit_tokens(values, max_tokens: int) -> tuple[int, int]:
+    """Count how many values, serialized as JSON one by one, fit in a token budget.
+
+    Serialization stops at the first value that does not fit; at least one value is always
+    counted, so that a caller paging through a list makes progress.
+
+    Returns:
+        Number of values that fit and the tokens they use
+    """
+    count = token_counter(MCP_TOKEN_ENCODING)
+    fitted, used = 0, 1
+    for value in values:
+        tokens = count(json.dumps(value, ensure_ascii=False)) + 1
+        if fitted and used + tokens > max_tokens:
+            break
+        fitted, used = fitted + 1, used + tokens
+    return fitted, used
+
+
+def apply_token_budget(result, max_tokens: int = None, offset: int = None):
+    """Cut a list result of a tool to a token budget.
+
+    Args:
+        result: List of items, or truncated list, returned by a tool; other results are
+            returned unchanged
+        max_tokens: Token budget (default: MCP_MAX_TOKENS; 0 or less: no budget)
+        offset: Offset the list was requested from
+
+    Returns:
+        The result if it fits, else a dictionary with the items that fit, the offset to
+        continue from and the number of omitted items
+    """
+    max_tokens = MCP_MAX_TOKENS if max_tokens is None else max_tokens
+    if max_tokens <= 0:
+        return result
+    more = isinstance(result, dict) and result.get("truncated")
+    items = result["items"] if more else result
+    if not isinstance(items, list):
+        return result
+    fitted, used = fit_tokens(items, max_tokens)
+    if fitted == len(items):
+        return result
+    next_offset = (offset or 0) + fitted
+    omitted = len(items) - fitted
+    logger.info(f"List cut to {fitted} items ({used} tokens), {omitted} omitted")
+    return {
+        "items": items[:fitted],
+        "truncated": True,
+        "next_offset": next_offset,
+        "omitted": omitted,
+        "tokens": used,
+        "detail": f"Only the first {fitted} items fit in {max_tokens} tokens; {omitted}{' or more' if more else ''} items were omitted. Use offset={next_offset} to continue, or select fewer fields.",
+    }
+
+
+def compact_value(value):
+    """Strip the parts of a TMF620 payload that agents rarely need.
+
+    Drops COMPACT_DROPPED_FIELDS, null fields and empty arrays and objects at any depth. A
+    reference with an href but no id keeps the ID taken from the href.
+    """
+    if isinstance(value, list):
+        return [compact_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for name, item in value.items():
+        if name in COMPACT_DROPPED_FIELDS:
+            continue
+        item = compact_value(item)
+        if item is None or item == [] or item == {}:
+            continue
+        result[name] = item
+    if "id" not in result and isinstance(value.get("href"), str):
+        result = {"id": value["href"].rstrip("/").rsplit("/", 1)[-1], **result}
+    return result
+
+
+def price_summary(price: dict) -> dict:
+    """A price reduced to its name, type and amount (the format of product_offering_search)."""
+    return {
+        "id": price.get("id"),
+        "name": price.get("name"),
+        "priceType": price.get("priceType"),
+        **(price.get("price") or {}),
+    }
+
+
+def summarize(resource: str, document: dict) -> dict:
+    """Reduce a resource to the SUMMARY_FIELDS of its type.
+
+    References are reduced to IDs, and an offering's productOfferingPrice to a "prices" list
+    of price summaries (with amounts if the prices were expanded).
+    """
+    summary = {}
+    for field in SUMMARY_FIELDS[resource]:
+        value = document.get(field)
+        if field == "productOfferingPrice":
+            prices = value if isinstance(value, list) else [value] if value else []
+            summary["prices"] = [price_summary(p) for p in prices]
+        elif field == "price" and isinstance(value, dict):
+            summary.update(value)
+        elif isinstance(value, dict) and "id" in value:
+            summary[field] = value["id"]
+        elif isinstance(value, list) and all(
+            isinstance(v, dict) and "id" in v for v in value
+        ):
+            summary[field] = [v["id"] for v in value]
+        else:
+            summary[field] = value
+    return compact_value(summary)
+
+
+def project_result(result, resource: str, compact: bool, summary: bool = False):
+    """Apply the compact or summary projection to a *_get tool result.
+
+    Args:
+        result: Resource, list of resources or truncated list returned by the tool
+        resource: TMF620 resource path of the result (e.g. "productOffering")
+        compact: Strip links, schema metadata and empty fields (see compact_value)
+        summary: Reduce each resource to its summary (see summarize)
+
+    Returns:
+        The projected result; error objects are returned unchanged
+    """
+    if isinstance(result, dict) and "error" in result:
+        return result
+    if summary:
+        transform = functools.partial(summarize, resource)
+    elif compact:
+        transform = compact_value
+    else:
+        return result
+    if isinstance(result, dict) and result.get("truncated"):
+        return {**result, "items": [transform(item) for item in result["items"]]}
+    if isinstance(result, list):
+        return [transform(item) for item in result]
+    return transform(result)
+
+
+def table_columns(resource: str, columns: str = None, fields: str = None) -> list[str]:
+    """Columns of a format="table" result: the requested ones, else id and the selected
+    fields, else the TABLE_COLUMNS of the resource type."""
+    if columns:
+        return [c.strip() for c in columns.split(",") if c.strip()]
+    if fields:
+        selected = [f.strip() for f in fields.split(",") if f.strip()]
+        return list(dict.fromkeys(["id", *selected]))
+    return list(TABLE_COLUMNS[resource])
+
+
+def table_fields(columns: list[str]) -> str:
+    """fields query parameter selecting the top-level fields that the columns read."""
+    return ",".join(dict.fromkeys(column.split(".")[0] for column in columns))
+
+
+def table_cell(document: dict, path: str) -> str:
+    """Value of a dotted path in a resource, flattened to a table cell.
+
+    Lists are followed element by element, and their values joined with
+    TABLE_LIST_SEPARATOR (e.g. category.id gives the IDs of all categories).
+    """
+    values = [document]
+    for name in path.split("."):
+        found = []
+        for value in values:
+            value = value.get(name) if isinstance(value, dict) else None
+            found.extend(value if isinstance(value, list) else [value])
+        values = [value for value in found if value is not None]
+    cells = []
+    for value in values:
+        if isinstance(value, bool):
+            cells.append("true" if value else "false")
+        elif isinstance(value, (dict, list)):
+            cells.append(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+        else:
+            cells.append(str(value))
+    return TABLE_LIST_SEPARATOR.join(cells)
+
+
+def check_format(format: str) -> dict | None:
+    """Error object for a format argument that is not one of OUTPUT_FORMATS, else None."""
+    if format in OUTPUT_FORMATS:
+        return None
+    return Tmf620Error(
+        400, f"Unknown format {format!r}, use one of: {', '.join(OUTPUT_FORMATS)}"
+    ).to_dict()
+
+
+async def iterate(items):
+    """Iterate over a list, iterator or async iterator of items."""
+    if hasattr(items, "__aiter__"):
+        async with aclosing(items):
+            async for item in items:
+                yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def table_result(
+    columns: list[str],
+    items,
+    max_tokens: int = None,
+    offset: int = None,
+    max_items: int = None,
+):
+    """Serialize a list result as CSV with a header row and one row per resource.
+
+    Rows are written as the items arrive, so a collection streamed from the API or read from
+    the local catalog is never collected into a list first. The token budget is applied row
+    by row; a cut table ends with a comment line giving the offset to continue from.
+
+    Args:
+        columns: Dotted paths of the columns (see table_cell)
+        items: Resource, list of resources, truncated list, iterator or async iterator
+        max_tokens: Token budget (default: MCP_MAX_TOKENS; 0 or less: no budget)
+        offset: Offset the list was requested from
+        max_items: Optional maximum number of rows, as collect_items applies to a whole
+            collection streamed without offset and limit
+
+    Returns:
+        The CSV text, or the error object if the result is an error
+    """
+    if isinstance(items, dict):
+        if "error" in items:
+            return items
+        items = items["items"] if items.get("truncated") else [items]
+    max_tokens = MCP_MAX_TOKENS if max_tokens is None else max_tokens
+    count = token_counter(MCP_TOKEN_ENCODING)
+    table, line = io.StringIO(), io.StringIO()
+    writer = csv.writer(line, lineterminator="\n")
+    writer.writerow(columns)
+    table.write(line.getvalue())
+    used, rows = count(line.getvalue()), 0
+    try:
+        async with aclosing(iterate(items)) as documents:
+            async for document in documents:
+                if max_items is not None and rows == max_items:
+                    logger.info(f"Table truncated at {max_items} rows")
+                    table.write(
+                        f"# Only the first {max_items} rows are returned. "
+                        f"Use offset and limit to page through the rest.\n"
+                    )
+                    break
+                line.seek(0)
+                line.truncate()
+                writer.writerow([table_cell(document, column) for column in columns])
+                row = line.getvalue()
+                if max_tokens > 0:
+                    tokens = count(row)
+                    if rows and used + tokens > max_tokens:
+                        next_offset = (offset or 0) + rows
+                        logger.info(f"Table cut to {rows} rows ({used} tokens)")
+                        table.write(
+                            f"# Only the first {rows} rows fit in {max_tokens} tokens. "
+                            f"Use offset={next_offset} to continue, or select fewer columns.\n"
+                        )
+                        break
+                    used += tokens
+                table.write(row)
+                rows += 1
+    except Tmf620Error as e:
+        logger.warning(f"Failed to list items: {e.detail}")
+        return e.to_dict()
+    return table.getvalue()
+
+
+def local_view():
+    """The catalog graph if it is built, else the catalog snapshot if one is mapped."""
+    if catalog_graph is not None and catalog_graph.ready:
+        return catalog_graph
+    if catalog_snapshot is not None and catalog_snapshot.ready:
+        return catalog_snapshot
+    return None
+
+
+def local_read(
+    resource: str,
+    resource_id: str = None,
+    fields: str = None,
+    offset: int = None,
+    limit: int = None,
+    filter: dict = None,
+):
+    """Answer a *_get tool call from the catalog graph or snapshot, if one is ready.
+
+    Lists filtered by an exact name are answered locally (from the name index of a
+    snapshot). Other filtered queries and IDs the local copy does not hold are left to the
+    Product Catalog API.
+
+    Returns:
+        The tool result, or None if the API has to be called
+    """
+    view = local_view()
+    by_name = (
+        not resource_id
+        and list(filter or {}) == ["name"]
+        and isinstance(filter["name"], str)
+    )
+    if view is None or (filter and not by_name):
+        return None
+    if resource_id:
+        document = view.get(resource, resource_id)
+        return project(document, fields) if document is not None else None
+    if offset is None and limit is None:
+        results = view.select(
+            resource, fields, limit=MCP_LIST_MAX_ITEMS + 1, filter=filter
+        )
+        if len(results) > MCP_LIST_MAX_ITEMS:
+            return truncated(results[:MCP_LIST_MAX_ITEMS], MCP_LIST_MAX_ITEMS)
+        return results
+    return view.select(resource, fields, offset, limit, filter)
+
+
+def local_documents(resource: str, filter: dict = None):
+    """Iterator over the resources of one type in the catalog graph or snapshot, if one is
+    ready and no filter is given; None otherwise."""
+    view = local_view()
+    if view is None or filter:
+        return None
+    if view is catalog_graph:
+        # Only the references are copied, so that events applied meanwhile are harmless
+        return iter(list(catalog_graph.documents[resource].values()))
+    return view.documents(resource)
+
+
+def apply_write(resource: str, document: dict = None, removed_id: str = None) -> None:
+    """Apply the result of a write tool to the catalog graph, or to the overlay of the
+    catalog snapshot when there is no graph.
+
+    The reads that follow see the change at once, rather than after the next delta sync or
+    hub event (which never arrives when the server is not registered with the hub).
+
+    Args:
+        resource: TMF620 resource path (e.g. "productOffering")
+        document: Resource returned by a create or update; error results are ignored
+        removed_id: ID of a deleted resource
+    """
+    view = catalog_graph if catalog_graph is not None else catalog_snapshot
+    if view is None:
+        return
+    if removed_id:
+        view.remove(resource, removed_id)
+    elif isinstance(document, dict) and "error" not in document:
+        view.upsert(resource, document)
+
+
+async def maintain_catalog_view(interval: float) -> None:
+    """Load the catalog graph and snapshot on startup and keep them current.
+
+    A mapped snapshot answers reads at once and seeds the delta sync (and the graph), so
+    only the changes made since it was written are fetched. Without a snapshot the graph is
+    built from the API. A delta sync runs every interval seconds, and the snapshot is
+    rewritten after changes, at most every MCP_CATALOG_SNAPSHOT_SAVE_INTERVAL seconds.
+
+    Args:
+        interval: Seconds between two delta syncs; 0 only loads the views
+    """
+    warm = catalog_snapshot is not None and catalog_snapshot.open()
+    if catalog_graph is not None:
+        sync = catalog_graph.sync
+    else:
+        sync = DeltaSync(cache=response_cache, sinks=[catalog_snapshot])
+    if warm:
+        collections = {r: list(catalog_snapshot.documents(r)) for r in RESOURCE_TYPES}
+        if catalog_graph is not None:
+            catalog_graph.load(collections)
+        else:
+            for resource, documents in collections.items():
+                sync.seed(resource, documents)
+    while catalog_graph is not None and not catalog_graph.ready:
+        try:
+            await catalog_graph.build()
+        except Tmf620Error as e:
+            logger.warning(f"Failed to build the catalog graph: {e.detail}")
+            await asyncio.sleep(interval or 30)
+
+    # The first sync catches up with the changes made since the snapshot was written,
+    # including deletions
+    first = True
+    unsaved = catalog_graph is not None and not warm
+    saved_at = time.monotonic()
+    while True:
+        if not first or warm or catalog_graph is None:
+            try:
+                scan_deletions = True if first else None
+                if catalog_graph is not None:
+                    counts = await catalog_graph.refresh(scan_deletions)
+                else:
+                    counts = await sync.sync(scan_deletions)
+                unsaved = unsaved or any(counts.values())
+            except Tmf620Error as e:
+                logger.warning(f"Failed to sync the local catalog: {e.detail}")
+        due = time.monotonic() - saved_at >= MCP_CATALOG_SNAPSHOT_SAVE_INTERVAL
+        if catalog_snapshot is not None and unsaved and (due or not warm):
+            # The file is encoded and synced in a worker thread
+            if catalog_graph is not None:
+                await catalog_snapshot.save_async(
+                    {r: list(d.values()) for r, d in catalog_graph.documents.items()}
+                )
+            else:
+                await catalog_snapshot.save_async()
+            saved_at, unsaved, warm = time.monotonic(), False, True
+        if interval <= 0:
+            return
+        first = False
+        await asyncio.sleep(interval)
+
+
+async def expand_result(result, resource: str, expand: str):
+    """Expand the references of a *_get tool result (see expand_references).
+
+    Args:
+        result: Resource, list of resources or truncated list returned by the tool
+        resource: TMF620 resource path of the result (e.g. "productOffering")
+        expand: Comma-separated reference paths to expand
+
+    Returns:
+        The expanded result, or an error object if a path cannot be expanded
+    """
+    if not expand or not isinstance(result, (dict, list)) or "error" in result:
+        return result
+    try:
+        if isinstance(result, dict) and result.get("truncated"):
+            items = await expand_references(result["items"], resource, expand)
+            return {**result, "items": items}
+        return await expand_references(result, resource, expand)
+    except Tmf620Error as e:
+        logger.warning(f"Failed to expand {expand}: {e.detail}")
+        return e.to_dict()
+
+
+async def create_batch(
+    resource: str, items: list, concurrency: int = None, stop_on_error: bool = False
+) -> dict:
+    """Create a batch of resources for a *_create_batch tool.
+
+    Args:
+        resource: TMF620 resource path (e.g. "productOffering")
+        items: Resources to create
+        concurrency: Optional maximum number of concurrent create requests
+        stop_on_error: Do not start further creates once one has failed
+
+    Returns:
+        A dictionary with the number of created and failed items and the per-item results
+        in input order, or an error object if the batch is too large.
+    """
+    if len(items) > MCP_BATCH_MAX_ITEMS:
+        return {
+            "error": {
+                "status": 413,
+                "detail": f"A batch can hold at most {MCP_BATCH_MAX_ITEMS} items, got {len(items)}. Split it into several calls.",
+            }
+        }
+    results = await create_many(resource, items, concurrency, stop_on_error)
+    failed = sum(1 for result in results if "error" in result)
+    for result in results:
+        apply_write(resource, result)
+    logger.info(f"Created {len(results) - failed} of {len(items)} {resource} items")
+    return {"created": len(results) - failed, "failed": failed, "results": results}
+
 
 @mcp.tool()
+@fail_fast("catalog")
 async def catalog_get(
     catalog_id: str = None,
     fields: str = None,
     offset: int = None,
     limit: int = None,
     filter: dict = None,
-) -> dict:
+    expand: str = None,
+    compact: bool = None,
+    summary: bool = False,
+    max_tokens: int = None,
+    format: str = "json",
+    columns: str = None,
+) -> dict | str:
     """Retrieve catalog information from the TM Forum Product Catalog Management API.
 
     Args:
         catalog_id: Optional ID of a specific catalog to retrieve.
         fields: Optional comma-separated list of field names to include in the response.
         offset: Optional offset for pagination.
-        limit: Optional limit for pagination.
+        limit: Optional limit for pagination. If neither offset nor limit is given, all items are
+               returned, fetched page by page (very large lists are truncated).
         filter: Optional dictionary of filter criteria to narrow down the results.
                Examples:
                - {"name": "Wholesale"} - Find catalogs with name containing "Wholesale"
                - {"lifecycleStatus": "Active"} - Find active catalogs
                - {"name": "Retail", "lifecycleStatus": "Active"} - Find active catalogs with name containing "Retail"
+        expand: Optional comma-separated list of references to resolve, replacing each reference with the referenced
+                resource. Expandable: category. Dotted paths expand nested references, e.g. "category.productOffering".
+        compact: Optional; strip href, @schemaLocation, @baseType, @referredType, null fields and empty arrays from the
+                 result. On by default for lists, off for a single resource.
+        summary: Optional; reduce each resource to a summary with its ID, name, lifecycle status and key references.
+        max_tokens: Optional token budget of a list result (default: MCP_MAX_TOKENS). A longer list is cut and
+                    returned with next_offset to continue from and the number of omitted items.
+        format: Optional output format, "json" (default) or "table". A table is CSV text with a header row and one
+                row per resource; it does not repeat the field names and is much shorter for long lists. compact and
+                summary do not apply to tables.
+        columns: Optional comma-separated columns of a table, as dotted paths into the resource, e.g. "id,name,category.id".
+                 Values of lists are joined with "|". Default: id and the selected fields, or
+                 id,name,lifecycleStatus,version,category.id.
 
     Returns:
         A dictionary containing the catalog data or a list of catalogs.
+        CSV text if format is "table".
         Returns null if an error occurs.
     """
     if filter:
@@ -109,16 +829,53 @@ async def catalog_get(
         logger.info(
             f"MCP Tool - Getting catalog with ID: {catalog_id if catalog_id else 'ALL'}"
         )
-    result = await get_catalog(
-        catalog_id=catalog_id, fields=fields, offset=offset, limit=limit, filter=filter
-    )
+    error = check_format(format)
+    if error:
+        return error
+    if (
+        format == "table"
+        and not catalog_id
+        and offset is None
+        and limit is None
+        and not expand
+    ):
+        # Write the rows while the collection is read, without collecting it first
+        columns = table_columns("catalog", columns, fields)
+        documents = local_documents("catalog", filter) or iter_catalogs(
+            fields=table_fields(columns), filter=filter
+        )
+        return await table_result(
+            columns, documents, max_tokens, max_items=MCP_LIST_MAX_ITEMS
+        )
+    result = local_read("catalog", catalog_id, fields, offset, limit, filter)
+    if result is not None:
+        logger.info("MCP Tool - Answered from the local catalog")
+    elif catalog_id or offset is not None or limit is not None:
+        result = await get_catalog(
+            catalog_id=catalog_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    else:
+        # Stream the whole collection page by page
+        result = await collect_items(iter_catalogs(fields=fields, filter=filter))
     if result == None:
         logger.warning("Failed to retrieve catalog data")
         return {"error": "Failed to retrieve catalog data"}
-    return result
+    result = await expand_result(result, "catalog", expand)
+    if format == "table":
+        return await table_result(
+            table_columns("catalog", columns, fields), result, max_tokens, offset
+        )
+    compact = not catalog_id if compact is None else compact
+    result = project_result(result, "catalog", compact, summary)
+    return apply_token_budget(result, max_tokens, offset)
 
 
 @mcp.tool()
+@fail_fast("catalog")
 async def catalog_create(catalog_data: dict) -> dict:
     """Create a new catalog in the TM Forum Product Catalog Management API.
 
@@ -147,10 +904,32 @@ async def catalog_create(catalog_data: dict) -> dict:
         }
 
     # Success case
+    apply_write("catalog", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("catalog")
+async def catalog_create_batch(
+    items: list[dict], concurrency: int = None, stop_on_error: bool = False
+) -> dict:
+    """Create several catalogs in one call in the TM Forum Product Catalog Management API.
+
+    Args:
+        items: List of dictionaries, each containing the data of one catalog according to the TMF620 specification.
+        concurrency: Optional maximum number of catalogs created at the same time.
+        stop_on_error: If true, no further catalogs are created once one has failed.
+
+    Returns:
+        A dictionary with the number of created and failed items and a "results" list with,
+        for each item in the same order, the created catalog or an error object with status code and detailed message.
+    """
+    logger.info(f"MCP Tool - Creating a batch of {len(items)} catalogs")
+    return await create_batch("catalog", items, concurrency, stop_on_error)
+
+
+@mcp.tool()
+@fail_fast("catalog")
 async def catalog_update(catalog_id: str, catalog_data: dict) -> dict:
     """Update an existing catalog in the TM Forum Product Catalog Management API.
 
@@ -167,10 +946,12 @@ async def catalog_update(catalog_id: str, catalog_data: dict) -> dict:
     if result == None:
         logger.warning(f"Failed to update catalog with ID: {catalog_id}")
         return {"error": f"Failed to update catalog with ID: {catalog_id}"}
+    apply_write("catalog", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("catalog")
 async def catalog_delete(catalog_id: str) -> dict:
     """Delete a catalog from the TM Forum Product Catalog Management API.
 
@@ -182,38 +963,112 @@ async def catalog_delete(catalog_id: str) -> dict:
     """
     logger.info(f"MCP Tool - Deleting catalog with ID: {catalog_id}")
     result = await delete_catalog(catalog_id)
-    if result == None:
+    # The API function returns False when the deletion failed
+    if not result:
         logger.warning(f"Failed to delete catalog with ID: {catalog_id}")
         return {
             "success": False,
             "error": f"Failed to delete catalog with ID: {catalog_id}",
         }
+    apply_write("catalog", removed_id=catalog_id)
     return {"success": True, "message": f"Catalog {catalog_id} deleted successfully"}
 
 
 @mcp.tool()
+@fail_fast("catalog")
+async def catalog_cleanup(
+    catalog_id: str = None, confirm: bool = False, ctx: Context = None
+) -> dict:
+    """Delete a catalog with everything reachable from it, or every resource in the TM Forum Product Catalog Management API.
+
+    With a catalog ID, the catalog is deleted together with its categories and sub-categories, the product offerings in
+    those categories, and the specifications and prices of those offerings. Resources also used outside the catalog are kept.
+    Without a catalog ID, ALL catalogs, categories, specifications, offerings and prices are deleted.
+
+    Args:
+        catalog_id: Optional ID of the catalog to delete. If omitted, the whole product catalog is emptied.
+        confirm: Must be true to delete. If false, nothing is deleted and the number of resources that would be deleted is returned.
+
+    Returns:
+        Without confirmation, the number of resources per type that would be deleted.
+        With confirmation, the number of deleted resources per type and the resources that could not be deleted.
+    """
+    scope = f"catalog {catalog_id}" if catalog_id else "all resources"
+    logger.info(f"MCP Tool - Cleanup of {scope} (confirm={confirm})")
+    try:
+        plan = await plan_cleanup(catalog_id)
+    except Tmf620Error as e:
+        return e.to_dict()
+    counts = {resource: len(ids) for resource, ids in plan.items()}
+    if not confirm:
+        return {
+            "confirmed": False,
+            "would_delete": counts,
+            "message": f"Nothing was deleted. Call again with confirm=true to delete {sum(counts.values())} resources.",
+        }
+
+    async def progress(done: int, total: int) -> None:
+        # Progress notifications are best effort; there is no request context when the
+        # tool is called directly rather than through an MCP session
+        try:
+            await ctx.report_progress(done, total)
+        except (AttributeError, ValueError):
+            pass
+
+    result = await run_cleanup(plan, progress=progress)
+    failed = {(item["resource"], item["id"]) for item in result["failed"]}
+    for resource, resource_ids in plan.items():
+        for resource_id in resource_ids:
+            if (resource, resource_id) not in failed:
+                apply_write(resource, removed_id=resource_id)
+    return {"confirmed": True, **result}
+
+
+@mcp.tool()
+@fail_fast("category")
 async def category_get(
     category_id: str = None,
     fields: str = None,
     offset: int = None,
     limit: int = None,
     filter: dict = None,
-) -> dict:
+    expand: str = None,
+    compact: bool = None,
+    summary: bool = False,
+    max_tokens: int = None,
+    format: str = "json",
+    columns: str = None,
+) -> dict | str:
     """Retrieve category information from the TM Forum Product Catalog Management API.
 
     Args:
         category_id: Optional ID of a specific category to retrieve.
         fields: Optional comma-separated list of field names to include in the response.
         offset: Optional offset for pagination.
-        limit: Optional limit for pagination.
+        limit: Optional limit for pagination. If neither offset nor limit is given, all items are
+               returned, fetched page by page (very large lists are truncated).
         filter: Optional dictionary of filter criteria to narrow down the results.
                Examples:
                - {"name": "Wholesale"} - Find categories with name containing "Wholesale"
                - {"lifecycleStatus": "Active"} - Find active categories
                - {"name": "Fiber", "lifecycleStatus": "Active"} - Find active categories with name containing "Fiber"
+        expand: Optional comma-separated list of references to resolve, replacing each reference with the referenced
+                resource. Expandable: subCategory, productOffering. Dotted paths expand nested references, e.g. "productOffering.productOfferingPrice".
+        compact: Optional; strip href, @schemaLocation, @baseType, @referredType, null fields and empty arrays from the
+                 result. On by default for lists, off for a single resource.
+        summary: Optional; reduce each resource to a summary with its ID, name, lifecycle status and key references.
+        max_tokens: Optional token budget of a list result (default: MCP_MAX_TOKENS). A longer list is cut and
+                    returned with next_offset to continue from and the number of omitted items.
+        format: Optional output format, "json" (default) or "table". A table is CSV text with a header row and one
+                row per resource; it does not repeat the field names and is much shorter for long lists. compact and
+                summary do not apply to tables.
+        columns: Optional comma-separated columns of a table, as dotted paths into the resource, e.g. "id,name,lifecycleStatus".
+                 Values of lists are joined with "|". Default: id and the selected fields, or
+                 id,name,lifecycleStatus,isRoot,parentId.
 
     Returns:
         A dictionary containing the category data or a list of categories.
+        CSV text if format is "table".
         Returns an error dictionary if an error occurs.
     """
     if filter:
@@ -222,20 +1077,53 @@ async def category_get(
         logger.info(
             f"MCP Tool - Getting category with ID: {category_id if category_id else 'ALL'}"
         )
-    result = await get_category(
-        category_id=category_id,
-        fields=fields,
-        offset=offset,
-        limit=limit,
-        filter=filter,
-    )
+    error = check_format(format)
+    if error:
+        return error
+    if (
+        format == "table"
+        and not category_id
+        and offset is None
+        and limit is None
+        and not expand
+    ):
+        # Write the rows while the collection is read, without collecting it first
+        columns = table_columns("category", columns, fields)
+        documents = local_documents("category", filter) or iter_categories(
+            fields=table_fields(columns), filter=filter
+        )
+        return await table_result(
+            columns, documents, max_tokens, max_items=MCP_LIST_MAX_ITEMS
+        )
+    result = local_read("category", category_id, fields, offset, limit, filter)
+    if result is not None:
+        logger.info("MCP Tool - Answered from the local catalog")
+    elif category_id or offset is not None or limit is not None:
+        result = await get_category(
+            category_id=category_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    else:
+        # Stream the whole collection page by page
+        result = await collect_items(iter_categories(fields=fields, filter=filter))
     if result == None:
         logger.warning("Failed to retrieve category data")
         return {"error": "Failed to retrieve category data"}
-    return result
+    result = await expand_result(result, "category", expand)
+    if format == "table":
+        return await table_result(
+            table_columns("category", columns, fields), result, max_tokens, offset
+        )
+    compact = not category_id if compact is None else compact
+    result = project_result(result, "category", compact, summary)
+    return apply_token_budget(result, max_tokens, offset)
 
 
 @mcp.tool()
+@fail_fast("category")
 async def category_create(category_data: dict) -> dict:
     """Create a new category in the TM Forum Product Catalog Management API.
 
@@ -264,10 +1152,32 @@ async def category_create(category_data: dict) -> dict:
         }
 
     # Success case
+    apply_write("category", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("category")
+async def category_create_batch(
+    items: list[dict], concurrency: int = None, stop_on_error: bool = False
+) -> dict:
+    """Create several categories in one call in the TM Forum Product Catalog Management API.
+
+    Args:
+        items: List of dictionaries, each containing the data of one category according to the TMF620 specification.
+        concurrency: Optional maximum number of categories created at the same time.
+        stop_on_error: If true, no further categories are created once one has failed.
+
+    Returns:
+        A dictionary with the number of created and failed items and a "results" list with,
+        for each item in the same order, the created category or an error object with status code and detailed message.
+    """
+    logger.info(f"MCP Tool - Creating a batch of {len(items)} categories")
+    return await create_batch("category", items, concurrency, stop_on_error)
+
+
+@mcp.tool()
+@fail_fast("category")
 async def category_update(category_id: str, category_data: dict) -> dict:
     """Update an existing category in the TM Forum Product Catalog Management API.
 
@@ -284,10 +1194,12 @@ async def category_update(category_id: str, category_data: dict) -> dict:
     if result == None:
         logger.warning(f"Failed to update category with ID: {category_id}")
         return {"error": f"Failed to update category with ID: {category_id}"}
+    apply_write("category", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("category")
 async def category_delete(category_id: str) -> dict:
     """Delete a category from the TM Forum Product Catalog Management API.
 
@@ -305,32 +1217,52 @@ async def category_delete(category_id: str) -> dict:
             "success": False,
             "error": f"Failed to delete category with ID: {category_id}",
         }
+    apply_write("category", removed_id=category_id)
     return {"success": True, "message": f"Category {category_id} deleted successfully"}
 
 
 @mcp.tool()
+@fail_fast("productSpecification")
 async def product_specification_get(
     product_specification_id: str = None,
     fields: str = None,
     offset: int = None,
     limit: int = None,
     filter: dict = None,
-) -> dict:
+    compact: bool = None,
+    summary: bool = False,
+    max_tokens: int = None,
+    format: str = "json",
+    columns: str = None,
+) -> dict | str:
     """Retrieve product specification information from the TM Forum Product Catalog Management API.
 
     Args:
         product_specification_id: Optional ID of a specific product specification to retrieve.
         fields: Optional comma-separated list of field names to include in the response.
         offset: Optional offset for pagination.
-        limit: Optional limit for pagination.
+        limit: Optional limit for pagination. If neither offset nor limit is given, all items are
+               returned, fetched page by page (very large lists are truncated).
         filter: Optional dictionary of filter criteria to narrow down the results.
                Examples:
                - {"name": "Fiber"} - Find product specifications with name containing "Fiber"
                - {"lifecycleStatus": "Active"} - Find active product specifications
                - {"name": "Internet", "lifecycleStatus": "Active"} - Find active product specifications with name containing "Internet"
+        compact: Optional; strip href, @schemaLocation, @baseType, @referredType, null fields and empty arrays from the
+                 result. On by default for lists, off for a single resource.
+        summary: Optional; reduce each resource to a summary with its ID, name, lifecycle status and key references.
+        max_tokens: Optional token budget of a list result (default: MCP_MAX_TOKENS). A longer list is cut and
+                    returned with next_offset to continue from and the number of omitted items.
+        format: Optional output format, "json" (default) or "table". A table is CSV text with a header row and one
+                row per resource; it does not repeat the field names and is much shorter for long lists. compact and
+                summary do not apply to tables.
+        columns: Optional comma-separated columns of a table, as dotted paths into the resource, e.g. "id,name,lifecycleStatus".
+                 Values of lists are joined with "|". Default: id and the selected fields, or
+                 id,name,lifecycleStatus,brand,productNumber,version.
 
     Returns:
         A dictionary containing the product specification data or a list of product specifications.
+        CSV text if format is "table".
         Returns an error dictionary if an error occurs.
     """
     if filter:
@@ -339,20 +1271,58 @@ async def product_specification_get(
         logger.info(
             f"MCP Tool - Getting product specification with ID: {product_specification_id if product_specification_id else 'ALL'}"
         )
-    result = await get_product_specification(
-        product_specification_id=product_specification_id,
-        fields=fields,
-        offset=offset,
-        limit=limit,
-        filter=filter,
+    error = check_format(format)
+    if error:
+        return error
+    if (
+        format == "table"
+        and not product_specification_id
+        and offset is None
+        and limit is None
+    ):
+        # Write the rows while the collection is read, without collecting it first
+        columns = table_columns("productSpecification", columns, fields)
+        documents = local_documents(
+            "productSpecification", filter
+        ) or iter_product_specifications(fields=table_fields(columns), filter=filter)
+        return await table_result(
+            columns, documents, max_tokens, max_items=MCP_LIST_MAX_ITEMS
+        )
+    result = local_read(
+        "productSpecification", product_specification_id, fields, offset, limit, filter
     )
+    if result is not None:
+        logger.info("MCP Tool - Answered from the local catalog")
+    elif product_specification_id or offset is not None or limit is not None:
+        result = await get_product_specification(
+            product_specification_id=product_specification_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    else:
+        # Stream the whole collection page by page
+        result = await collect_items(
+            iter_product_specifications(fields=fields, filter=filter)
+        )
     if result == None:
         logger.warning("Failed to retrieve product specification data")
         return {"error": "Failed to retrieve product specification data"}
-    return result
+    if format == "table":
+        return await table_result(
+            table_columns("productSpecification", columns, fields),
+            result,
+            max_tokens,
+            offset,
+        )
+    compact = not product_specification_id if compact is None else compact
+    result = project_result(result, "productSpecification", compact, summary)
+    return apply_token_budget(result, max_tokens, offset)
 
 
 @mcp.tool()
+@fail_fast("productSpecification")
 async def product_specification_create(product_specification_data: dict) -> dict:
     """Create a new product specification in the TM Forum Product Catalog Management API.
 
@@ -499,10 +1469,32 @@ async def product_specification_create(product_specification_data: dict) -> dict
         }
 
     # Success case
+    apply_write("productSpecification", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("productSpecification")
+async def product_specification_create_batch(
+    items: list[dict], concurrency: int = None, stop_on_error: bool = False
+) -> dict:
+    """Create several product specifications in one call in the TM Forum Product Catalog Management API.
+
+    Args:
+        items: List of dictionaries, each containing the data of one product specification according to the TMF620 specification.
+        concurrency: Optional maximum number of product specifications created at the same time.
+        stop_on_error: If true, no further product specifications are created once one has failed.
+
+    Returns:
+        A dictionary with the number of created and failed items and a "results" list with,
+        for each item in the same order, the created product specification or an error object with status code and detailed message.
+    """
+    logger.info(f"MCP Tool - Creating a batch of {len(items)} product specifications")
+    return await create_batch("productSpecification", items, concurrency, stop_on_error)
+
+
+@mcp.tool()
+@fail_fast("productSpecification")
 async def product_specification_update(
     product_specification_id: str, product_specification_data: dict
 ) -> dict:
@@ -529,10 +1521,12 @@ async def product_specification_update(
         return {
             "error": f"Failed to update product specification with ID: {product_specification_id}"
         }
+    apply_write("productSpecification", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("productSpecification")
 async def product_specification_delete(product_specification_id: str) -> dict:
     """Delete a product specification from the TM Forum Product Catalog Management API.
 
@@ -546,7 +1540,8 @@ async def product_specification_delete(product_specification_id: str) -> dict:
         f"MCP Tool - Deleting product specification with ID: {product_specification_id}"
     )
     result = await delete_product_specification(product_specification_id)
-    if result == None:
+    # The API function returns False when the deletion failed
+    if not result:
         logger.warning(
             f"Failed to delete product specification with ID: {product_specification_id}"
         )
@@ -554,6 +1549,7 @@ async def product_specification_delete(product_specification_id: str) -> dict:
             "success": False,
             "error": f"Failed to delete product specification with ID: {product_specification_id}",
         }
+    apply_write("productSpecification", removed_id=product_specification_id)
     return {
         "success": True,
         "message": f"Product specification {product_specification_id} deleted successfully",
@@ -561,28 +1557,51 @@ async def product_specification_delete(product_specification_id: str) -> dict:
 
 
 @mcp.tool()
+@fail_fast("productOffering")
 async def product_offering_get(
     product_offering_id: str = None,
     fields: str = None,
     offset: int = None,
     limit: int = None,
     filter: dict = None,
-) -> dict:
+    expand: str = None,
+    compact: bool = None,
+    summary: bool = False,
+    max_tokens: int = None,
+    format: str = "json",
+    columns: str = None,
+) -> dict | str:
     """Retrieve product offering information from the TM Forum Product Catalog Management API.
 
     Args:
         product_offering_id: Optional ID of a specific product offering to retrieve.
         fields: Optional comma-separated list of field names to include in the response.
         offset: Optional offset for pagination.
-        limit: Optional limit for pagination.
+        limit: Optional limit for pagination. If neither offset nor limit is given, all items are
+               returned, fetched page by page (very large lists are truncated).
         filter: Optional dictionary of filter criteria to narrow down the results.
                Examples:
                - {"name": "Basic Internet"} - Find product offerings with name containing "Basic Internet"
                - {"lifecycleStatus": "Active"} - Find active product offerings
                - {"name": "Fiber", "lifecycleStatus": "Active"} - Find active product offerings with name containing "Fiber"
+        expand: Optional comma-separated list of references to resolve, replacing each reference with the referenced
+                resource. Expandable: productSpecification, productOfferingPrice, category,
+                bundledProductOffering. Dotted paths expand nested references, e.g. "productSpecification,productOfferingPrice".
+        compact: Optional; strip href, @schemaLocation, @baseType, @referredType, null fields and empty arrays from the
+                 result. On by default for lists, off for a single resource.
+        summary: Optional; reduce each resource to a summary with its ID, name, lifecycle status and key references.
+        max_tokens: Optional token budget of a list result (default: MCP_MAX_TOKENS). A longer list is cut and
+                    returned with next_offset to continue from and the number of omitted items.
+        format: Optional output format, "json" (default) or "table". A table is CSV text with a header row and one
+                row per resource; it does not repeat the field names and is much shorter for long lists. compact and
+                summary do not apply to tables.
+        columns: Optional comma-separated columns of a table, as dotted paths into the resource, e.g. "id,name,category.id".
+                 Values of lists are joined with "|". Default: id and the selected fields, or
+                 id,name,lifecycleStatus,productSpecification.id,category.id,productOfferingPrice.id.
 
     Returns:
         A dictionary containing the product offering data or a list of product offerings.
+        CSV text if format is "table".
         Returns an error dictionary if an error occurs.
     """
     if filter:
@@ -591,20 +1610,63 @@ async def product_offering_get(
         logger.info(
             f"MCP Tool - Getting product offering with ID: {product_offering_id if product_offering_id else 'ALL'}"
         )
-    result = await get_product_offering(
-        product_offering_id=product_offering_id,
-        fields=fields,
-        offset=offset,
-        limit=limit,
-        filter=filter,
+    error = check_format(format)
+    if error:
+        return error
+    if (
+        format == "table"
+        and not product_offering_id
+        and offset is None
+        and limit is None
+        and not expand
+    ):
+        # Write the rows while the collection is read, without collecting it first
+        columns = table_columns("productOffering", columns, fields)
+        documents = local_documents(
+            "productOffering", filter
+        ) or iter_product_offerings(fields=table_fields(columns), filter=filter)
+        return await table_result(
+            columns, documents, max_tokens, max_items=MCP_LIST_MAX_ITEMS
+        )
+    result = local_read(
+        "productOffering", product_offering_id, fields, offset, limit, filter
     )
+    if result is not None:
+        logger.info("MCP Tool - Answered from the local catalog")
+    elif product_offering_id or offset is not None or limit is not None:
+        result = await get_product_offering(
+            product_offering_id=product_offering_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    else:
+        # Stream the whole collection page by page
+        result = await collect_items(
+            iter_product_offerings(fields=fields, filter=filter)
+        )
     if result == None:
         logger.warning("Failed to retrieve product offering data")
         return {"error": "Failed to retrieve product offering data"}
-    return result
+    if summary:
+        # Summaries include the price amounts
+        expand = f"{expand},productOfferingPrice" if expand else "productOfferingPrice"
+    result = await expand_result(result, "productOffering", expand)
+    if format == "table":
+        return await table_result(
+            table_columns("productOffering", columns, fields),
+            result,
+            max_tokens,
+            offset,
+        )
+    compact = not product_offering_id if compact is None else compact
+    result = project_result(result, "productOffering", compact, summary)
+    return apply_token_budget(result, max_tokens, offset)
 
 
 @mcp.tool()
+@fail_fast("productOffering")
 async def product_offering_create(product_offering_data: dict) -> dict:
     """Create a new product offering in the TM Forum Product Catalog Management API.
 
@@ -823,10 +1885,32 @@ async def product_offering_create(product_offering_data: dict) -> dict:
         }
 
     # Success case
+    apply_write("productOffering", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("productOffering")
+async def product_offering_create_batch(
+    items: list[dict], concurrency: int = None, stop_on_error: bool = False
+) -> dict:
+    """Create several product offerings in one call in the TM Forum Product Catalog Management API.
+
+    Args:
+        items: List of dictionaries, each containing the data of one product offering according to the TMF620 specification.
+        concurrency: Optional maximum number of product offerings created at the same time.
+        stop_on_error: If true, no further product offerings are created once one has failed.
+
+    Returns:
+        A dictionary with the number of created and failed items and a "results" list with,
+        for each item in the same order, the created product offering or an error object with status code and detailed message.
+    """
+    logger.info(f"MCP Tool - Creating a batch of {len(items)} product offerings")
+    return await create_batch("productOffering", items, concurrency, stop_on_error)
+
+
+@mcp.tool()
+@fail_fast("productOffering")
 async def product_offering_update(
     product_offering_id: str, product_offering_data: dict
 ) -> dict:
@@ -849,10 +1933,12 @@ async def product_offering_update(
         return {
             "error": f"Failed to update product offering with ID: {product_offering_id}"
         }
+    apply_write("productOffering", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("productOffering")
 async def product_offering_delete(product_offering_id: str) -> dict:
     """Delete a product offering from the TM Forum Product Catalog Management API.
 
@@ -864,7 +1950,8 @@ async def product_offering_delete(product_offering_id: str) -> dict:
     """
     logger.info(f"MCP Tool - Deleting product offering with ID: {product_offering_id}")
     result = await delete_product_offering(product_offering_id)
-    if result == None:
+    # The API function returns False when the deletion failed
+    if not result:
         logger.warning(
             f"Failed to delete product offering with ID: {product_offering_id}"
         )
@@ -872,6 +1959,7 @@ async def product_offering_delete(product_offering_id: str) -> dict:
             "success": False,
             "error": f"Failed to delete product offering with ID: {product_offering_id}",
         }
+    apply_write("productOffering", removed_id=product_offering_id)
     return {
         "success": True,
         "message": f"Product offering {product_offering_id} deleted successfully",
@@ -879,28 +1967,47 @@ async def product_offering_delete(product_offering_id: str) -> dict:
 
 
 @mcp.tool()
+@fail_fast("productOfferingPrice")
 async def product_offering_price_get(
     product_offering_price_id: str = None,
     fields: str = None,
     offset: int = None,
     limit: int = None,
     filter: dict = None,
-) -> dict:
+    compact: bool = None,
+    summary: bool = False,
+    max_tokens: int = None,
+    format: str = "json",
+    columns: str = None,
+) -> dict | str:
     """Retrieve product offering price information from the TM Forum Product Catalog Management API.
 
     Args:
         product_offering_price_id: Optional ID of a specific product offering price to retrieve.
         fields: Optional comma-separated list of field names to include in the response.
         offset: Optional offset for pagination.
-        limit: Optional limit for pagination.
+        limit: Optional limit for pagination. If neither offset nor limit is given, all items are
+               returned, fetched page by page (very large lists are truncated).
         filter: Optional dictionary of filter criteria to narrow down the results.
                Examples:
                - {"name": "Monthly Fee"} - Find product offering prices with name containing "Monthly Fee"
                - {"priceType": "recurring"} - Find recurring product offering prices
                - {"name": "Installation", "priceType": "one time"} - Find one-time installation fees
+        compact: Optional; strip href, @schemaLocation, @baseType, @referredType, null fields and empty arrays from the
+                 result. On by default for lists, off for a single resource.
+        summary: Optional; reduce each resource to a summary with its ID, name, lifecycle status and key references.
+        max_tokens: Optional token budget of a list result (default: MCP_MAX_TOKENS). A longer list is cut and
+                    returned with next_offset to continue from and the number of omitted items.
+        format: Optional output format, "json" (default) or "table". A table is CSV text with a header row and one
+                row per resource; it does not repeat the field names and is much shorter for long lists. compact and
+                summary do not apply to tables.
+        columns: Optional comma-separated columns of a table, as dotted paths into the resource, e.g. "id,name,price.value".
+                 Values of lists are joined with "|". Default: id and the selected fields, or
+                 id,name,lifecycleStatus,priceType,price.value,price.unit,recurringChargePeriodType.
 
     Returns:
         A dictionary containing the product offering price data or a list of product offering prices.
+        CSV text if format is "table".
         Returns an error dictionary if an error occurs.
     """
     if filter:
@@ -909,20 +2016,58 @@ async def product_offering_price_get(
         logger.info(
             f"MCP Tool - Getting product offering price with ID: {product_offering_price_id if product_offering_price_id else 'ALL'}"
         )
-    result = await get_product_offering_price(
-        product_offering_price_id=product_offering_price_id,
-        fields=fields,
-        offset=offset,
-        limit=limit,
-        filter=filter,
+    error = check_format(format)
+    if error:
+        return error
+    if (
+        format == "table"
+        and not product_offering_price_id
+        and offset is None
+        and limit is None
+    ):
+        # Write the rows while the collection is read, without collecting it first
+        columns = table_columns("productOfferingPrice", columns, fields)
+        documents = local_documents(
+            "productOfferingPrice", filter
+        ) or iter_product_offering_prices(fields=table_fields(columns), filter=filter)
+        return await table_result(
+            columns, documents, max_tokens, max_items=MCP_LIST_MAX_ITEMS
+        )
+    result = local_read(
+        "productOfferingPrice", product_offering_price_id, fields, offset, limit, filter
     )
+    if result is not None:
+        logger.info("MCP Tool - Answered from the local catalog")
+    elif product_offering_price_id or offset is not None or limit is not None:
+        result = await get_product_offering_price(
+            product_offering_price_id=product_offering_price_id,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            filter=filter,
+        )
+    else:
+        # Stream the whole collection page by page
+        result = await collect_items(
+            iter_product_offering_prices(fields=fields, filter=filter)
+        )
     if result == None:
         logger.warning("Failed to retrieve product offering price data")
         return {"error": "Failed to retrieve product offering price data"}
-    return result
+    if format == "table":
+        return await table_result(
+            table_columns("productOfferingPrice", columns, fields),
+            result,
+            max_tokens,
+            offset,
+        )
+    compact = not product_offering_price_id if compact is None else compact
+    result = project_result(result, "productOfferingPrice", compact, summary)
+    return apply_token_budget(result, max_tokens, offset)
 
 
 @mcp.tool()
+@fail_fast("productOfferingPrice")
 async def product_offering_price_create(product_offering_price_data: dict) -> dict:
     """Create a new product offering price in the TM Forum Product Catalog Management API.
 
@@ -1076,10 +2221,32 @@ async def product_offering_price_create(product_offering_price_data: dict) -> di
         )
         # Return the error with HTTP status code to the MCP client
         return result
+    apply_write("productOfferingPrice", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("productOfferingPrice")
+async def product_offering_price_create_batch(
+    items: list[dict], concurrency: int = None, stop_on_error: bool = False
+) -> dict:
+    """Create several product offering prices in one call in the TM Forum Product Catalog Management API.
+
+    Args:
+        items: List of dictionaries, each containing the data of one product offering price according to the TMF620 specification.
+        concurrency: Optional maximum number of product offering prices created at the same time.
+        stop_on_error: If true, no further product offering prices are created once one has failed.
+
+    Returns:
+        A dictionary with the number of created and failed items and a "results" list with,
+        for each item in the same order, the created product offering price or an error object with status code and detailed message.
+    """
+    logger.info(f"MCP Tool - Creating a batch of {len(items)} product offering prices")
+    return await create_batch("productOfferingPrice", items, concurrency, stop_on_error)
+
+
+@mcp.tool()
+@fail_fast("productOfferingPrice")
 async def product_offering_price_update(
     product_offering_price_id: str, product_offering_price_data: dict
 ) -> dict:
@@ -1106,10 +2273,12 @@ async def product_offering_price_update(
         return {
             "error": f"Failed to update product offering price with ID: {product_offering_price_id}"
         }
+    apply_write("productOfferingPrice", result)
     return result
 
 
 @mcp.tool()
+@fail_fast("productOfferingPrice")
 async def product_offering_price_delete(product_offering_price_id: str) -> dict:
     """Delete a product offering price from the TM Forum Product Catalog Management API.
 
@@ -1123,7 +2292,8 @@ async def product_offering_price_delete(product_offering_price_id: str) -> dict:
         f"MCP Tool - Deleting product offering price with ID: {product_offering_price_id}"
     )
     result = await delete_product_offering_price(product_offering_price_id)
-    if result == None:
+    # The API function returns False when the deletion failed
+    if not result:
         logger.warning(
             f"Failed to delete product offering price with ID: {product_offering_price_id}"
         )
@@ -1131,12 +2301,204 @@ async def product_offering_price_delete(product_offering_price_id: str) -> dict:
             "success": False,
             "error": f"Failed to delete product offering price with ID: {product_offering_price_id}",
         }
+    apply_write("productOfferingPrice", removed_id=product_offering_price_id)
     return {
         "success": True,
         "message": f"Product offering price {product_offering_price_id} deleted successfully",
     }
 
 
+@mcp.tool()
+async def resource_get_many(
+    resource: str,
+    ids: list[str],
+    fields: str = None,
+    compact: bool = True,
+    max_tokens: int = None,
+) -> dict:
+    """Retrieve several resources of one type by ID from the TM Forum Product Catalog Management API in one call.
+
+    Use this instead of calling a *_get tool once per ID, for example to resolve the offerings referenced by a category.
+
+    Args:
+        resource: Resource type, one of "catalog", "category", "productSpecification", "productOffering" or "productOfferingPrice".
+        ids: List of resource IDs. Duplicates are retrieved once.
+        fields: Optional comma-separated list of field names to include in the response.
+        compact: Strip href, @schemaLocation, @baseType, @referredType, null fields and empty arrays (default: true).
+        max_tokens: Optional token budget of the result (default: MCP_MAX_TOKENS).
+
+    Returns:
+        A dictionary keyed by ID. Each value is the resource, or an error object with status code and detailed message;
+        IDs that do not exist have an error with status 404. If the resources do not fit in the token budget, a
+        dictionary with the resources that fit ("results") and the IDs to request in a further call ("omitted_ids").
+    """
+    if resource not in RESOURCE_TYPES:
+        return Tmf620Error(
+            400,
+            f"Unknown resource {resource}, expected one of {', '.join(RESOURCE_TYPES)}",
+        ).to_dict()
+    if len(ids) > MCP_BATCH_MAX_ITEMS:
+        return Tmf620Error(
+            413,
+            f"At most {MCP_BATCH_MAX_ITEMS} IDs can be requested at once, got {len(ids)}",
+        ).to_dict()
+    error = circuit_breaker.rejection(resource)
+    if error is not None:
+        return error.to_dict()
+    logger.info(f"MCP Tool - Getting {len(ids)} {resource} resources by ID")
+    results = {i: local_read(resource, i, fields) for i in dict.fromkeys(ids)}
+    missing = [i for i, result in results.items() if result is None]
+    if missing:
+        results.update(await get_many(resource, missing, fields=fields))
+    if compact:
+        results = {i: project_result(r, resource, True) for i, r in results.items()}
+    max_tokens = MCP_MAX_TOKENS if max_tokens is None else max_tokens
+    fitted, used = fit_tokens(results.values(), max_tokens)
+    if max_tokens <= 0 or fitted == len(results):
+        return results
+    ids = list(results)
+    return {
+        "results": {i: results[i] for i in ids[:fitted]},
+        "truncated": True,
+        "omitted_ids": ids[fitted:],
+        "omitted": len(ids) - fitted,
+        "tokens": used,
+        "detail": f"Only {fitted} resources fit in {max_tokens} tokens. Request omitted_ids in a further call, or select fewer fields.",
+    }
+
+
+async def category_graph(category_id: str) -> CatalogGraph:
+    """Read a category, its sub-categories, their offerings and the offerings' prices.
+
+    Used by product_offering_search while no catalog graph is ready, so that a search reads
+    the part of the catalog it covers rather than every collection.
+
+    Raises:
+        Tmf620Error: If the category does not exist or a collection could not be read
+    """
+    categories = {category_id: await tmf620_client.get("category", category_id)}
+    level = list(categories.values())
+    while level:
+        # Sub-categories are listed by their parent or name it in parentId
+        children = await asyncio.gather(
+            *(
+                tmf620_client.get_all("category", filter={"parentId": c["id"]})
+                for c in level
+            )
+        )
+        found = {c["id"]: c for batch in children for c in batch}
+        listed = {i for c in level for i in reference_ids(c, "subCategory")}
+        missing = listed - found.keys() - categories.keys()
+        if missing:
+            found.update(await get_many("category", sorted(missing)))
+        level = [
+            c for i, c in found.items() if i not in categories and "error" not in c
+        ]
+        categories.update((c["id"], c) for c in level)
+
+    # Offerings are listed by a category or name it in their category references
+    referring = await asyncio.gather(
+        *(
+            tmf620_client.get_all("productOffering", filter={"category.id": i})
+            for i in categories
+        )
+    )
+    offerings = {o["id"]: o for batch in referring for o in batch}
+    listed = {
+        i for c in categories.values() for i in reference_ids(c, "productOffering")
+    }
+    if listed - offerings.keys():
+        offerings.update(
+            await get_many("productOffering", sorted(listed - offerings.keys()))
+        )
+    offerings = {i: o for i, o in offerings.items() if "error" not in o}
+    price_ids = {
+        i for o in offerings.values() for i in reference_ids(o, "productOfferingPrice")
+    }
+    prices = await get_many("productOfferingPrice", sorted(price_ids))
+    return CatalogGraph().load(
+        {
+            "category": list(categories.values()),
+            "productOffering": list(offerings.values()),
+            "productOfferingPrice": [p for p in prices.values() if "error" not in p],
+        }
+    )
+
+
+@mcp.tool()
+async def product_offering_search(
+    category_id: str = None,
+    max_price: float = None,
+    unit: str = None,
+    lifecycle_status: str = None,
+    offset: int = None,
+    max_tokens: int = None,
+    format: str = "json",
+    columns: str = None,
+) -> dict | str:
+    """Find product offerings by category, price and lifecycle status in one call.
+
+    Answers questions such as "which offerings under category X cost less than Y" without walking categories,
+    offerings and prices with the *_get tools.
+
+    Args:
+        category_id: Optional ID of a category. Offerings of its sub-categories are included.
+        max_price: Optional maximum price. An offering matches if at least one of its prices is at or below it.
+        unit: Optional currency the prices are compared in, e.g. "EUR".
+        lifecycle_status: Optional lifecycle status of the offerings, e.g. "Active".
+        offset: Optional number of matching offerings to skip, e.g. the next_offset of a previous call.
+        max_tokens: Optional token budget of the offerings returned (default: MCP_MAX_TOKENS).
+        format: Optional output format, "json" (default) or "table" (CSV text with a header row and one row per
+                offering).
+        columns: Optional comma-separated columns of a table, as dotted paths into the offering summaries.
+                 Values of lists are joined with "|". Default: id,name,lifecycleStatus,productSpecification,
+                 prices.value,prices.unit.
+
+    Returns:
+        A dictionary with the number of matching offerings and, per offering, its ID, name, lifecycle status,
+        product specification ID and prices. If the offerings do not fit in the token budget, also next_offset to
+        continue from and the number of omitted offerings. Returns an error object with status code and detailed
+        message if the catalog could not be read, or if no category_id is given while the catalog graph is not
+        available. CSV text if format is "table".
+    """
+    logger.info(
+        f"MCP Tool - Searching product offerings in category {category_id or 'ALL'} with max price {max_price}"
+    )
+    error = check_format(format)
+    if error:
+        return error
+    if catalog_graph is not None and catalog_graph.ready:
+        offerings = catalog_graph.find_offerings(
+            category_id, max_price, unit, lifecycle_status
+        )
+    elif category_id is None:
+        # Searching every offering would read the whole catalog on each call
+        if catalog_graph is not None:
+            return Tmf620Error(
+                503,
+                "The catalog graph is still being built, retry later or pass a category_id",
+            ).to_dict()
+        return Tmf620Error(
+            400,
+            "Searching the whole catalog requires MCP_CATALOG_GRAPH=true; pass a category_id to search one category",
+        ).to_dict()
+    else:
+        try:
+            graph = await category_graph(category_id)
+        except Tmf620Error as e:
+            logger.warning(f"Failed to search product offerings: {e.detail}")
+            return e.to_dict()
+        # The graph only holds the category tree, so every offering in it is a candidate
+        offerings = graph.find_offerings(None, max_price, unit, lifecycle_status)
+    if format == "table":
+        columns = table_columns("offeringSummary", columns)
+        return await table_result(columns, offerings[offset:], max_tokens, offset)
+    result = apply_token_budget(offerings[offset:], max_tokens, offset)
+    if isinstance(result, list):
+        return {"count": len(offerings), "offerings": result}
+    return {"count": len(offerings), "offerings": result.pop("items"), **result}
+
+
 # ---------------------------------------------------------------------------------------------
 # MCP resource examples
 # These provides examples of how to define resources and their schemas for the TM Forum Product Catalog Management API.
@@ -2866,6 +4228,345 @@ This will help me understand the differences between these product specification
 """
 
 
+# ---------------------------------------------------------------------------------------------
+# Tool catalogue and profiles
+# tools/list is answered with a catalogue built once at import instead of being rebuilt from the
+# tool docstrings on every request. In compact mode the descriptions keep only the summary and
+# the result of each tool; the arguments are documented in the input schema, and the TMF620
+# field documentation of the create tools is replaced by a pointer to the schema:// resources.
+#
+# Tools, resources and prompts belong to families by resource type and by read or write access.
+# The MCP endpoint serves the families selected by MCP_FAMILIES, and every profile in
+# MCP_PROFILES is served at <MCP endpoint>/<profile> with a registry of its own families (e.g.
+# /mcp/readonly), so agents that only read are not sent the write tools, schemas and prompts.
+
+# Send short tool descriptions in tools/list (false: the complete docstrings)
+MCP_COMPACT_DESCRIPTIONS = os.environ.get(
+    "MCP_COMPACT_DESCRIPTIONS", "true"
+).lower() in ("1", "true", "yes")
+
+# Families served at the MCP endpoint: "read", "write" and resource paths, comma-separated
+# (empty: all), e.g. "read,productOffering,productOfferingPrice"
+MCP_FAMILIES = os.environ.get("MCP_FAMILIES", "")
+# Further endpoints as profile=families entries separated by ";" (empty: none)
+MCP_PROFILES = os.environ.get("MCP_PROFILES", "readonly=read")
+
+# Resource path of the schema://tmf620/... resource documenting a tool's data, by tool name prefix
+TOOL_SCHEMAS = {
+    "product_offering_price": "productOfferingPrice",
+    "product_offering": "productOffering",
+    "product_specification": "productSpecification",
+    "category": "category",
+    "catalog": "catalog",
+}
+
+
+def parse_docstring(
+    docstring: str, parameters: list[str]
+) -> tuple[str, dict[str, str], str, set[str]]:
+    """Split a tool docstring into its summary, argument descriptions and Returns section.
+
+    Arguments are the lines of the Args section starting with a parameter name, followed by
+    their indented continuation lines. An inline schema ("properties:" block) ends the
+    description of its argument.
+
+    Returns:
+        Summary, description per argument, Returns text and the arguments that had a schema
+    """
+    summary, arguments, returns, schemas = [], {}, [], set()
+    section, current = summary, None
+    for line in inspect.cleandoc(docstring or "").splitlines():
+        stripped = line.strip()
+        if not line.startswith(" ") and stripped in ("Args:", "Returns:", "Raises:"):
+            section = {"Args:": arguments, "Returns:": returns}.get(stripped)
+            current = None
+            continue
+        if section is arguments:
+            name, _, text = stripped.partition(":")
+            if line.startswith("    ") and name in parameters and current != name:
+                current = name
+                arguments[name] = [text.strip()]
+            elif stripped == "properties:" and current is not None:
+                schemas.add(current)
+                current = None
+            elif current is not None and stripped:
+                arguments[current].append(stripped)
+        elif section is not None:
+            section.append(stripped)
+
+    def join(lines: list[str]) -> str:
+        # Paragraphs are kept, and lines starting with "- {" (filter examples) as list items
+        paragraphs = "\n".join(lines).split("\n\n")
+        text = "\n\n".join(" ".join(p.split()) for p in paragraphs if p.strip())
+        return re.sub(r" (- \{)", r"\n\1", text)
+
+    return (
+        join(summary),
+        {name: join(lines) for name, lines in arguments.items()},
+        join(returns),
+        schemas,
+    )
+
+
+def compact_tool(tool) -> types.Tool:
+    """tools/list entry of a tool with a short description and documented input schema."""
+    properties = tool.parameters.get("properties", {})
+    summary, arguments, returns, schemas = parse_docstring(
+        tool.description, list(properties)
+    )
+    resource = next(
+        (r for prefix, r in TOOL_SCHEMAS.items() if tool.name.startswith(prefix)),
+        None,
+    )
+    schema = dict(tool.parameters, properties={})
+    for name, property in properties.items():
+        description = arguments.get(name)
+        if name in schemas:
+            description = re.sub(r"\s*-\s*see properties below", "", description)
+            if resource is not None:
+                description += f" Fields: see the schema://tmf620/{resource} resource."
+        if description:
+            property = dict(property, description=description)
+        schema["properties"][name] = property
+    return types.Tool(
+        name=tool.name,
+        description=f"{summary}\n\nReturns: {returns}" if returns else summary,
+        inputSchema=schema,
+        annotations=tool.annotations,
+    )
+
+
+def build_tool_catalogue(server: FastMCP, compact: bool) -> types.ServerResult:
+    """Build the tools/list result of a server once.
+
+    Args:
+        server: FastMCP server with all its tools registered
+        compact: Use short descriptions (see compact_tool)
+
+    Returns:
+        The result returned for every tools/list request
+    """
+    tools = []
+    for tool in server._tool_manager.list_tools():
+        if compact:
+            tools.append(compact_tool(tool))
+        else:
+            tools.append(
+                types.Tool(
+                    name=tool.name,
+                    description=tool.description,
+                    inputSchema=tool.parameters,
+                    annotations=tool.annotations,
+                )
+            )
+    result = types.ServerResult(types.ListToolsResult(tools=tools))
+    size = len(result.model_dump_json(by_alias=True, exclude_none=True))
+    logger.info(f"Tool catalogue: {len(tools)} tools, {size} bytes")
+    return result
+
+
+def serve_tool_catalogue(server: FastMCP, compact: bool) -> types.ServerResult:
+    """Answer the tools/list requests of a server from a catalogue built now."""
+    catalogue = build_tool_catalogue(server, compact)
+
+    async def list_tools(_: types.ListToolsRequest) -> types.ServerResult:
+        return catalogue
+
+    server._mcp_server.request_handlers[types.ListToolsRequest] = list_tools
+    return catalogue
+
+
+# Family of the prompts other than create_*_prompt, as (resource path, access); None as
+# resource path stands for all resource types
+PROMPT_FAMILIES = {
+    "list_catalogs_prompt": ("catalog", "read"),
+    "list_product_offerings_prompt": ("productOffering", "read"),
+    "list_product_specifications_prompt": ("productSpecification", "read"),
+    "search_offerings_by_name_prompt": ("productOffering", "read"),
+    "find_product_specification_for_offering_prompt": ("productSpecification", "read"),
+    "get_usage_help_prompt": (None, "read"),
+    "search_product_specifications_by_characteristics_prompt": (
+        "productSpecification",
+        "read",
+    ),
+    "compare_product_specifications_prompt": ("productSpecification", "read"),
+}
+
+
+# Family of the tools that reach every resource type, as (resource paths, access); they are
+# only served when all of those resource types are selected
+TOOL_FAMILIES = {
+    "resource_get_many": (RESOURCE_TYPES, "read"),
+    "catalog_cleanup": (RESOURCE_TYPES, "write"),
+}
+
+
+def tool_family(name: str) -> tuple[str | tuple | None, str]:
+    """Resource path (or paths) and access ("read" or "write") of a tool."""
+    if name in TOOL_FAMILIES:
+        return TOOL_FAMILIES[name]
+    resource = next(
+        (r for prefix, r in TOOL_SCHEMAS.items() if name.startswith(prefix)), None
+    )
+    read = name.endswith(("_get", "_get_many", "_search"))
+    return resource, "read" if read else "write"
+
+
+def prompt_family(name: str) -> tuple[str | None, str]:
+    """Resource path and access of a prompt; create_<resource>_prompt guides a write."""
+    if name in PROMPT_FAMILIES:
+        return PROMPT_FAMILIES[name]
+    resource, _ = tool_family(name.removeprefix("create_"))
+    return resource, "write"
+
+
+def resource_family(uri: str) -> tuple[str | None, str]:
+    """Resource path and access of an MCP resource or resource template.
+
+    Schemas document the fields of the resources to create or update, so they belong to the
+    write families.
+    """
+    scheme, _, path = uri.partition("://tmf620/")
+    resource = path.split("/")[0]
+    return resource, "write" if scheme == "schema" else "read"
+
+
+def parse_families(value: str) -> tuple[set[str], set[str]]:
+    """Parse a family selection such as "read,productOffering,productOfferingPrice".
+
+    Returns:
+        Selected accesses and resource paths; an empty part of the selection selects all
+    """
+    accesses, resources = set(), set()
+    for item in (i.strip() for i in (value or "").split(",")):
+        if item in ("read", "write"):
+            accesses.add(item)
+        elif item in RESOURCE_TYPES:
+            resources.add(item)
+        elif item:
+            logger.warning(f"Ignoring unknown tool family {item}")
+    return accesses or {"read", "write"}, resources or set(RESOURCE_TYPES)
+
+
+def selected(
+    family: tuple[str | tuple | None, str], selection: tuple[set, set]
+) -> bool:
+    """Whether a family is part of a selection returned by parse_families.
+
+    A family of several resource paths requires all of them to be selected.
+    """
+    resource, access = family
+    accesses, resources = selection
+    required = {resource} if isinstance(resource, str) else set(resource or ())
+    return access in accesses and required <= resources
+
+
+def select_families(server: FastMCP, families: str, source: FastMCP = None) -> FastMCP:
+    """Register the tools, resources and prompts of the selected families on a server.
+
+    Args:
+        server: Server whose registries are replaced
+        families: Family selection (see parse_families)
+        source: Server to take the registrations from (default: server itself)
+
+    Returns:
+        The server
+    """
+    selection = parse_families(families)
+    source = source or server
+    for registry, origin, family in (
+        (server._tool_manager._tools, source._tool_manager._tools, tool_family),
+        (
+            server._prompt_manager._prompts,
+            source._prompt_manager._prompts,
+            prompt_family,
+        ),
+        (
+            server._resource_manager._resources,
+            source._resource_manager._resources,
+            resource_family,
+        ),
+        (
+            server._resource_manager._templates,
+            source._resource_manager._templates,
+            resource_family,
+        ),
+    ):
+        entries = dict(origin)
+        registry.clear()
+        for key, entry in entries.items():
+            if selected(family(key), selection):
+                registry[key] = entry
+    return server
+
+
+def build_profiles(value: str) -> dict[str, FastMCP]:
+    """Build a server for each profile=families entry, serving at /mcp/<profile>."""
+    profiles = {}
+    for entry in (value or "").split(";"):
+        name, _, families = entry.partition("=")
+        name = name.strip()
+        if not name:
+            continue
+        server = FastMCP(
+            name=f"product_catalog_{name}", streamable_http_path=f"/mcp/{name}"
+        )
+        profiles[name] = select_families(server, families, source=mcp)
+        logger.info(
+            f"Profile {name}: {len(server._tool_manager._tools)} tools, "
+            f"{len(server._prompt_manager._prompts)} prompts"
+        )
+    return profiles
+
+
+# Profiles are built from the complete registry, before the MCP endpoint's own selection
+mcp_profiles = build_profiles(MCP_PROFILES)
+select_families(mcp, MCP_FAMILIES)
+tool_catalogue = serve_tool_catalogue(mcp, MCP_COMPACT_DESCRIPTIONS)
+for profile in mcp_profiles.values():
+    serve_tool_catalogue(profile, MCP_COMPACT_DESCRIPTIONS)
+
+
+# ---------------------------------------------------------------------------------------------
+# HTTP routes
+# Plain HTTP endpoints served next to the MCP endpoint (under the same component prefix).
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> PlainTextResponse:
+    """Expose the Product Catalog API client metrics (cache hits/misses, ...) and the age of
+    the catalog graph to Prometheus."""
+    sources = [catalog_graph] if catalog_graph is not None else []
+    return PlainTextResponse(
+        render_metrics(sources=sources),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@mcp.custom_route("/listener", methods=["POST"])
+async def event_listener(request: Request) -> Response:
+    """Receive TMF620 event notifications from the hub and update the cache and local catalog."""
+    if not event_authorized(request.query_params.get(EVENT_SECRET_PARAM)):
+        logger.warning(f"Rejected event without a valid secret from {request.client}")
+        return JSONResponse(
+            {"code": "401", "reason": "Invalid event secret"}, status_code=401
+        )
+    try:
+        message = await request.json()
+    except ValueError:
+        return JSONResponse({"code": "400", "reason": "Invalid JSON"}, status_code=400)
+    if not isinstance(message, dict):
+        return JSONResponse(
+            {"code": "400", "reason": "Expected an event object"}, status_code=400
+        )
+    apply_event(message)
+    if catalog_graph is not None:
+        catalog_graph.apply_event(message)
+    elif catalog_snapshot is not None:
+        catalog_snapshot.apply_event(message)
+    return Response(status_code=204)
+
+
 if __name__ == "__main__":
     # Set up argument parser for command-line options
     parser = argparse.ArgumentParser(description="Product Catalog MCP Server")
@@ -2888,28 +4589,82 @@ if __name__ == "__main__":
     component_name = os.environ.get("COMPONENT_NAME", "")
     mcp_path = f"/{component_name}/mcp" if component_name else "/mcp"
 
+    # URL the TMF620 event hub posts notifications to. In Kubernetes it is derived from the
+    # MCP service created by the Helm chart; set MCP_EVENT_LISTENER_URL to override it, or to
+    # an empty string to disable the subscription.
+    listener_url = os.environ.get("MCP_EVENT_LISTENER_URL")
+    if listener_url is None and RELEASE_NAME != "local":
+        listener_path = f"/{component_name}/listener" if component_name else "/listener"
+        listener_url = f"http://{RELEASE_NAME}-prodcatmcp:{args.port}{listener_path}"
+
     logger.info(
         f"Starting Product Catalog MCP Server with Streamable HTTP transport on {args.host}:{args.port}"
     )
     logger.info(f"MCP endpoint will be available at: http://{args.host}:{args.port}{mcp_path}")
+    for profile in mcp_profiles:
+        logger.info(
+            f"Profile {profile} will be available at: http://{args.host}:{args.port}{mcp_path}/{profile}"
+        )
 
     try:
         # Create the MCP Starlette sub-app (serves at /mcp by default)
         mcp_sub_app = mcp.streamable_http_app()
 
+        # Serve every profile at /mcp/<profile>. Its routes go first, as the /mcp mount would
+        # match the profile paths as well. Like /mcp, the path without a trailing slash is
+        # redirected by the profile app to the path with one.
+        profile_apps = [
+            profile.streamable_http_app() for profile in mcp_profiles.values()
+        ]
+        for profile_app in reversed(profile_apps):
+            mount = profile_app.routes[0]
+            mcp_sub_app.router.routes[0:0] = [
+                Route(mount.path, endpoint=profile_app),
+                mount,
+            ]
+
+        # The MCP app has a lifespan that initializes its task group. We extend it so the
+        # shared HTTP connection pool to the Product Catalog API is opened on startup and
+        # closed on shutdown, the event listener is registered with the hub and the catalog
+        # graph and snapshot (if enabled) are loaded and refreshed while the server runs. The
+        # session managers of the profiles run alongside the one of the MCP endpoint.
+        from contextlib import AsyncExitStack, asynccontextmanager
+
+        mcp_lifespan = mcp_sub_app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan(app):
+            async with mcp_lifespan(app), AsyncExitStack() as profiles:
+                for profile_app in profile_apps:
+                    await profiles.enter_async_context(
+                        profile_app.router.lifespan_context(profile_app)
+                    )
+                await open_http_client()
+                if listener_url:
+                    try:
+                        await register_event_listener(listener_url)
+                    except Tmf620Error as e:
+                        logger.warning(
+                            f"Event subscription failed, cache relies on its TTL: {e.detail}"
+                        )
+                view_task = None
+                if catalog_graph is not None or catalog_snapshot is not None:
+                    view_task = asyncio.create_task(
+                        maintain_catalog_view(MCP_CATALOG_REFRESH_INTERVAL)
+                    )
+                try:
+                    yield
+                finally:
+                    if view_task is not None:
+                        view_task.cancel()
+                    await unregister_event_listener()
+                    await close_http_client()
+
         # Mount the MCP sub-app under the component name prefix so it serves
         # at /<component_name>/mcp, matching the ingress path.
         if component_name:
-            # The MCP app has a lifespan that initializes its task group.
             # When mounting inside another Starlette app, we must propagate
             # the inner app's lifespan to ensure it gets called.
-            from contextlib import asynccontextmanager
-
-            @asynccontextmanager
-            async def lifespan(app):
-                async with mcp_sub_app.router.lifespan_context(app):
-                    yield
-
             app = Starlette(
                 routes=[
                     Mount(f"/{component_name}", app=mcp_sub_app),
@@ -2917,6 +4672,7 @@ if __name__ == "__main__":
                 lifespan=lifespan,
             )
         else:
+            mcp_sub_app.router.lifespan_context = lifespan
             app = mcp_sub_app
 
         # Add CORS middleware so browser-based clients (e.g. MCP Inspector) can connect.
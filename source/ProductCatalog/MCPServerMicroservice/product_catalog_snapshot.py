@@ -0,0 +1,361 @@
+# Product Catalog snapshot
+# A compact on-disk copy of the catalog that the MCP server memory-maps on startup, so that a
+# restarted pod answers reads at once while a delta sync catches up with the changes made in
+# the meantime. The file is never modified in place: a new snapshot is written next to it and
+# renamed over it, so several worker processes on one node can map the same file and share its
+# pages instead of each holding its own copy of the catalog.
+#
+# File layout (integers little-endian):
+#   header      magic, version, entry counts and section offsets (HEADER)
+#   records     compact JSON of every resource, back to back
+#   keys        index keys, back to back
+#   ID index    ENTRY per resource, sorted by key  resource \0 id
+#   name index  ENTRY per named resource, sorted by key  resource \0 name \0 id
+#   metadata    JSON with the creation time and the number of resources per type
+# An ENTRY holds the offset and length of its key and of the record it points to, so a lookup
+# is a binary search over the mapped index that decodes a single record.
+import asyncio
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from typing import Any, Iterator
+
+from product_catalog_api import RESOURCE_TYPES, parse_event
+from product_catalog_graph import matches, project
+
+logger = logging.getLogger("product-catalog-snapshot")
+
+MAGIC = b"TMF620SN"
+VERSION = 1
+# magic, version, ID entries, name entries, reserved, keys, ID index, name index, metadata
+# offset, metadata length
+HEADER = struct.Struct("<8sIIII5Q")
+# key offset, key length, record offset, record length
+ENTRY = struct.Struct("<QIQI")
+
+
+def id_key(resource: str, resource_id: str) -> bytes:
+    return f"{resource}\0{resource_id}".encode("utf-8")
+
+
+def name_key(resource: str, name: str, resource_id: str = "") -> bytes:
+    return f"{resource}\0{name}\0{resource_id}".encode("utf-8")
+
+
+def write_snapshot(path: str, collections: dict[str, list[dict[str, Any]]]) -> int:
+    """Write a snapshot of the catalog, replacing any snapshot at path atomically.
+
+    Args:
+        path: File to write
+        collections: Resources per TMF620 resource path
+
+    Returns:
+        Number of resources written
+    """
+    records = bytearray()
+    keys = bytearray()
+    ids, names = [], []
+    counts = {}
+    for resource, documents in collections.items():
+        counts[resource] = 0
+        for document in documents:
+            resource_id = document.get("id")
+            if not resource_id:
+                continue
+            record = json.dumps(document, separators=(",", ":")).encode("utf-8")
+            location = (HEADER.size + len(records), len(record))
+            records += record
+            ids.append((id_key(resource, resource_id), location))
+            if isinstance(document.get("name"), str):
+                names.append(
+                    (name_key(resource, document["name"], resource_id), location)
+                )
+            counts[resource] += 1
+
+    keys_offset = HEADER.size + len(records)
+    index = bytearray()
+    for entries in (ids, names):
+        entries.sort()
+        for key, (record_offset, record_length) in entries:
+            index += ENTRY.pack(
+                keys_offset + len(keys), len(key), record_offset, record_length
+            )
+            keys += key
+    id_index = keys_offset + len(keys)
+    name_index = id_index + len(ids) * ENTRY.size
+    meta = json.dumps({"created": time.time(), "counts": counts}).encode("utf-8")
+    meta_offset = name_index + len(names) * ENTRY.size
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        len(ids),
+        len(names),
+        0,
+        keys_offset,
+        id_index,
+        name_index,
+        meta_offset,
+        len(meta),
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            for part in (header, records, keys, index, meta):
+                file.write(part)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    logger.info(f"Wrote catalog snapshot with {len(ids)} resources to {path}")
+    return len(ids)
+
+
+class CatalogSnapshot:
+    """Read view of a memory-mapped catalog snapshot with an in-memory overlay.
+
+    Lookups by ID or name binary-search the mapped indexes and decode only the records they
+    return. Changes received after the snapshot was written (upsert and remove, the sink
+    interface of DeltaSync) are kept in a small overlay until the next save.
+
+    Args:
+        path: Snapshot file
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._map: mmap.mmap | None = None
+        self._header: tuple = ()
+        self.meta: dict[str, Any] = {}
+        # (resource, ID) -> current resource, or None once deleted
+        self._overlay: dict[tuple[str, str], dict | None] = {}
+
+    @property
+    def ready(self) -> bool:
+        """Whether a snapshot is mapped."""
+        return self._map is not None
+
+    def open(self) -> bool:
+        """Map the snapshot file.
+
+        Returns:
+            True if the file exists and is a valid snapshot
+        """
+        try:
+            file = open(self.path, "rb")
+        except FileNotFoundError:
+            return False
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            file.close()
+            return False
+        header = HEADER.unpack_from(mapped, 0) if len(mapped) >= HEADER.size else ()
+        if not header or header[0] != MAGIC or header[1] != VERSION:
+            logger.warning(f"Ignoring {self.path}: not a version {VERSION} snapshot")
+            mapped.close()
+            file.close()
+            return False
+        self.close()
+        self._file, self._map, self._header = file, mapped, header
+        meta_offset, meta_length = header[8], header[9]
+        self.meta = json.loads(mapped[meta_offset : meta_offset + meta_length])
+        logger.info(f"Mapped catalog snapshot {self.path} with {header[2]} resources")
+        return True
+
+    def close(self) -> None:
+        """Unmap the snapshot file."""
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+        self._file, self._map, self._header = None, None, ()
+
+    # -- Index access -----------------------------------------------------------------------
+
+    def _entry(self, index: int, position: int) -> tuple[int, int, int, int]:
+        return ENTRY.unpack_from(self._map, index + position * ENTRY.size)
+
+    def _key(self, entry: tuple) -> bytes:
+        return self._map[entry[0] : entry[0] + entry[1]]
+
+    def _record(self, entry: tuple) -> dict[str, Any]:
+        return json.loads(self._map[entry[2] : entry[2] + entry[3]])
+
+    def _range(self, index: int, count: int, prefix: bytes) -> Iterator[tuple]:
+        """Entries of an index whose key starts with prefix, in key order."""
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(self._entry(index, middle)) < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        for position in range(low, count):
+            entry = self._entry(index, position)
+            if not self._key(entry).startswith(prefix):
+                break
+            yield entry
+
+    def _ids(self, prefix: bytes) -> Iterator[tuple]:
+        if self._map is None:
+            return iter(())
+        return self._range(self._header[6], self._header[2], prefix)
+
+    def _names(self, prefix: bytes) -> Iterator[tuple]:
+        if self._map is None:
+            return iter(())
+        return self._range(self._header[7], self._header[3], prefix)
+
+    # -- Reads ------------------------------------------------------------------------------
+
+    def get(self, resource: str, resource_id: str) -> dict[str, Any] | None:
+        """A resource by ID, or None if the snapshot does not hold it."""
+        key = (resource, resource_id)
+        if key in self._overlay:
+            return self._overlay[key]
+        key = id_key(resource, resource_id)
+        for entry in self._ids(key):
+            if entry[1] == len(key):
+                return self._record(entry)
+        return None
+
+    def find_by_name(self, resource: str, name: str) -> list[dict[str, Any]]:
+        """Resources of one type with exactly the given name."""
+        found = {}
+        for entry in self._names(name_key(resource, name)):
+            document = self._record(entry)
+            found[document["id"]] = document
+        for (r, resource_id), document in self._overlay.items():
+            if r != resource:
+                continue
+            found.pop(resource_id, None)
+            if document is not None and document.get("name") == name:
+                found[resource_id] = document
+        return list(found.values())
+
+    def documents(self, resource: str) -> Iterator[dict[str, Any]]:
+        """Every resource of one type, including the changes in the overlay."""
+        for entry in self._ids(f"{resource}\0".encode("utf-8")):
+            resource_id = self._key(entry).split(b"\0", 1)[1].decode("utf-8")
+            if (resource, resource_id) in self._overlay:
+                continue
+            yield self._record(entry)
+        for (r, _), document in self._overlay.items():
+            if r == resource and document is not None:
+                yield document
+
+    def select(
+        self,
+        resource: str,
+        fields: str = None,
+        offset: int = None,
+        limit: int = None,
+        filter: dict = None,
+    ) -> list[dict[str, Any]]:
+        """Resources of one type, with the fields, paging and filter semantics of the API.
+
+        A filter on the name alone is answered from the name index.
+        """
+        start = offset or 0
+        results = []
+        if filter and list(filter) == ["name"] and isinstance(filter["name"], str):
+            documents = self.find_by_name(resource, filter["name"])
+        else:
+            documents = self.documents(resource)
+        for document in documents:
+            if not matches(document, filter):
+                continue
+            if start:
+                start -= 1
+                continue
+            if limit is not None and len(results) == limit:
+                break
+            results.append(project(document, fields))
+        return results
+
+    def size(self) -> int:
+        """Number of resources in the mapped snapshot, without the overlay."""
+        return self._header[2] if self._header else 0
+
+    # -- Updates ----------------------------------------------------------------------------
+
+    def upsert(self, resource: str, document: dict[str, Any]) -> None:
+        """Record a new or changed resource until the next save."""
+        if document.get("id"):
+            self._overlay[(resource, document["id"])] = document
+
+    def remove(self, resource: str, resource_id: str) -> None:
+        """Record a deleted resource until the next save."""
+        self._overlay[(resource, resource_id)] = None
+
+    def apply_event(self, message: dict[str, Any]) -> bool:
+        """Apply a TMF620 hub event message to the overlay.
+
+        Returns:
+            True if the event was recognised and applied
+        """
+        event = parse_event(message)
+        if event is None:
+            return False
+        kind, resource, document = event
+        if kind == "delete":
+            self.remove(resource, document.get("id"))
+        else:
+            self.upsert(resource, document)
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Number of changes not yet saved."""
+        return len(self._overlay)
+
+    def save(self, collections: dict[str, list[dict[str, Any]]] = None) -> int:
+        """Write a new snapshot and map it.
+
+        Args:
+            collections: Resources per resource path to write (default: the current view,
+                the mapped snapshot with the overlay applied)
+
+        Returns:
+            Number of resources written
+        """
+        if collections is None:
+            collections = {r: list(self.documents(r)) for r in RESOURCE_TYPES}
+        count = write_snapshot(self.path, collections)
+        self._overlay.clear()
+        self.open()
+        return count
+
+    async def save_async(
+        self, collections: dict[str, list[dict[str, Any]]] = None
+    ) -> int:
+        """Write a new snapshot like save, encoding and syncing the file in a worker thread.
+
+        The event loop keeps serving while the file is written. Changes recorded meanwhile
+        stay in the overlay, on top of the new snapshot.
+
+        Args:
+            collections: Resources per resource path to write (default: the current view)
+
+        Returns:
+            Number of resources written
+        """
+        written = dict(self._overlay)
+        if collections is None:
+            collections = {r: list(self.documents(r)) for r in RESOURCE_TYPES}
+        count = await asyncio.to_thread(write_snapshot, self.path, collections)
+        for key, document in written.items():
+            if key in self._overlay and self._overlay[key] is document:
+                del self._overlay[key]
+        self.open()
+        return count
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# Stub TMF620 Product Catalog backend for local testing
+# An in-memory stand-in for the Product Catalog Open-API, so that product_catalog_api.py and the
+# MCP server can be exercised without the Node.js API and MongoDB. It implements the parts of
+# the API that the client relies on:
+#   - list, retrieve, create, patch and delete for every TMF620 resource
+#   - fields, offset/limit paging and attribute filters, parsed as the Product Catalog API does
+#     with query-to-mongo: name=value, name!=value and the comparisons >, >=, < and <=
+#     (e.g. lastUpdate>="2024-01-01T00:00:00.000Z", quoted so that it is compared as a string)
+#   - X-Total-Count, X-Result-Count and Link headers, 206 for partial pages; as in the
+#     Product Catalog API, they are based on the unfiltered collection size
+#   - optional ETags and conditional GETs with If-None-Match; like the Product Catalog API,
+#     the stub sends no Last-Modified and ignores If-Modified-Since
+#   - hub subscriptions (POST/DELETE /hub) and event notifications to the registered listeners
+#   - injected failures and latency, to exercise retries and other client resilience features
+#
+# Examples:
+#   python stub_product_catalog_backend.py --port 8081
+#   TMF620_API_URL=http://localhost:8081/tmf-api/productCatalogManagement/v4 python product_catalog_mcp_server.py
+#
+# In tests the app can be used in-process with httpx.ASGITransport(app=create_app()).
+
+import argparse
+import asyncio
+import datetime
+import hashlib
+import json
+import operator
+import re
+import uuid
+from typing import Any
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from product_catalog_api import RESOURCE_TYPE_NAMES
+
+BASE_PATH = "/tmf-api/productCatalogManagement/v4"
+
+# Query parameters that are not attribute filters
+RESERVED_PARAMETERS = ("fields", "offset", "limit")
+
+# Operators of attribute filters in the query-to-mongo syntax, e.g. price.value<=20
+FILTER_OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+_FILTER_PATTERN = re.compile(r"^([^<>!=]+)(!=|>=|<=|>|<|=)(.*)$", re.DOTALL)
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}(-\d{2}(T[\d:.]+(Z|[+-]\d{2}:?\d{2})?)?)?$")
+
+
+def now() -> str:
+    """Current time in the format used by the Product Catalog API for lastUpdate."""
+    moment = datetime.datetime.now(datetime.timezone.utc)
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def project(document: dict, fields: str | None) -> dict:
+    """Apply the fields query parameter to a document."""
+    if not fields:
+        return document
+    selected = {"id", "href"} | {f.strip() for f in fields.split(",")}
+    return {k: v for k, v in document.items() if k in selected}
+
+
+def field_values(document: dict, path: str) -> list:
+    """Values of a dotted attribute path, descending into lists as MongoDB does."""
+    values = [document]
+    for key in path.split("."):
+        values = [v.get(key) for v in values if isinstance(v, dict)]
+        values = [x for v in values for x in (v if isinstance(v, list) else [v])]
+    return values
+
+
+def parse_filter(name: str, value: str) -> tuple[str, str, Any] | None:
+    """Split a query parameter into attribute path, operator and typed value.
+
+    As in query-to-mongo, a quoted value is a string, true and false are booleans, an ISO 8601
+    date is a date and a number is a number. The Product Catalog API stores lastUpdate as a
+    string, so a date only matches lastUpdate when it is quoted.
+    """
+    match = _FILTER_PATTERN.match(f"{name}={value}" if value != "" else name)
+    if match is None:
+        return None
+    field, op, text = match.groups()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        return field, op, text[1:-1]
+    if text in ("true", "false"):
+        return field, op, text == "true"
+    if _DATE_PATTERN.match(text):
+        try:
+            return (
+                field,
+                op,
+                datetime.datetime.fromisoformat(text.replace("Z", "+00:00")),
+            )
+        except ValueError:
+            pass
+    try:
+        return field, op, float(text)
+    except ValueError:
+        return field, op, text
+
+
+def compare(op: str, actual: Any, expected: Any) -> bool:
+    """Compare two values as MongoDB does: values of different types never match."""
+    if isinstance(actual, bool) or isinstance(expected, bool):
+        comparable = isinstance(actual, bool) and isinstance(expected, bool)
+    elif isinstance(actual, (int, float)) or isinstance(expected, (int, float)):
+        comparable = isinstance(actual, (int, float)) and isinstance(
+            expected, (int, float)
+        )
+    else:
+        comparable = type(actual) is type(expected)
+    if not comparable:
+        return False
+    return FILTER_OPERATORS[op](actual, expected)
+
+
+def matches(document: dict, filters: dict[str, str]) -> bool:
+    """Check a document against attribute filters.
+
+    An attribute path may be dotted (category.id) and matches if any of its values does;
+    != matches if none of them is equal.
+    """
+    for name, value in filters.items():
+        parsed = parse_filter(name, value)
+        if parsed is None:
+            return False
+        field, op, expected = parsed
+        values = [v for v in field_values(document, field) if v is not None]
+        if op == "!=":
+            if any(compare("=", v, expected) for v in values):
+                return False
+        elif not any(compare(op, v, expected) for v in values):
+            return False
+    return True
+
+
+def event_message(resource: str, operation: str, document: dict) -> dict:
+    """Build an event message in the format sent by the Product Catalog API hub."""
+    return {
+        "eventId": str(uuid.uuid4()),
+        "eventTime": now(),
+        "eventType": f"{RESOURCE_TYPE_NAMES[resource]}{operation}Notification",
+        "event": {resource: document},
+    }
+
+
+def create_app(
+    base_path: str = BASE_PATH,
+    etag: bool = True,
+    http_client: httpx.AsyncClient = None,
+) -> Starlette:
+    """Create the stub backend application.
+
+    Args:
+        base_path: Path prefix of the TMF620 API
+        etag: Send ETag headers. The real Product Catalog API does not, in which case
+            clients cannot revalidate and refetch expired responses in full.
+        http_client: Optional AsyncClient used to deliver events to hub listeners.
+            Events are delivered before the triggering request is answered.
+
+    Returns:
+        Starlette application. Its state holds the documents (app.state.store), the hub
+        subscriptions (app.state.hub) and a log of handled requests as (method, path,
+        status) tuples (app.state.requests). Failures can be injected by appending
+        (status, headers) tuples to app.state.faults, which are returned by the next
+        requests in order, and app.state.latency delays every request by that many seconds.
+    """
+    store: dict[str, dict[str, dict]] = {
+        resource: {} for resource in RESOURCE_TYPE_NAMES
+    }
+    hub: dict[str, dict] = {}
+    requests: list[tuple[str, str, int]] = []
+
+    async def publish(resource: str, operation: str, document: dict) -> None:
+        message = event_message(resource, operation, document)
+        client = http_client or httpx.AsyncClient()
+        try:
+            for listener in list(hub.values()):
+                try:
+                    await client.post(listener["callback"], json=message)
+                except httpx.HTTPError as e:
+                    print(f"Failed to notify {listener['callback']}: {e}")
+        finally:
+            if http_client is None:
+                await client.aclose()
+
+    def respond(request: Request, body: Any, status: int = 200, headers=None):
+        content = json.dumps(body).encode("utf-8")
+        headers = dict(headers or {})
+        if etag:
+            headers["ETag"] = f'"{hashlib.sha1(content).hexdigest()}"'
+            if (
+                request.method == "GET"
+                and request.headers.get("If-None-Match") == headers["ETag"]
+            ):
+                status, content = 304, b""
+        requests.append((request.method, request.url.path, status))
+        return Response(content, status, headers=headers, media_type="application/json")
+
+    def error(request: Request, status: int, reason: str) -> JSONResponse:
+        requests.append((request.method, request.url.path, status))
+        return JSONResponse({"code": str(status), "reason": reason}, status)
+
+    async def list_resources(request: Request) -> Response:
+        resource = request.path_params["resource"]
+        if resource not in store:
+            return error(request, 404, f"Unknown resource {resource}")
+        params = request.query_params
+        filters = {k: v for k, v in params.items() if k not in RESERVED_PARAMETERS}
+        documents = [d for d in store[resource].values() if matches(d, filters)]
+        offset = int(params.get("offset", 0))
+        limit = int(params["limit"]) if "limit" in params else None
+        page = documents[offset : offset + limit if limit is not None else None]
+
+        # Like the Product Catalog API, the total count, the status and the next link are
+        # based on the size of the whole collection, also for filtered requests
+        total = len(store[resource])
+        headers = {"X-Total-Count": str(total), "X-Result-Count": str(len(page))}
+        status = 200
+        if limit is not None and len(page) < total:
+            status = 206
+        if limit is not None and offset + limit < total:
+            next_url = request.url.include_query_params(
+                offset=offset + limit, limit=limit
+            )
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        body = [project(d, params.get("fields")) for d in page]
+        return respond(request, body, status, headers)
+
+    async def retrieve_resource(request: Request) -> Response:
+        resource = request.path_params["resource"]
+        document = store.get(resource, {}).get(request.path_params["id"])
+        if document is None:
+            return error(request, 404, "Resource not found")
+        body = project(document, request.query_params.get("fields"))
+        return respond(request, body)
+
+    async def create_resource(request: Request) -> Response:
+        resource = request.path_params["resource"]
+        if resource not in store:
+            return error(request, 404, f"Unknown resource {resource}")
+        document = await request.json()
+        document["id"] = document.get("id") or str(uuid.uuid4())
+        document["href"] = (
+            f"{request.base_url}{base_path.lstrip('/')}/{resource}/{document['id']}"
+        )
+        document.setdefault("@type", RESOURCE_TYPE_NAMES[resource])
+        document["lastUpdate"] = now()
+        store[resource][document["id"]] = document
+        await publish(resource, "Creation", document)
+        return respond(request, document, 201)
+
+    async def patch_resource(request: Request) -> Response:
+        resource = request.path_params["resource"]
+        document = store.get(resource, {}).get(request.path_params["id"])
+        if document is None:
+            return error(request, 404, "Resource not found")
+        changes = await request.json()
+        changes.pop("id", None)
+        document.update(changes)
+        document["lastUpdate"] = now()
+        await publish(resource, "AttributeValueChange", document)
+        return respond(request, document)
+
+    async def delete_resource(request: Request) -> Response:
+        resource = request.path_params["resource"]
+        document = store.get(resource, {}).pop(request.path_params["id"], None)
+        if document is None:
+            return error(request, 404, "Resource not found")
+        await publish(resource, "Remove", document)
+        requests.append((request.method, request.url.path, 204))
+        return Response(status_code=204)
+
+    async def register_listener(request: Request) -> Response:
+        subscription = await request.json()
+        if not subscription.get("callback"):
+            return error(request, 400, "Missing callback")
+        subscription["id"] = str(uuid.uuid4())
+        hub[subscription["id"]] = subscription
+        requests.append((request.method, request.url.path, 201))
+        return JSONResponse(subscription, 201)
+
+    async def unregister_listener(request: Request) -> Response:
+        if hub.pop(request.path_params["id"], None) is None:
+            return error(request, 404, "Listener not found")
+        requests.append((request.method, request.url.path, 204))
+        return Response(status_code=204)
+
+    app = Starlette(
+        routes=[
+            Route(f"{base_path}/hub", register_listener, methods=["POST"]),
+            Route(f"{base_path}/hub/{{id}}", unregister_listener, methods=["DELETE"]),
+            Route(f"{base_path}/{{resource}}", list_resources, methods=["GET"]),
+            Route(f"{base_path}/{{resource}}", create_resource, methods=["POST"]),
+            Route(
+                f"{base_path}/{{resource}}/{{id}}", retrieve_resource, methods=["GET"]
+            ),
+            Route(
+                f"{base_path}/{{resource}}/{{id}}", patch_resource, methods=["PATCH"]
+            ),
+            Route(
+                f"{base_path}/{{resource}}/{{id}}", delete_resource, methods=["DELETE"]
+            ),
+        ]
+    )
+
+    async def inject_faults(request: Request, call_next) -> Response:
+        if app.state.latency:
+            await asyncio.sleep(app.state.latency)
+        if app.state.faults:
+            status, headers = app.state.faults.pop(0)
+            requests.append((request.method, request.url.path, status))
+            return JSONResponse(
+                {"code": str(status), "reason": "Injected failure"}, status, headers
+            )
+        return await call_next(request)
+
+    app.add_middleware(BaseHTTPMiddleware, dispatch=inject_faults)
+    app.state.store = store
+    app.state.hub = hub
+    app.state.requests = requests
+    app.state.faults = []
+    app.state.latency = 0.0
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub TMF620 Product Catalog backend")
+    parser.add_argument("--host", default="127.0.0.1", help="Host address to bind to")
+    parser.add_argument("--port", type=int, default=8081, help="Port to listen on")
+    parser.add_argument(
+        "--no-etag",
+        action="store_true",
+        help="Do not send ETag headers, like the Node.js Product Catalog API",
+    )
+    args = parser.parse_args()
+
+    print(f"Stub TMF620 API at http://{args.host}:{args.port}{BASE_PATH}")
+    uvicorn.run(create_app(etag=not args.no_etag), host=args.host, port=args.port)
@@ -18,9 +18,8 @@ import asyncio
 import argparse
 import warnings
 import traceback
-import re
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple
 
 # Import the module to test
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -28,24 +27,23 @@ from product_catalog_api import (
     get_catalog,
     create_catalog,
     update_catalog,
-    delete_catalog,
     get_category,
     create_category,
     update_category,
-    delete_category,
     get_product_specification,
     create_product_specification,
     update_product_specification,
-    delete_product_specification,
     get_product_offering,
     create_product_offering,
     update_product_offering,
-    delete_product_offering,
     get_product_offering_price,
     create_product_offering_price,
     update_product_offering_price,
-    delete_product_offering_price,
+    cleanup,
+    close_http_client,
+    Tmf620Error,
 )
+from product_catalog_loader import load_directories
 
 # Create logs directory if it doesn't exist
 logs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
@@ -168,125 +166,22 @@ def create_entity_reference(entity_type, entity_id, entity_name):
     }
 
 
-async def load_all_test_data() -> Dict[str, List[Dict]]:
-    """
-    Load all test data from the test_payloads directory, organized by entity type.
-
-    Returns:
-        Dict with keys 'catalogs', 'categories', 'productSpecifications',
-        'productOfferings', and 'productOfferingPrices', each containing a list of
-        corresponding entities.
-    """
-    logger.info("Loading all test data from test_payloads directory...")
-
-    # Initialize result dictionary
-    all_data = {
-        "catalogs": [],
-        "categories": [],
-        "productSpecifications": [],
-        "productOfferings": [],
-        "productOfferingPrices": [],
-    }
-
-    # Get all JSON files in the test_payloads directory
-    test_files = [f for f in os.listdir(test_data_dir) if f.endswith(".json")]
-
-    # Regular expressions to match file naming patterns
-    catalog_pattern = re.compile(r".*_catalog\.json$")
-    category_pattern = re.compile(r".*_category\.json$")
-    spec_pattern = re.compile(r".*_spec\.json$")
-    offering_pattern = re.compile(r".*_offering\.json$")
-    price_pattern = re.compile(r".*_price\.json$")
-
-    # Load each file and categorize based on filename pattern
-    for filename in test_files:
-        data = await load_json_file(filename)
-        if not data:
-            continue
-
-        if catalog_pattern.match(filename):
-            all_data["catalogs"].append(data)
-        elif category_pattern.match(filename):
-            all_data["categories"].append(data)
-        elif spec_pattern.match(filename):
-            all_data["productSpecifications"].append(data)
-        elif offering_pattern.match(filename):
-            all_data["productOfferings"].append(data)
-        elif price_pattern.match(filename):
-            all_data["productOfferingPrices"].append(data)
-
-    # Log summary of loaded data
-    logger.info(f"Loaded {len(all_data['catalogs'])} catalogs")
-    logger.info(f"Loaded {len(all_data['categories'])} categories")
-    logger.info(
-        f"Loaded {len(all_data['productSpecifications'])} product specifications"
-    )
-    logger.info(f"Loaded {len(all_data['productOfferings'])} product offerings")
-    logger.info(
-        f"Loaded {len(all_data['productOfferingPrices'])} product offering prices"
-    )
-
-    return all_data
-
-
 async def cleanup_all_resources():
     """Delete all existing resources from the product catalog."""
     logger.info("Starting cleanup of all resources...")
 
-    # Clean up product offering prices
-    logger.info("Cleaning up product offering prices...")
-    prices = await get_product_offering_price()
-    if prices and not isinstance(prices, dict):
-        for price in prices:
-            price_id = price.get("id")
-            if price_id:
-                logger.info(f"Deleting product offering price with ID: {price_id}")
-                await delete_product_offering_price(price_id)
-                await asyncio.sleep(0.1)  # Small delay to avoid overwhelming the API
-
-    # Clean up product offerings
-    logger.info("Cleaning up product offerings...")
-    offerings = await get_product_offering()
-    if offerings and not isinstance(offerings, dict):
-        for offering in offerings:
-            offering_id = offering.get("id")
-            if offering_id:
-                logger.info(f"Deleting product offering with ID: {offering_id}")
-                await delete_product_offering(offering_id)
-                await asyncio.sleep(0.1)
-
-    # Clean up product specifications
-    logger.info("Cleaning up product specifications...")
-    specs = await get_product_specification()
-    if specs and not isinstance(specs, dict):
-        for spec in specs:
-            spec_id = spec.get("id")
-            if spec_id:
-                logger.info(f"Deleting product specification with ID: {spec_id}")
-                await delete_product_specification(spec_id)
-                await asyncio.sleep(0.1)
-
-    # Clean up categories
-    logger.info("Cleaning up categories...")
-    categories = await get_category()
-    if categories and not isinstance(categories, dict):
-        for category in categories:
-            category_id = category.get("id")
-            if category_id:
-                logger.info(f"Deleting category with ID: {category_id}")
-                await delete_category(category_id)
-                await asyncio.sleep(0.1)
-
-    # Clean up catalogs
-    logger.info("Cleaning up catalogs...")
-    catalogs = await get_catalog()
-    if catalogs and not isinstance(catalogs, dict):
-        for catalog in catalogs:
-            catalog_id = catalog.get("id")
-            if catalog_id:
-                logger.info(f"Deleting catalog with ID: {catalog_id}")
-                await delete_catalog(catalog_id)
-                await asyncio.sleep(0.1)
+    async def log_progress(done: int, total: int) -> None:
+        logger.info(f"Deleted {done} of {total} resources")
+
+    try:
+        result = await cleanup(progress=log_progress)
+    except Tmf620Error as e:
+        logger.error(f"Failed to list resources: {e.detail}")
+        return
+    for failure in result["failed"]:
+        logger.error(
+            f"Failed to delete {failure['resource']} {failure['id']}: {failure['error']}"
+        )
 
     logger.info("Cleanup completed")
 
@@ -295,6 +190,9 @@ async def populate_all_test_data() -> Tuple[bool, Dict[str, Dict[str, str]]]:
     """
     Populate the catalog with all test data from the test_payloads directory.
 
+    The payloads are created by product_catalog_loader, which creates each dependency
+    level concurrently and links offerings to their specifications, categories and prices.
+
     Returns:
         Tuple containing:
         - Boolean indicating success/failure
@@ -302,267 +200,30 @@ async def populate_all_test_data() -> Tuple[bool, Dict[str, Dict[str, str]]]:
     """
     logger.info("Populating catalog with all test data...")
 
-    # Load all test data
-    all_data = await load_all_test_data()
-
-    # Track all created resources by their names
-    created_resources = {
-        "catalogs": {},
-        "categories": {},
-        "productSpecifications": {},
-        "productOfferings": {},
-        "productOfferingPrices": {},
-    }
-
     try:
-        # Step 1: Create catalogs
-        logger.info("Creating catalogs...")
-        for catalog_data in all_data["catalogs"]:
-            name = catalog_data.get("name", "Unnamed catalog")
-            created_catalog = await create_catalog(catalog_data)
-            if "error" in created_catalog:
-                logger.error(
-                    f"Failed to create catalog '{name}': {created_catalog['error']}"
-                )
-                return False, created_resources
-            created_resources["catalogs"][name] = created_catalog.get("id")
-            logger.info(
-                f"Created catalog '{name}' with ID: {created_catalog.get('id')}"
-            )
-            await asyncio.sleep(0.1)
-
-        # Step 2: Create categories
-        logger.info("Creating categories...")
-        for category_data in all_data["categories"]:
-            name = category_data.get("name", "Unnamed category")
-            created_category = await create_category(category_data)
-            if "error" in created_category:
-                logger.error(
-                    f"Failed to create category '{name}': {created_category['error']}"
-                )
-                return False, created_resources
-            created_resources["categories"][name] = created_category.get("id")
-            logger.info(
-                f"Created category '{name}' with ID: {created_category.get('id')}"
-            )
-            await asyncio.sleep(0.1)
-
-        # Step 3: Create product specifications
-        logger.info("Creating product specifications...")
-        for spec_data in all_data["productSpecifications"]:
-            name = spec_data.get("name", "Unnamed specification")
-            created_spec = await create_product_specification(spec_data)
-            if "error" in created_spec:
-                logger.error(
-                    f"Failed to create product specification '{name}': {created_spec['error']}"
-                )
-                return False, created_resources
-            created_resources["productSpecifications"][name] = created_spec.get("id")
-            logger.info(
-                f"Created product specification '{name}' with ID: {created_spec.get('id')}"
-            )
-            await asyncio.sleep(0.1)
-
-        # Step 4: Create product offerings (update references to specs and categories)
-        logger.info("Creating product offerings...")
-        for offering_data in all_data["productOfferings"]:
-            name = offering_data.get("name", "Unnamed offering")
-
-            # Update product specification reference if present
-            if (
-                "productSpecification" in offering_data
-                and offering_data["productSpecification"]
-            ):
-                spec_name = offering_data["productSpecification"].get("name", "")
-                spec_id = None
-
-                # Find the spec ID by name
-                for spec_full_name, spec_id_value in created_resources[
-                    "productSpecifications"
-                ].items():
-                    if spec_name in spec_full_name:
-                        spec_id = spec_id_value
-                        break
-
-                if spec_id:
-                    # Create a proper reference with updated href
-                    offering_data["productSpecification"] = create_entity_reference(
-                        "ProductSpecification", spec_id, spec_name
-                    )
-
-            # Update category references if present
-            if "category" in offering_data and offering_data["category"]:
-                updated_categories = []
-                for i in range(len(offering_data["category"])):
-                    cat_name = offering_data["category"][i].get("name", "")
-                    cat_id = None
-
-                    # Find the category ID by name
-                    for cat_full_name, cat_id_value in created_resources[
-                        "categories"
-                    ].items():
-                        if cat_name in cat_full_name:
-                            cat_id = cat_id_value
-                            break
-
-                    if cat_id:
-                        # Create a proper reference with updated href
-                        updated_categories.append(
-                            create_entity_reference("Category", cat_id, cat_name)
-                        )
-
-                # Replace the category array with updated references
-                if updated_categories:
-                    offering_data["category"] = updated_categories
-
-            created_offering = await create_product_offering(offering_data)
-            if "error" in created_offering:
-                logger.error(
-                    f"Failed to create product offering '{name}': {created_offering['error']}"
-                )
-                return False, created_resources
-            created_resources["productOfferings"][name] = created_offering.get("id")
-            logger.info(
-                f"Created product offering '{name}' with ID: {created_offering.get('id')}"
-            )
-            await asyncio.sleep(
-                0.5
-            )  # Step 5: Create product offering prices (without reference back to offerings)
-        logger.info("Creating product offering prices...")
-        # Track mapping of price names to price IDs for later use
-        price_name_to_id_map = {}
-
-        for price_data in all_data["productOfferingPrices"]:
-            name = price_data.get("name", "Unnamed price")
-
-            # Remove any product offering references from the price data
-            # Since we're implementing one-directional references (offering to price)
-            if "productOffering" in price_data:
-                del price_data["productOffering"]
-
-            created_price = await create_product_offering_price(price_data)
-            if "error" in created_price:
-                logger.error(
-                    f"Failed to create product offering price '{name}': {created_price['error']}"
-                )
-                return False, created_resources
-
-            price_id = created_price.get("id")
-            created_resources["productOfferingPrices"][name] = price_id
-            price_name_to_id_map[name] = price_id  # Store for later reference
-            logger.info(f"Created product offering price '{name}' with ID: {price_id}")
-            await asyncio.sleep(0.1)
-
-        # Step 6: Update product offerings with links to their prices
-        logger.info("Updating product offerings with links to their prices...")
-        # We need to map which prices belong to which offerings based on naming conventions
-        price_pattern = re.compile(r"(.+?)_price\.json$")
-        offering_pattern = re.compile(r"(.+?)_offering\.json$")
-
-        # Extract base names from offering files to match with price files
-        offering_base_names = {}
-        for offering_file in [
-            f for f in os.listdir(test_data_dir) if f.endswith("_offering.json")
-        ]:
-            match = offering_pattern.match(offering_file)
-            if match:
-                base_name = match.group(1)
-                offering_data = await load_json_file(offering_file)
-                offering_name = offering_data.get("name", "")
-                offering_id = None
-
-                # Find the offering ID by name
-                for full_name, id_value in created_resources[
-                    "productOfferings"
-                ].items():
-                    if offering_name in full_name:
-                        offering_id = id_value
-                        offering_base_names[base_name] = offering_id
-                        break
-
-        # Now iterate through price files and find matching offerings
-        for price_file in [
-            f for f in os.listdir(test_data_dir) if f.endswith("_price.json")
-        ]:
-            match = price_pattern.match(price_file)
-            if match:
-                price_base_name = match.group(1)
-
-                # Find matching offering
-                offering_id = offering_base_names.get(price_base_name)
-                if offering_id:
-                    # Get price details
-                    price_data = await load_json_file(price_file)
-                    price_name = price_data.get("name", "")
-                    price_id = None
-
-                    # Find price ID by name
-                    for full_name, id_value in created_resources[
-                        "productOfferingPrices"
-                    ].items():
-                        if price_name in full_name:
-                            price_id = id_value
-                            break
-
-                    if price_id:
-                        # Get the current offering to update it
-                        current_offering = await get_product_offering(offering_id)
-                        if not current_offering:
-                            logger.warning(
-                                f"Could not retrieve product offering {offering_id} for updating"
-                            )
-                            continue
-
-                        # Initialize or update productOfferingPrice array
-                        if "productOfferingPrice" not in current_offering:
-                            current_offering["productOfferingPrice"] = []
-
-                        # Check if the price reference is already there
-                        price_already_linked = False
-                        for existing_price in current_offering.get(
-                            "productOfferingPrice", []
-                        ):
-                            if existing_price.get("id") == price_id:
-                                price_already_linked = True
-                                break
-
-                        if not price_already_linked:
-                            # Add the price reference to the offering with proper href
-                            current_offering["productOfferingPrice"].append(
-                                create_entity_reference(
-                                    "ProductOfferingPrice", price_id, price_name
-                                )
-                            )
-
-                            # Update the offering
-                            updated_offering = await update_product_offering(
-                                offering_id,
-                                {
-                                    "productOfferingPrice": current_offering[
-                                        "productOfferingPrice"
-                                    ]
-                                },
-                            )
-
-                            if "error" in updated_offering:
-                                logger.error(
-                                    f"Failed to update product offering with price: {updated_offering['error']}"
-                                )
-                            else:
-                                logger.info(
-                                    f"Linked price {price_id} to product offering {offering_id}"
-                                )
-
-                        await asyncio.sleep(0.1)
-
-        logger.info("Successfully populated catalog with all test data.")
-        return True, created_resources
-
+        result = await load_directories(test_data_dir)
     except Exception as e:
         logger.error(f"Error populating catalog: {str(e)}")
         logger.error(traceback.format_exc())
+        return False, {}
+
+    created_resources = {
+        "catalogs": result["created"]["catalog"],
+        "categories": result["created"]["category"],
+        "productSpecifications": result["created"]["productSpecification"],
+        "productOfferings": result["created"]["productOffering"],
+        "productOfferingPrices": result["created"]["productOfferingPrice"],
+    }
+    for failure in result["failed"]:
+        logger.error(
+            f"Failed to create {failure['resource']} '{failure['name']}': {failure['error']}"
+        )
+    if result["failed"]:
         return False, created_resources
 
+    logger.info("Successfully populated catalog with all test data.")
+    return True, created_resources
+
 
 async def run_catalog_tests():
     """Test catalog CRUD operations."""
@@ -871,9 +532,13 @@ async def run_product_offering_price_tests():
             logger.error(
                 f"Could not retrieve product offering {offering_id} for updating"
             )
-            return False  # Initialize productOfferingPrice array if not present
-        if "productOfferingPrice" not in current_offering:
-            current_offering["productOfferingPrice"] = []
+            return False
+        # Copy the productOfferingPrice array, as the offering returned by the API module
+        # may be shared with its response cache
+        current_offering = dict(current_offering)
+        current_offering["productOfferingPrice"] = list(
+            current_offering.get("productOfferingPrice", [])
+        )
 
         # Add the price reference to the offering with proper href
         current_offering["productOfferingPrice"].append(
@@ -1013,6 +678,8 @@ async def main():
     except Exception as e:
         logger.error(f"Unexpected error in main test execution: {str(e)}")
         logger.error(traceback.format_exc())
+    finally:
+        await close_http_client()
 
     logger.info("=========================================================")
     logger.info("Product Catalog API Test Completed")
@@ -0,0 +1,1745 @@
+#!/usr/bin/env python3
+# Test script for the Tmf620Client middleware and the cleanup engine in product_catalog_api.py,
+# and for product_catalog_loader.py, product_catalog_graph.py and product_catalog_snapshot.py
+# The delta sync tests use the lastUpdate>="..." filter, in the query-to-mongo syntax of the
+# Product Catalog API, which the stub backend parses the same way.
+# The tests run in-process against the stub backend in stub_product_catalog_backend.py, so no
+# Product Catalog API or MongoDB is needed. The event tests also route the hub notifications
+# to the listener endpoint of the MCP server app.
+#
+# Examples:
+#   python test_tmf620_client.py
+
+import csv
+import io
+import os
+import sys
+import json
+import time
+import tempfile
+import asyncio
+import logging
+import traceback
+
+import httpx
+from mcp.server.fastmcp import FastMCP
+from mcp.types import ListToolsRequest
+
+# Import the modules to test
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import product_catalog_api
+from product_catalog_api import (
+    Tmf620Client,
+    ResponseCache,
+    SingleFlight,
+    RetryBudget,
+    RetryPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimiter,
+    AdaptiveConcurrencyLimiter,
+    register_event_listener,
+    unregister_event_listener,
+    plan_cleanup,
+    run_cleanup,
+    expand_references,
+    ReferenceLoader,
+    DeltaSync,
+    Tmf620Error,
+    render_metrics,
+)
+import product_catalog_mcp_server
+from product_catalog_mcp_server import (
+    mcp,
+    catalog_get,
+    create_batch,
+    MCP_BATCH_MAX_ITEMS,
+)
+from product_catalog_loader import load_payloads, load_catalog
+from product_catalog_graph import CatalogGraph
+from product_catalog_snapshot import CatalogSnapshot
+from stub_product_catalog_backend import BASE_PATH, create_app
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logging.getLogger("product-catalog-api").setLevel(logging.WARNING)
+logging.getLogger("product-catalog-mcp").setLevel(logging.WARNING)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logger = logging.getLogger("tmf620-client-test")
+
+STUB_URL = "http://stub"
+
+
+def create_client(app, *middleware) -> Tmf620Client:
+    """Create a client that sends its requests to the in-process stub backend.
+
+    A ResponseCache passed as the only middleware is followed by a SingleFlight stage.
+    """
+    if len(middleware) == 1 and isinstance(middleware[0], ResponseCache):
+        middleware = (middleware[0], SingleFlight())
+    http_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=STUB_URL
+    )
+    return Tmf620Client(
+        base_url=f"{STUB_URL}{BASE_PATH}",
+        middleware=list(middleware),
+        http_client=http_client,
+    )
+
+
+def backend_requests(app, method: str = "GET", status: int = None) -> int:
+    """Count the requests handled by the stub backend."""
+    return sum(
+        1
+        for m, _, s in app.state.requests
+        if m == method and (status is None or s == status)
+    )
+
+
+def lists_changes(url: str) -> bool:
+    """Check that a list request selects the resources updated since a quoted lastUpdate."""
+    return httpx.URL(url).params.get("lastUpdate>", "").startswith('"')
+
+
+async def run_full_scan_tests() -> bool:
+    """get_all fans out only where the total count describes the requested items."""
+    logger.info("Testing full collection scans...")
+    app = create_app()
+    client = create_client(app)
+    for i in range(250):
+        status = "Retired" if i % 100 == 7 else "Active"
+        app.state.store["productOffering"][f"po-{i:03}"] = {
+            "id": f"po-{i:03}",
+            "lifecycleStatus": status,
+        }
+
+    # X-Total-Count counts the whole collection, so a filtered scan is read page by page
+    before = backend_requests(app)
+    retired = await client.get_all(
+        "productOffering", page_size=20, filter={"lifecycleStatus": "Retired"}
+    )
+    if [o["id"] for o in retired] != ["po-007", "po-107", "po-207"]:
+        logger.error(f"Unexpected filtered scan: {retired}")
+        return False
+    if backend_requests(app) - before > 2:
+        logger.error(f"Filtered scan took {backend_requests(app) - before} requests")
+        return False
+
+    before = backend_requests(app)
+    offerings = await client.get_all("productOffering", page_size=20)
+    ids = [o["id"] for o in offerings]
+    if ids != sorted(app.state.store["productOffering"]):
+        logger.error(f"Full scan returned {len(ids)} items")
+        return False
+    if backend_requests(app) - before != 13:
+        logger.error(f"Full scan took {backend_requests(app) - before} requests")
+        return False
+
+    # A server capping the page size: the windows follow the size of the first page
+    documents = [{"id": f"c-{i:02}"} for i in range(95)]
+
+    def capped(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        limit = min(int(request.url.params.get("limit", 10)), 10)
+        return httpx.Response(
+            206,
+            json=documents[offset : offset + limit],
+            headers={"X-Total-Count": str(len(documents))},
+        )
+
+    capped_client = Tmf620Client(
+        base_url=f"{STUB_URL}{BASE_PATH}",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(capped)),
+    )
+    catalogs = await capped_client.get_all("catalog", page_size=50)
+    if catalogs != documents:
+        logger.error(f"Capped scan returned {len(catalogs)} of 95 items")
+        return False
+
+    logger.info("Full scans request only the pages they need")
+    return True
+
+
+async def run_cache_tests() -> bool:
+    """Repeated GETs are served from the cache and writes invalidate it."""
+    logger.info("Testing read-through caching and invalidation...")
+    app = create_app()
+    client = create_client(app, ResponseCache(ttl=60))
+
+    spec = await client.create("productSpecification", {"name": "Fibre 100"})
+    first = await client.get("productSpecification", spec["id"])
+    second = await client.get("productSpecification", spec["id"])
+    if first is not second or backend_requests(app) != 1:
+        logger.error("Repeated GET was not served from the cache")
+        return False
+
+    await client.get("productSpecification", spec["id"], fields="name")
+    if backend_requests(app) != 2:
+        logger.error("GET with different fields must not share a cache entry")
+        return False
+
+    await client.update("productSpecification", spec["id"], {"name": "Fibre 200"})
+    updated = await client.get("productSpecification", spec["id"])
+    if updated.get("name") != "Fibre 200" or backend_requests(app) != 3:
+        logger.error("Update did not invalidate the cached specification")
+        return False
+
+    await client.create("productSpecification", {"name": "Fibre 500"})
+    listed = await client.get("productSpecification")
+    if len(listed) != 2:
+        logger.error("Create did not invalidate the cached list")
+        return False
+
+    logger.info("Caching and invalidation work as expected")
+    return True
+
+
+async def run_concurrent_get_tests() -> bool:
+    """Concurrent identical GETs share one upstream request."""
+    logger.info("Testing coalescing of concurrent GETs...")
+    app = create_app()
+    client = create_client(app, ResponseCache(ttl=0))
+
+    catalog = await client.create("catalog", {"name": "Consumer"})
+    results = await asyncio.gather(
+        *(client.get("catalog", catalog["id"]) for _ in range(10))
+    )
+    if backend_requests(app) != 1 or any(r is not results[0] for r in results):
+        logger.error(f"Expected 1 upstream GET, got {backend_requests(app)}")
+        return False
+
+    logger.info("Concurrent GETs were coalesced")
+    return True
+
+
+async def run_etag_revalidation_tests() -> bool:
+    """Expired entries are revalidated with If-None-Match."""
+    logger.info("Testing revalidation with ETag...")
+    app = create_app(etag=True)
+    client = create_client(app, ResponseCache(ttl=0.05))
+
+    offering = await client.create("productOffering", {"name": "Mobile S"})
+    first = await client.get("productOffering", offering["id"])
+    await asyncio.sleep(0.1)
+    second = await client.get("productOffering", offering["id"])
+    if second is not first or backend_requests(app, status=304) != 1:
+        logger.error("Expired entry was not revalidated with a 304")
+        return False
+
+    # A change made by another client is picked up on the next revalidation
+    app.state.store["productOffering"][offering["id"]]["name"] = "Mobile M"
+    await asyncio.sleep(0.1)
+    third = await client.get("productOffering", offering["id"])
+    if third.get("name") != "Mobile M":
+        logger.error("Modified resource was served from the cache")
+        return False
+
+    logger.info("ETag revalidation works as expected")
+    return True
+
+
+async def run_no_validator_tests() -> bool:
+    """Without validators from the server, expired entries are refetched in full."""
+    logger.info("Testing expiry without validators...")
+    app = create_app(etag=False)
+    conditional = []
+
+    async def record(request, call_next):
+        if "If-None-Match" in request.headers or "If-Modified-Since" in request.headers:
+            conditional.append(request)
+        return await call_next(request)
+
+    client = create_client(app, ResponseCache(ttl=0.05), record)
+
+    category = await client.create("category", {"name": "Broadband"})
+    await client.get("category", category["id"])
+    await client.get("category")
+    await asyncio.sleep(0.1)
+    # A change made by another client within the same second is picked up after expiry
+    other_client = create_client(app, ResponseCache(ttl=0))
+    await other_client.update("category", category["id"], {"name": "Mobile"})
+    refreshed = await client.get("category", category["id"])
+    await client.get("category")
+    if conditional or backend_requests(app, status=304):
+        logger.error("Sent a conditional GET without a validator from the server")
+        return False
+    if refreshed.get("name") != "Mobile":
+        logger.error("Modified resource was served from the cache")
+        return False
+
+    logger.info("Expired entries without validators are refetched")
+    return True
+
+
+async def run_event_tests() -> bool:
+    """Hub events keep the module cache of the MCP server current."""
+    logger.info("Testing event-driven cache updates...")
+    mcp_app = mcp.streamable_http_app()
+    app = create_app(
+        http_client=httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=mcp_app), base_url="http://mcp"
+        )
+    )
+    # Point the module client used by the MCP server at the stub backend
+    client = product_catalog_api.tmf620_client
+    cache = product_catalog_api.response_cache
+    saved = (client.base_url, client.http_client, cache.ttl)
+    client.base_url = f"{STUB_URL}{BASE_PATH}"
+    client.http_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=STUB_URL
+    )
+    cache.clear()
+    cache.ttl = 1
+    # Changes made by another application, reported to the MCP server through the hub
+    other_client = create_client(app, ResponseCache(ttl=0))
+
+    try:
+        await register_event_listener("http://mcp/listener")
+        if len(app.state.hub) != 1 or cache.ttl != product_catalog_api.EVENT_CACHE_TTL:
+            logger.error("Listener was not registered or the TTL was not extended")
+            return False
+
+        spec = await other_client.create("productSpecification", {"name": "TV Basic"})
+        await client.get("productSpecification", spec["id"])
+        gets = backend_requests(app)
+
+        await other_client.update(
+            "productSpecification", spec["id"], {"name": "TV Plus"}
+        )
+        refreshed = await client.get("productSpecification", spec["id"])
+        if refreshed.get("name") != "TV Plus" or backend_requests(app) != gets:
+            logger.error("Change event did not refresh the cached specification")
+            return False
+
+        await client.get("productSpecification")
+        await other_client.create("productSpecification", {"name": "TV Max"})
+        listed = await client.get("productSpecification")
+        if len(listed) != 2:
+            logger.error("Creation event did not invalidate the cached list")
+            return False
+
+        # Events without the secret registered with the hub are rejected
+        listed = await client.get("productSpecification")
+        forged = {
+            "eventType": "ProductSpecificationAttributeValueChangeEvent",
+            "event": {"productSpecification": {**listed[0], "name": "Forged"}},
+        }
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=mcp_app), base_url="http://mcp"
+        ) as outsider:
+            rejected = await outsider.post("/listener", json=forged)
+            wrong = await outsider.post("/listener?secret=guess", json=forged)
+        cached = await client.get("productSpecification", listed[0]["id"])
+        if {rejected.status_code, wrong.status_code} != {401} or (
+            cached.get("name") == "Forged"
+        ):
+            logger.error("An event without the listener secret was applied")
+            return False
+
+        await other_client.delete("productSpecification", spec["id"])
+        try:
+            await client.get("productSpecification", spec["id"])
+            logger.error("Remove event did not invalidate the cached specification")
+            return False
+        except Tmf620Error as e:
+            if e.status != 404:
+                raise
+
+        await unregister_event_listener()
+        if app.state.hub or cache.ttl != 1:
+            logger.error("Listener was not unregistered or the TTL was not restored")
+            return False
+    finally:
+        await unregister_event_listener()
+        client.base_url, client.http_client, cache.ttl = saved
+        cache.clear()
+
+    logger.info("Events keep the cache current")
+    return True
+
+
+async def run_retry_tests() -> bool:
+    """Transient failures of idempotent requests are retried within the budget."""
+    logger.info("Testing retries...")
+    app = create_app()
+    retry = RetryPolicy(base_delay=0.01, max_retry_after=1)
+    client = create_client(app, retry)
+    catalog = await client.create("catalog", {"name": "Enterprise"})
+
+    # Two 503s, the second with Retry-After, then success
+    app.state.faults += [(503, {}), (503, {"Retry-After": "0"})]
+    result = await client.get("catalog", catalog["id"])
+    if result.get("name") != "Enterprise" or backend_requests(app) != 3:
+        logger.error("GET was not retried after 503 responses")
+        return False
+
+    # Non-idempotent requests, permanent errors and long Retry-After are not retried
+    for method, fault in [
+        ("POST", (503, {})),
+        ("GET", (500, {})),
+        ("GET", (503, {"Retry-After": "60"})),
+    ]:
+        app.state.faults.append(fault)
+        before = len(app.state.requests)
+        try:
+            if method == "POST":
+                await client.create("catalog", {"name": "Wholesale"})
+            else:
+                await client.get("catalog", catalog["id"])
+            logger.error(f"Injected {fault[0]} did not fail the {method}")
+            return False
+        except Tmf620Error as e:
+            if e.status != fault[0] or len(app.state.requests) != before + 1:
+                logger.error(f"{method} was retried after {fault[0]} {fault[1]}")
+                return False
+
+    # Once the budget is spent, failures are returned without retrying
+    retry = RetryPolicy(
+        base_delay=0.01, budget=RetryBudget(ratio=0, min_retries=1, window=60)
+    )
+    client = create_client(app, retry)
+    app.state.faults.append((502, {}))
+    await client.get("catalog", catalog["id"])
+    app.state.faults.append((502, {}))
+    try:
+        await client.get("catalog", catalog["id"])
+        logger.error("Retry budget was not enforced")
+        return False
+    except Tmf620Error:
+        pass
+    if retry.budget_exhausted != 1:
+        logger.error("Retry budget exhaustion was not counted")
+        return False
+
+    logger.info("Retries work as expected")
+    return True
+
+
+async def run_circuit_breaker_tests() -> bool:
+    """Circuits open on failures or slow calls, fail fast, and close after trial calls."""
+    logger.info("Testing the circuit breaker...")
+    app = create_app()
+    breaker = CircuitBreaker(
+        window=4,
+        min_calls=4,
+        slow_call_duration=0.05,
+        open_duration=0.2,
+        half_open_calls=1,
+    )
+    client = create_client(app, breaker)
+    catalog = await client.create("catalog", {"name": "Partner"})
+
+    app.state.faults += [(503, {})] * 4
+    for _ in range(4):
+        try:
+            await client.get("catalog", catalog["id"])
+        except Tmf620Error:
+            pass
+    # The circuit opens before every injected failure has been used
+    app.state.faults.clear()
+    if breaker.state("catalog") != "open" or breaker.state("category") != "closed":
+        logger.error("Failures did not open the catalog circuit only")
+        return False
+
+    before = len(app.state.requests)
+    try:
+        await client.get("catalog", catalog["id"])
+        logger.error("Request was sent while the circuit was open")
+        return False
+    except CircuitOpenError as e:
+        if len(app.state.requests) != before or e.to_dict()["error"]["status"] != 503:
+            logger.error("Open circuit did not fail fast with a structured error")
+            return False
+
+    # After the cool-down a successful trial call closes the circuit
+    await asyncio.sleep(0.25)
+    await client.get("catalog", catalog["id"])
+    if breaker.state("catalog") != "closed":
+        logger.error("Successful trial call did not close the circuit")
+        return False
+
+    # Slow calls open the circuit as well
+    app.state.latency = 0.06
+    for _ in range(4):
+        await client.get("catalog", catalog["id"])
+    app.state.latency = 0.0
+    if breaker.state("catalog") != "open":
+        logger.error("Slow calls did not open the circuit")
+        return False
+
+    # MCP tools return the structured error without calling the API
+    module_breaker = product_catalog_api.circuit_breaker
+    module_breaker._open("catalog", module_breaker._circuit("catalog"), "test")
+    try:
+        result = await catalog_get(catalog_id="any")
+    finally:
+        module_breaker._circuits.clear()
+    if result.get("error", {}).get("status") != 503:
+        logger.error(f"Tool did not fail fast: {result}")
+        return False
+
+    logger.info("Circuit breaker works as expected")
+    return True
+
+
+async def run_rate_limiter_tests() -> bool:
+    """Requests are paced to the configured rate per method and resource."""
+    logger.info("Testing the rate limiter...")
+    app = create_app()
+    limiter = RateLimiter("POST=20/1,GET:catalog=1000")
+    client = create_client(app, limiter)
+
+    started = time.monotonic()
+    await asyncio.gather(
+        *(client.create("category", {"name": f"Category {i}"}) for i in range(11))
+    )
+    elapsed = time.monotonic() - started
+    if not 0.45 <= elapsed < 1.0:
+        logger.error(f"11 POSTs at 20/s with burst 1 took {elapsed:.2f}s")
+        return False
+
+    started = time.monotonic()
+    await asyncio.gather(*(client.get("category") for _ in range(20)))
+    if time.monotonic() - started > 0.4 or limiter.delayed.get("GET:catalog"):
+        logger.error("Requests without a matching bucket were delayed")
+        return False
+
+    logger.info("Rate limiter works as expected")
+    return True
+
+
+async def run_concurrency_limiter_tests() -> bool:
+    """The concurrency limit grows on a healthy API and shrinks on errors."""
+    logger.info("Testing the adaptive concurrency limiter...")
+    app = create_app()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=2, max_limit=50)
+    client = create_client(app, limiter)
+    category = await client.create("category", {"name": "Mobile"})
+
+    app.state.latency = 0.005
+    await asyncio.gather(*(client.get("category", category["id"]) for _ in range(200)))
+    if limiter.limit <= 4 or limiter.queued == 0:
+        logger.error(f"Limit did not grow on a healthy API: {limiter.limit:.1f}")
+        return False
+
+    grown = limiter.limit
+    app.state.latency = 0.0
+    app.state.faults += [(503, {})] * 20
+    for _ in range(20):
+        try:
+            await client.get("category", category["id"])
+        except Tmf620Error:
+            pass
+    if limiter.limit >= grown or limiter.decreases == 0:
+        logger.error(f"Limit did not shrink after errors: {limiter.limit:.1f}")
+        return False
+
+    logger.info(
+        f"Concurrency limit grew from 4 to {grown:.1f}, then shrank to {limiter.limit:.1f}"
+    )
+    return True
+
+
+async def run_create_many_tests() -> bool:
+    """Bulk creates return one result per item, in order, and honour stop_on_error."""
+    logger.info("Testing bulk create...")
+    app = create_app()
+    client = create_client(app)
+
+    items = [{"name": f"Category {i}"} for i in range(10)]
+    results = await client.create_many("category", items, concurrency=3)
+    if [r.get("name") for r in results] != [i["name"] for i in items]:
+        logger.error("Bulk create results are not in input order")
+        return False
+
+    # The second create fails; without stop_on_error the others still go ahead
+    app.state.faults.append((400, {}))
+    results = await client.create_many("category", items[:1] + items[:3], concurrency=1)
+    statuses = [r["error"]["status"] if "error" in r else 201 for r in results]
+    if statuses != [400, 201, 201, 201]:
+        logger.error(f"Unexpected per-item results: {statuses}")
+        return False
+
+    app.state.faults.append((400, {}))
+    results = await client.create_many(
+        "category", items[:3], concurrency=1, stop_on_error=True
+    )
+    statuses = [r["error"]["status"] if "error" in r else 201 for r in results]
+    if statuses != [400, 424, 424] or backend_requests(app, "POST") != 15:
+        logger.error(f"stop_on_error did not skip the remaining items: {statuses}")
+        return False
+
+    oversized = await create_batch("category", [{}] * (MCP_BATCH_MAX_ITEMS + 1))
+    if oversized.get("error", {}).get("status") != 413:
+        logger.error("Oversized batch was not rejected")
+        return False
+
+    logger.info("Bulk create keeps order and reports per-item errors")
+    return True
+
+
+async def run_loader_tests() -> bool:
+    """The loader creates payloads level by level and links them by ID."""
+    logger.info("Testing the catalog loader...")
+    app = create_app()
+    client = create_client(app)
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+
+    result = await load_catalog(load_payloads(payloads), client=client)
+    store = app.state.store
+    if result["failed"] or len(store["productOffering"]) != 16:
+        logger.error(f"Test payloads were not loaded: {result['failed']}")
+        return False
+    for offering in store["productOffering"].values():
+        references = [offering["productSpecification"], *offering["category"]]
+        references += offering["productOfferingPrice"]
+        if len(offering["productOfferingPrice"]) != 1 or not all(
+            reference["id"] in store[reference["href"].split("/")[-2]]
+            for reference in references
+        ):
+            logger.error(f"Offering {offering['name']} is not linked by ID")
+            return False
+    if backend_requests(app, "PATCH"):
+        logger.error("Offerings were patched after creation")
+        return False
+
+    # The offerings of a specification that cannot be created are skipped
+    app = create_app()
+    client = create_client(app)
+    nodes = load_payloads(payloads)
+    nodes.sort(key=lambda node: node.resource != "productSpecification")
+    app.state.faults.append((400, {}))
+    result = await load_catalog(nodes, client=client, concurrency=1)
+    statuses = sorted(failure["error"]["status"] for failure in result["failed"])
+    if statuses != [400, 424, 424]:
+        logger.error(f"Unexpected failures: {statuses}")
+        return False
+
+    # Payloads sharing a name are all created and reported
+    app = create_app()
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "category.json"), "w") as f:
+            json.dump([{"name": "Mobile"}, {"name": "Mobile"}, {"name": "TV"}], f)
+        result = await load_catalog(load_payloads(directory), client=create_client(app))
+    duplicates = result["duplicates"]
+    if (
+        len(app.state.store["category"]) != 3
+        or len(duplicates) != 1
+        or {d["id"] for d in duplicates[0]["created"]}
+        != {
+            c["id"]
+            for c in app.state.store["category"].values()
+            if c["name"] == "Mobile"
+        }
+        or result["created"]["category"]["Mobile"] != duplicates[0]["created"][0]["id"]
+    ):
+        logger.error(f"Duplicate names were not reported: {duplicates}")
+        return False
+
+    logger.info("Loader linked all test payloads without a second pass")
+    return True
+
+
+async def run_cleanup_tests() -> bool:
+    """A catalog is deleted with its content, then everything else."""
+    logger.info("Testing cascade delete and cleanup...")
+    app = create_app()
+    client = create_client(app)
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=client)
+    store = app.state.store
+
+    # List the categories of each catalog by name prefix (Enterprise ..., Wholesale ...)
+    catalogs = {}
+    for catalog in list(store["catalog"].values()):
+        prefix = catalog["name"].split()[0]
+        categories = [
+            {"id": c["id"], "name": c["name"]}
+            for c in store["category"].values()
+            if c["name"].startswith(prefix)
+        ]
+        await client.update("catalog", catalog["id"], {"category": categories})
+        catalogs[prefix] = catalog["id"]
+    # A specification shared with the other catalog must be kept
+    wholesale = next(
+        o for o in store["productOffering"].values() if o["name"].startswith("Metro")
+    )
+    enterprise = next(
+        o for o in store["productOffering"].values() if "MPLS" in o["name"]
+    )
+    await client.update(
+        "productOffering",
+        wholesale["id"],
+        {"productSpecification": enterprise["productSpecification"]},
+    )
+
+    plan = await plan_cleanup(catalogs["Enterprise"], client=client)
+    reports = []
+
+    async def progress(done: int, total: int) -> None:
+        reports.append((done, total))
+
+    result = await run_cleanup(plan, client=client, progress=progress)
+    counts = {resource: len(ids) for resource, ids in store.items()}
+    expected = {
+        "catalog": 1,
+        "category": 2,
+        "productSpecification": 5,
+        "productOffering": 8,
+        "productOfferingPrice": 8,
+    }
+    if result["failed"] or counts != expected:
+        logger.error(f"Unexpected resources left after the catalog cleanup: {counts}")
+        return False
+    if not reports or reports[-1] != (22, 22):
+        logger.error(f"Progress was not reported: {reports}")
+        return False
+
+    # The plan is made from current data, not from cached lists
+    cached = create_client(app, ResponseCache(ttl=60))
+    await cached.get_all("category", fields="id")
+    await client.create("category", {"name": "Created after caching"})
+    plan = await plan_cleanup(client=cached)
+    if len(plan["category"]) != len(store["category"]):
+        logger.error("The cleanup plan was made from cached lists")
+        return False
+
+    # Deleting everything, including resources already deleted by someone else
+    plan = await plan_cleanup(client=client)
+    store["productOffering"].pop(wholesale["id"])
+    handled = len(app.state.requests)
+    result = await run_cleanup(plan, client=client, concurrency=4)
+    if result["failed"] or any(store.values()):
+        logger.error(f"Resources left after the full cleanup: {result['failed']}")
+        return False
+    deletes = [p for m, p, _ in app.state.requests[handled:] if m == "DELETE"]
+    first_category = next(i for i, p in enumerate(deletes) if "/category/" in p)
+    if any("/productOffering/" in p for p in deletes[first_category:]):
+        logger.error("Offerings were deleted after the categories they refer to")
+        return False
+
+    logger.info("Cascade delete kept shared resources and cleanup emptied the catalog")
+    return True
+
+
+async def run_get_many_tests() -> bool:
+    """Multi-ID fetches are de-duplicated and served from the cache where possible."""
+    logger.info("Testing multi-ID fetch...")
+    app = create_app()
+    cache = ResponseCache(ttl=60)
+    client = create_client(app, cache)
+    specs = [
+        await client.create("productSpecification", {"name": f"Spec {i}"})
+        for i in range(3)
+    ]
+    ids = [spec["id"] for spec in specs]
+    await client.get("productSpecification", ids[0])
+    gets = backend_requests(app)
+
+    results = await client.get_many(
+        "productSpecification", [ids[1], ids[0], "missing", ids[1], ids[2]]
+    )
+    if list(results) != [ids[1], ids[0], "missing", ids[2]]:
+        logger.error(f"Unexpected result keys: {list(results)}")
+        return False
+    if results["missing"].get("error", {}).get("status") != 404 or any(
+        results[i].get("id") != i for i in ids
+    ):
+        logger.error(f"Unexpected results: {results}")
+        return False
+    if backend_requests(app) - gets != 3 or cache.hits["productSpecification"] != 1:
+        logger.error("Cached or duplicate IDs were fetched again")
+        return False
+
+    logger.info("Multi-ID fetch requested each uncached ID once")
+    return True
+
+
+async def run_expand_tests() -> bool:
+    """References are expanded in one batch per type, without changing cached data."""
+    logger.info("Testing reference expansion...")
+    app = create_app()
+    cache = ResponseCache(ttl=60)
+    client = create_client(app, cache)
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=client)
+
+    offerings = await client.get("productOffering")
+    gets = backend_requests(app)
+    expanded = await expand_references(
+        offerings,
+        "productOffering",
+        "productSpecification,productOfferingPrice,category",
+        client=client,
+    )
+    # One GET per distinct specification (8), price (16) and category (4)
+    if backend_requests(app) - gets != 28:
+        logger.error(f"Expansion made {backend_requests(app) - gets} requests")
+        return False
+    offering = expanded[0]
+    if "productSpecCharacteristic" not in offering["productSpecification"] or not (
+        offering["productOfferingPrice"][0].get("price")
+    ):
+        logger.error(f"References were not expanded: {offering}")
+        return False
+    if "productSpecCharacteristic" in offerings[0]["productSpecification"]:
+        logger.error("Expansion modified the cached offerings")
+        return False
+
+    # Nested paths reuse the cached resources; unresolved references keep an error
+    offering = dict(offerings[0])
+    offering["category"] = offering["category"] + [{"id": "missing", "name": "Gone"}]
+    gets = backend_requests(app)
+    expanded = await expand_references(
+        offering, "productOffering", "category,productSpecification", client=client
+    )
+    if backend_requests(app) - gets != 1:
+        logger.error("Cached references were fetched again")
+        return False
+    if expanded["category"][-1].get("error", {}).get("status") != 404:
+        logger.error(f"Missing reference not reported: {expanded['category'][-1]}")
+        return False
+    try:
+        await expand_references(offering, "productOffering", "price", client=client)
+        logger.error("An unknown reference path was accepted")
+        return False
+    except Tmf620Error as e:
+        if e.status != 400:
+            raise
+
+    # A resource answered with a null body leaves its reference as it is
+    def null_body(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"null")
+
+    null_client = Tmf620Client(
+        base_url=f"{STUB_URL}{BASE_PATH}",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(null_body)),
+    )
+    reference = {"id": "c-1", "name": "Mobile"}
+    expanded = await expand_references(
+        {"id": "o-1", "category": [reference]},
+        "productOffering",
+        "category",
+        null_client,
+    )
+    if expanded["category"] != [reference]:
+        logger.error(f"Null reference body not handled: {expanded}")
+        return False
+
+    # Waiters are released when a batch fetch is cancelled
+    async def hang(request: httpx.Request) -> httpx.Response:
+        await asyncio.Event().wait()
+
+    loader = ReferenceLoader(
+        Tmf620Client(
+            base_url=f"{STUB_URL}{BASE_PATH}",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(hang)),
+        )
+    )
+    pending = loader.load("category", "c-1")
+    await asyncio.sleep(0.01)
+    for task in list(loader._tasks):
+        task.cancel()
+    await asyncio.sleep(0.01)
+    if not pending.cancelled() or loader.load("category", "c-1") is pending:
+        logger.error("Waiters of a cancelled fetch were left pending")
+        return False
+
+    logger.info("Expanded the references of 16 offerings with 28 GETs")
+    return True
+
+
+async def run_graph_tests() -> bool:
+    """The catalog graph answers walks from memory and follows changes incrementally."""
+    logger.info("Testing the catalog graph...")
+    app = create_app()
+    client = create_client(app)
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=client)
+
+    gets = backend_requests(app)
+    graph = await CatalogGraph(client).build()
+    if backend_requests(app) - gets != 5 or graph.size() != 46:
+        logger.error(
+            f"Graph of {graph.size()} resources built with {backend_requests(app) - gets} GETs"
+        )
+        return False
+    networking = next(
+        c["id"]
+        for c in graph.documents["category"].values()
+        if c["name"] == "Enterprise Networking"
+    )
+    gets = backend_requests(app)
+    offerings = graph.find_offerings(networking, max_price=1600, unit="USD")
+    if backend_requests(app) != gets or sorted(o["name"] for o in offerings) != [
+        "Business MPLS Network",
+        "SD-WAN Business",
+    ]:
+        logger.error(f"Unexpected offerings below 1600 USD: {offerings}")
+        return False
+
+    # A sub-category that only names its parent is walked too
+    sub = await client.create("category", {"name": "Branch", "parentId": networking})
+    offering = await client.create(
+        "productOffering", {"name": "Branch Router", "category": [{"id": sub["id"]}]}
+    )
+    price = await client.create(
+        "productOfferingPrice",
+        {"name": "Branch Router - Fee", "price": {"unit": "USD", "value": 99}},
+    )
+    await client.update(
+        "productOffering",
+        offering["id"],
+        {"productOfferingPrice": [{"id": price["id"]}]},
+    )
+    counts = await graph.refresh()
+    if counts != {"added": 3, "changed": 0, "removed": 0}:
+        logger.error(f"Unexpected refresh of new resources: {counts}")
+        return False
+    if "Branch Router" not in [
+        o["name"] for o in graph.find_offerings(networking, 1600)
+    ]:
+        logger.error("Offering of a sub-category not found")
+        return False
+
+    # Changes and deletions are picked up, and an unchanged catalog costs only the list calls
+    cheapest = next(o for o in offerings if o["name"] == "SD-WAN Business")
+    await client.update(
+        "productOfferingPrice",
+        cheapest["prices"][0]["id"],
+        {"price": {"unit": "USD", "value": 1700}},
+    )
+    await client.delete("productOffering", offering["id"])
+    counts = await graph.refresh(scan_deletions=True)
+    if counts != {"added": 0, "changed": 1, "removed": 1}:
+        logger.error(f"Unexpected refresh of changed resources: {counts}")
+        return False
+    if [o["name"] for o in graph.find_offerings(networking, 1600)] != [
+        "Business MPLS Network"
+    ]:
+        logger.error("Refreshed price not used")
+        return False
+    if graph.related("productOfferingPrice", price["id"]):
+        logger.error("Deleted offering still referenced")
+        return False
+    gets = backend_requests(app)
+    counts = await graph.refresh()
+    if any(counts.values()) or backend_requests(app) - gets != 5:
+        logger.error(
+            f"Unchanged catalog refreshed with {backend_requests(app) - gets} GETs"
+        )
+        return False
+
+    # Hub events are applied without any request
+    graph.apply_event(
+        {
+            "eventType": "ProductOfferingRemoveNotification",
+            "event": {"productOffering": {"id": cheapest["id"]}},
+        }
+    )
+    if graph.get("productOffering", cheapest["id"]) is not None:
+        logger.error("Remove event not applied")
+        return False
+
+    metrics = render_metrics(client, [graph])
+    if f'tmf620_catalog_graph_resources{{resource="productOffering"}}' not in metrics:
+        logger.error("Catalog graph metrics not rendered")
+        return False
+
+    logger.info(
+        "Answered category and price walks from the graph, refreshed with delta GETs"
+    )
+    return True
+
+
+async def run_search_tests() -> bool:
+    """Without a catalog graph, a search reads only the category it covers."""
+    logger.info("Testing product offering search without a graph...")
+    app = create_app()
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=create_client(app))
+    graph = await CatalogGraph(create_client(app)).build()
+    networking = next(
+        c["id"]
+        for c in graph.documents["category"].values()
+        if c["name"] == "Enterprise Networking"
+    )
+    server = product_catalog_mcp_server
+    module_client = product_catalog_api.tmf620_client
+    saved = (module_client.base_url, module_client.http_client, server.catalog_graph)
+    module_client.base_url = f"{STUB_URL}{BASE_PATH}"
+    module_client.http_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=STUB_URL
+    )
+    server.catalog_graph = None
+    try:
+        for criteria in ({}, {"max_price": 1600, "unit": "USD"}):
+            handled = len(app.state.requests)
+            result = await server.product_offering_search(
+                networking, max_tokens=0, **criteria
+            )
+            expected = graph.find_offerings(networking, **criteria)
+            by_id = lambda offering: offering["id"]
+            if sorted(result["offerings"], key=by_id) != sorted(expected, key=by_id):
+                logger.error(f"Unexpected search result: {result}")
+                return False
+            paths = [p for _, p, _ in app.state.requests[handled:]]
+            if any(
+                p.endswith(
+                    ("/catalog", "/productSpecification", "/productOfferingPrice")
+                )
+                for p in paths
+            ):
+                logger.error(f"Search read unrelated collections: {paths}")
+                return False
+            product_catalog_api.response_cache.clear()
+
+        result = await server.product_offering_search(max_price=1600)
+        if result.get("error", {}).get("status") != 400:
+            logger.error(f"Search of the whole catalog was not refused: {result}")
+            return False
+        result = await server.product_offering_search("unknown")
+        if result.get("error", {}).get("status") != 404:
+            logger.error(f"Search of an unknown category did not fail: {result}")
+            return False
+    finally:
+        module_client.base_url, module_client.http_client, server.catalog_graph = saved
+        product_catalog_api.response_cache.clear()
+
+    logger.info("Searched one category without reading the whole catalog")
+    return True
+
+
+async def run_write_through_tests() -> bool:
+    """Writes made through the tools are read back from the catalog graph at once."""
+    logger.info("Testing reads from the catalog graph after writes...")
+    app = create_app()
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=create_client(app))
+    server = product_catalog_mcp_server
+    module_client = product_catalog_api.tmf620_client
+    saved = (module_client.base_url, module_client.http_client, server.catalog_graph)
+    module_client.base_url = f"{STUB_URL}{BASE_PATH}"
+    module_client.http_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=STUB_URL
+    )
+    server.catalog_graph = await CatalogGraph(create_client(app)).build()
+    try:
+        offering = next(iter(server.catalog_graph.documents["productOffering"]))
+        result = await server.product_offering_update(
+            offering, {"name": "Renamed offering"}
+        )
+        read = await server.product_offering_get(offering)
+        if (
+            result.get("name") != "Renamed offering"
+            or read.get("name") != result["name"]
+        ):
+            logger.error(f"Update not read back: {read.get('name')}")
+            return False
+        # A fields selection from the graph matches the one of the API
+        local = await server.product_offering_get(offering, fields="name")
+        remote = await create_client(app).get("productOffering", offering, "name")
+        if local != remote:
+            logger.error(f"Graph projection {local} differs from the API's {remote}")
+            return False
+
+        await server.product_offering_delete(offering)
+        listed = await server.product_offering_get(fields="id", max_tokens=0)
+        if offering in [o["id"] for o in listed]:
+            logger.error("Deleted offering still listed")
+            return False
+        created = await server.category_create({"name": "Write-through"})
+        listed = await server.category_get(fields="name", max_tokens=0)
+        if created["id"] not in [c["id"] for c in listed]:
+            logger.error("Created category not listed")
+            return False
+
+        result = await server.catalog_cleanup(confirm=True)
+        if result["failed"] or server.catalog_graph.size():
+            logger.error(f"{server.catalog_graph.size()} resources left after cleanup")
+            return False
+        if await server.catalog_get(max_tokens=0):
+            logger.error("Deleted catalogs still listed")
+            return False
+    finally:
+        module_client.base_url, module_client.http_client, server.catalog_graph = saved
+        product_catalog_api.response_cache.clear()
+
+    logger.info("Updates, creations and deletions read back from the graph")
+    return True
+
+
+async def run_delta_sync_tests() -> bool:
+    """Syncs list only changed resources, find deletions by ID scans and feed the cache."""
+    logger.info("Testing delta sync...")
+    app = create_app()
+    cache = ResponseCache(ttl=60)
+    client = create_client(app, cache)
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=client)
+    urls = []
+
+    async def record(request):
+        urls.append(str(request.url))
+
+    client.http_client.event_hooks["request"].append(record)
+
+    class Copy:
+        def __init__(self):
+            self.documents = {}
+
+        def upsert(self, resource, document):
+            self.documents[(resource, document["id"])] = document
+
+        def remove(self, resource, resource_id):
+            self.documents.pop((resource, resource_id), None)
+
+    copy = Copy()
+    sync = DeltaSync(client.without(ResponseCache), cache, [copy])
+    counts = await sync.sync()
+    if counts != {"added": 46, "changed": 0, "removed": 0} or len(copy.documents) != 46:
+        logger.error(f"Unexpected initial sync: {counts}")
+        return False
+
+    # Unchanged collections are listed with a lastUpdate filter only
+    urls.clear()
+    counts = await sync.sync()
+    if any(counts.values()) or len(urls) != 5:
+        logger.error(f"Unchanged catalog synced as {counts} with {len(urls)} GETs")
+        return False
+    if not all(lists_changes(url) for url in urls):
+        logger.error(f"Sync listed without a lastUpdate filter: {urls}")
+        return False
+
+    # Changes made by other clients are picked up and replace the cached resource
+    offering = next(d for (r, _), d in copy.documents.items() if r == "productOffering")
+    await client.get("productOffering", offering["id"])
+    await asyncio.sleep(0.002)
+    other = create_client(app)
+    await other.update(
+        "productOffering", offering["id"], {"lifecycleStatus": "Retired"}
+    )
+    created = await other.create("category", {"name": "New"})
+    counts = await sync.sync()
+    if counts != {"added": 1, "changed": 1, "removed": 0}:
+        logger.error(f"Unexpected sync of changes: {counts}")
+        return False
+    gets = backend_requests(app)
+    refreshed = await client.get("productOffering", offering["id"])
+    if backend_requests(app) != gets or refreshed.get("lifecycleStatus") != "Retired":
+        logger.error(f"Cache not refreshed by the sync: {refreshed}")
+        return False
+
+    # Deletions are found by the ID-only scan
+    await other.delete("category", created["id"])
+    counts = await sync.sync()
+    if counts["removed"] != 0:
+        logger.error("Deletion found without an ID scan")
+        return False
+    urls.clear()
+    counts = await sync.sync(scan_deletions=True)
+    if counts != {"added": 0, "changed": 0, "removed": 1} or (
+        ("category", created["id"]) in copy.documents
+    ):
+        logger.error(f"Unexpected sync of a deletion: {counts}")
+        return False
+    if sum("fields=id" in url for url in urls) != 5:
+        logger.error(f"Deletion scan did not list IDs only: {urls}")
+        return False
+
+    logger.info(f"Synced {sync.cycles} cycles: {sync.totals}")
+    return True
+
+
+async def run_snapshot_tests() -> bool:
+    """A snapshot answers reads after a restart and is caught up by a delta sync."""
+    logger.info("Testing the catalog snapshot...")
+    app = create_app()
+    client = create_client(app)
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=client)
+    graph = await CatalogGraph(client).build()
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "catalog.snapshot")
+    CatalogSnapshot(path).save(
+        {r: list(d.values()) for r, d in graph.documents.items()}
+    )
+
+    snapshot = CatalogSnapshot(path)
+    if not snapshot.open() or snapshot.size() != 46:
+        logger.error("Snapshot could not be mapped")
+        return False
+    offering = next(iter(graph.documents["productOffering"].values()))
+    if snapshot.get("productOffering", offering["id"]) != offering:
+        logger.error("Snapshot lookup by ID returned a different offering")
+        return False
+    if [
+        d["id"] for d in snapshot.find_by_name("productOffering", offering["name"])
+    ] != [offering["id"]]:
+        logger.error("Snapshot lookup by name failed")
+        return False
+    listed = snapshot.select("productOffering", fields="name")
+    if len(listed) != 16 or snapshot.select("productOffering", offset=15, limit=5) != [
+        snapshot.get("productOffering", listed[-1]["id"])
+    ]:
+        logger.error("Snapshot listing does not page like the API")
+        return False
+    snapshot.close()
+
+    # Restart of the MCP server: reads are answered from the snapshot at once, then the
+    # changes made while it was down are fetched with delta and ID-only listings
+    other = create_client(app)
+    price = next(iter(graph.documents["productOfferingPrice"].values()))
+    await other.update("productOffering", offering["id"], {"name": "Renamed"})
+    await other.delete("productOfferingPrice", price["id"])
+    module_client = product_catalog_api.tmf620_client
+    saved = (
+        module_client.base_url,
+        module_client.http_client,
+        product_catalog_mcp_server.catalog_graph,
+        product_catalog_mcp_server.catalog_snapshot,
+    )
+    urls = []
+
+    async def record(request):
+        urls.append(str(request.url))
+
+    module_client.base_url = f"{STUB_URL}{BASE_PATH}"
+    module_client.http_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url=STUB_URL,
+        event_hooks={"request": [record]},
+    )
+    restarted = CatalogSnapshot(path)
+    product_catalog_mcp_server.catalog_graph = None
+    product_catalog_mcp_server.catalog_snapshot = restarted
+    try:
+        if (
+            not restarted.open()
+            or product_catalog_mcp_server.local_read(
+                "productOffering", offering["id"], "name"
+            ).get("name")
+            != offering["name"]
+        ):
+            logger.error("Snapshot did not answer reads before the sync")
+            return False
+        await product_catalog_mcp_server.maintain_catalog_view(0)
+        if len(urls) != 10 or not all(
+            lists_changes(url) or "fields=id" in url for url in urls
+        ):
+            logger.error(f"Warm start listed the catalog in full: {urls}")
+            return False
+        read = product_catalog_mcp_server.local_read
+        if read("productOffering", offering["id"])["name"] != "Renamed" or read(
+            "productOfferingPrice", price["id"]
+        ):
+            logger.error("Warm start did not catch up with the changes")
+            return False
+
+        # Exact names are looked up in the name index, and the server's own writes are
+        # read back from the overlay
+        server = product_catalog_mcp_server
+        urls.clear()
+        found = await server.product_offering_get(filter={"name": "Renamed"})
+        if [d["id"] for d in found] != [offering["id"]] or urls:
+            logger.error(f"Name filter not answered from the snapshot: {urls}")
+            return False
+        other_id = next(
+            i for i in graph.documents["productOffering"] if i != offering["id"]
+        )
+        await server.product_offering_update(other_id, {"name": "Updated"})
+        if (await server.product_offering_get(other_id))["name"] != "Updated":
+            logger.error("Update not read back from the snapshot")
+            return False
+        await server.product_offering_delete(offering["id"])
+        listed = await server.product_offering_get(fields="id", max_tokens=0)
+        if offering["id"] in [d["id"] for d in listed]:
+            logger.error("Deleted offering still listed from the snapshot")
+            return False
+
+        # A change recorded while the file is written stays in the overlay
+        saving = asyncio.create_task(restarted.save_async())
+        await asyncio.sleep(0)
+        restarted.upsert("catalog", {"id": "late", "name": "Late"})
+        await saving
+        if restarted.pending != 1 or restarted.size() != 44:
+            logger.error(f"Saved snapshot holds {restarted.size()} resources")
+            return False
+        if restarted.get("catalog", "late") is None:
+            logger.error("Change made during the save was lost")
+            return False
+    finally:
+        (
+            module_client.base_url,
+            module_client.http_client,
+            product_catalog_mcp_server.catalog_graph,
+            product_catalog_mcp_server.catalog_snapshot,
+        ) = saved
+        product_catalog_api.response_cache.clear()
+        restarted.close()
+
+    # Anything but a snapshot is ignored
+    with open(path, "wb") as file:
+        file.write(b"{}")
+    if CatalogSnapshot(path).open():
+        logger.error("An invalid snapshot was mapped")
+        return False
+    directory.cleanup()
+
+    logger.info("Warm start answered from the snapshot and caught up with 10 GETs")
+    return True
+
+
+async def run_token_budget_tests() -> bool:
+    """List tools cut their results to a token budget and return a cursor to continue."""
+    logger.info("Testing token budgets...")
+    app = create_app()
+    client = create_client(app)
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=client)
+    server = product_catalog_mcp_server
+    saved = server.catalog_graph
+    server.catalog_graph = await CatalogGraph(client).build()
+    try:
+        # Page through the offerings with the cursor until the rest fits
+        seen, offset, calls = [], None, 0
+        while True:
+            result = await server.product_offering_get(offset=offset, max_tokens=1500)
+            calls += 1
+            if isinstance(result, list):
+                seen.extend(o["id"] for o in result)
+                break
+            if result["omitted"] != 16 - len(seen) - len(result["items"]):
+                logger.error(f"Wrong omitted count: {result['omitted']}")
+                return False
+            if result["tokens"] > 1500:
+                logger.error(f"Budget exceeded: {result['tokens']} tokens")
+                return False
+            seen.extend(o["id"] for o in result["items"])
+            offset = result["next_offset"]
+        if calls < 2 or sorted(seen) != sorted(
+            server.catalog_graph.documents["productOffering"]
+        ):
+            logger.error(f"Paging with the cursor returned {len(seen)} offerings")
+            return False
+        if len(await server.product_offering_get(max_tokens=0)) != 16:
+            logger.error("A budget of 0 did not return the whole list")
+            return False
+
+        ids = list(server.catalog_graph.documents["productSpecification"])
+        result = await server.resource_get_many(
+            "productSpecification", ids, max_tokens=500
+        )
+        if not result.get("truncated") or len(result["results"]) + len(
+            result["omitted_ids"]
+        ) != len(ids):
+            logger.error(f"resource_get_many ignored the budget: {list(result)}")
+            return False
+        result = await server.product_offering_search(max_tokens=300)
+        if result["count"] != 16 or result["omitted"] != 16 - len(result["offerings"]):
+            logger.error(f"product_offering_search ignored the budget: {result}")
+            return False
+
+        # Encoders are loaded once per encoding
+        counter = server.token_counter(server.MCP_TOKEN_ENCODING)
+        if counter is not server.token_counter(server.MCP_TOKEN_ENCODING):
+            logger.error("Token encoder was not cached")
+            return False
+    finally:
+        server.catalog_graph = saved
+
+    logger.info(f"Paged through 16 offerings in {calls} calls of at most 1500 tokens")
+    return True
+
+
+async def run_projection_tests() -> bool:
+    """Lists are compact by default, and summaries reduce resources to a few fields."""
+    logger.info("Testing compact and summary projections...")
+    app = create_app()
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=create_client(app))
+    server = product_catalog_mcp_server
+    module_client = product_catalog_api.tmf620_client
+    saved = (module_client.base_url, module_client.http_client)
+    module_client.base_url = f"{STUB_URL}{BASE_PATH}"
+    module_client.http_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=STUB_URL
+    )
+    app.state.store["productOffering"][
+        next(iter(app.state.store["productOffering"]))
+    ].update({"@schemaLocation": "https://example.com/po.json", "place": []})
+    try:
+        full = await server.product_offering_get(compact=False, max_tokens=0)
+        compact = await server.product_offering_get(max_tokens=0)
+        if len(compact) != len(full) or len(json.dumps(compact)) >= len(
+            json.dumps(full)
+        ):
+            logger.error("Compact list is not smaller")
+            return False
+        text = json.dumps(compact)
+        if any(
+            f in text for f in ('"href"', "@schemaLocation", "@referredType", '"place"')
+        ):
+            logger.error("Compact list kept links, schema metadata or empty fields")
+            return False
+        if compact[0]["productSpecification"] != {
+            "id": full[0]["productSpecification"]["id"],
+            "name": full[0]["productSpecification"]["name"],
+        }:
+            logger.error(f"Reference not reduced: {compact[0]['productSpecification']}")
+            return False
+        single = await server.product_offering_get(full[0]["id"])
+        if "href" not in single:
+            logger.error("A single resource was compacted by default")
+            return False
+
+        summaries = await server.product_offering_get(summary=True, max_tokens=0)
+        summary = next(o for o in summaries if o["id"] == full[0]["id"])
+        if (
+            set(summary)
+            - {
+                "id",
+                "name",
+                "lifecycleStatus",
+                "productSpecification",
+                "category",
+                "prices",
+            }
+            or summary["productSpecification"] != full[0]["productSpecification"]["id"]
+        ):
+            logger.error(f"Unexpected offering summary: {summary}")
+            return False
+        if not summary["prices"] or "value" not in summary["prices"][0]:
+            logger.error(f"Summary has no price amounts: {summary['prices']}")
+            return False
+        ratio = len(json.dumps(full)) / len(json.dumps(summaries))
+        if ratio < 3:
+            logger.error(f"Summaries are only {ratio:.1f}x smaller")
+            return False
+    finally:
+        module_client.base_url, module_client.http_client = saved
+        product_catalog_api.response_cache.clear()
+
+    logger.info(f"Offering summaries are {ratio:.1f}x smaller than the full list")
+    return True
+
+
+async def run_table_tests() -> bool:
+    """format="table" returns CSV rows, streamed from the API or the local catalog."""
+    logger.info("Testing table output...")
+    app = create_app()
+    payloads = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_payloads")
+    await load_catalog(load_payloads(payloads), client=create_client(app))
+    server = product_catalog_mcp_server
+    module_client = product_catalog_api.tmf620_client
+    saved = (module_client.base_url, module_client.http_client, server.catalog_graph)
+    module_client.base_url = f"{STUB_URL}{BASE_PATH}"
+    module_client.http_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=STUB_URL
+    )
+    offerings = list(app.state.store["productOffering"].values())
+    try:
+        table = await server.product_offering_get(format="table", max_tokens=0)
+        rows = list(csv.reader(io.StringIO(table)))
+        if (
+            rows[0] != list(server.TABLE_COLUMNS["productOffering"])
+            or len(rows) != len(offerings) + 1
+        ):
+            logger.error(f"Unexpected table header or size: {rows[:2]}")
+            return False
+        compact = await server.product_offering_get(max_tokens=0)
+        if len(table) >= len(json.dumps(compact)) / 2:
+            logger.error("Table is not shorter than the compact JSON list")
+            return False
+
+        table = await server.product_offering_price_get(
+            format="table", columns="name,price.value,price.unit", max_tokens=0
+        )
+        rows = list(csv.reader(io.StringIO(table)))
+        price = next(iter(app.state.store["productOfferingPrice"].values()))
+        expected = [price["name"], str(price["price"]["value"]), price["price"]["unit"]]
+        if expected not in rows[1:]:
+            logger.error(f"Dotted columns not flattened: {rows[:2]}")
+            return False
+
+        # Lists are joined, and a cut table says where to continue
+        category_ids = "|".join(c["id"] for c in offerings[0]["category"])
+        table = await server.product_offering_get(
+            format="table", columns="id,category.id", max_tokens=60
+        )
+        lines = table.splitlines()
+        cut = lines[-1].startswith("# Only the first")
+        if lines[1] != f"{offerings[0]['id']},{category_ids}" or not cut:
+            logger.error(f"Unexpected cut table: {lines}")
+            return False
+        offset = int(lines[-1].split("offset=")[1].split(" ")[0])
+        rest = await server.product_offering_get(
+            format="table", columns="id", offset=offset, limit=100, max_tokens=0
+        )
+        if rest.splitlines()[1] != offerings[offset]["id"]:
+            logger.error("Continuing a cut table skipped or repeated rows")
+            return False
+
+        # Without a budget a streamed table stops at MCP_LIST_MAX_ITEMS rows, like a list
+        max_items, server.MCP_LIST_MAX_ITEMS = server.MCP_LIST_MAX_ITEMS, 5
+        try:
+            table = await server.product_offering_get(format="table", max_tokens=0)
+        finally:
+            server.MCP_LIST_MAX_ITEMS = max_items
+        lines = table.splitlines()
+        if len(lines) != 7 or not lines[-1].startswith("# Only the first 5 rows"):
+            logger.error(f"Unbounded table without a budget: {len(lines)} lines")
+            return False
+
+        # A mistyped format is refused rather than answered with JSON
+        for tool in (server.product_offering_get, server.product_offering_search):
+            result = await tool(format="tabel")
+            if (
+                not isinstance(result, dict)
+                or result.get("error", {}).get("status") != 400
+            ):
+                logger.error(f"Unknown format accepted by {tool.__name__}")
+                return False
+
+        # From the local catalog without a request to the API
+        server.catalog_graph = await CatalogGraph(create_client(app)).build()
+        before = len(app.state.requests)
+        table = await server.category_get(format="table", fields="name")
+        if len(app.state.requests) != before or table.splitlines()[0] != "id,name":
+            logger.error("Table not answered from the catalog graph")
+            return False
+    finally:
+        module_client.base_url, module_client.http_client, server.catalog_graph = saved
+        product_catalog_api.response_cache.clear()
+
+    logger.info("Table output tests passed")
+    return True
+
+
+async def run_tool_catalogue_tests() -> bool:
+    """tools/list is served from a prebuilt catalogue with short descriptions."""
+    logger.info("Testing the tool catalogue...")
+    server = product_catalog_mcp_server
+    handler = server.mcp._mcp_server.request_handlers[ListToolsRequest]
+    result = await handler(ListToolsRequest(method="tools/list"))
+    if result is not server.tool_catalogue or result is not await handler(None):
+        logger.error("tools/list is not answered from the prebuilt catalogue")
+        return False
+    tools = {tool.name: tool for tool in result.root.tools}
+    if set(tools) != {tool.name for tool in await server.mcp.list_tools()}:
+        logger.error("The catalogue does not list the registered tools")
+        return False
+
+    resources = {str(r.uri) for r in await server.mcp.list_resources()}
+    full = server.build_tool_catalogue(server.mcp, compact=False).root.tools
+    for name in ("product_specification", "product_offering", "product_offering_price"):
+        tool = tools[f"{name}_create"]
+        description = tool.inputSchema["properties"][f"{name}_data"]["description"]
+        uri = description.split("see the ")[1].split(" ")[0]
+        if "properties:" in tool.description or uri not in resources:
+            logger.error(
+                f"{tool.name} does not refer to a schema resource: {description}"
+            )
+            return False
+        original = next(t for t in full if t.name == tool.name)
+        if len(tool.model_dump_json()) * 5 > len(original.model_dump_json()):
+            logger.error(f"{tool.name} description was not shortened")
+            return False
+    for tool in tools.values():
+        for parameter, schema in tool.inputSchema["properties"].items():
+            if not schema.get("description"):
+                logger.error(f"{tool.name}.{parameter} is not documented")
+                return False
+
+    logger.info(f"Tool catalogue with {len(tools)} tools passed")
+    return True
+
+
+async def run_fastmcp_internals_tests() -> bool:
+    """The private FastMCP attributes the server relies on still exist.
+
+    pyproject.toml pins mcp below the next minor version because of them; this test is
+    the check to run before raising that bound.
+    """
+    logger.info("Testing the FastMCP internals in use...")
+    server = FastMCP(name="internals")
+
+    @server.tool()
+    def probe() -> str:
+        """Probe tool."""
+        return "probe"
+
+    # serve_tool_catalogue replaces the tools/list handler of the low-level server
+    handlers = getattr(getattr(server, "_mcp_server", None), "request_handlers", None)
+    if not isinstance(handlers, dict) or ListToolsRequest not in handlers:
+        logger.error("FastMCP has no _mcp_server.request_handlers for tools/list")
+        return False
+    # build_tool_catalogue reads the registered tools with their parameters
+    tools = (
+        server._tool_manager.list_tools() if hasattr(server, "_tool_manager") else []
+    )
+    if [(tool.name, hasattr(tool, "parameters")) for tool in tools] != [
+        ("probe", True)
+    ]:
+        logger.error("FastMCP has no _tool_manager.list_tools() with tool parameters")
+        return False
+
+    # select_families copies the registries, keyed by tool and prompt name and by URI
+    @server.prompt()
+    def probe_prompt() -> str:
+        """Probe prompt."""
+        return "probe"
+
+    @server.resource("schema://tmf620/probe")
+    def probe_schema() -> dict:
+        """Probe resource."""
+        return {}
+
+    @server.resource("resource://tmf620/probe/{probe_id}")
+    def probe_resource(probe_id: str) -> dict:
+        """Probe resource template."""
+        return {}
+
+    registries = {
+        "_tool_manager._tools": ("_tool_manager", "_tools", "probe"),
+        "_prompt_manager._prompts": ("_prompt_manager", "_prompts", "probe_prompt"),
+        "_resource_manager._resources": (
+            "_resource_manager",
+            "_resources",
+            "schema://tmf620/probe",
+        ),
+        "_resource_manager._templates": (
+            "_resource_manager",
+            "_templates",
+            "resource://tmf620/probe/{probe_id}",
+        ),
+    }
+    for label, (manager, attribute, key) in registries.items():
+        registry = getattr(getattr(server, manager, None), attribute, None)
+        if not isinstance(registry, dict) or list(registry) != [key]:
+            logger.error(f"FastMCP has no {label} registry keyed by {key}")
+            return False
+
+    logger.info("FastMCP internals found")
+    return True
+
+
+async def run_profile_tests() -> bool:
+    """Profiles serve their own registry of tool, resource and prompt families."""
+    logger.info("Testing profiles...")
+    server = product_catalog_mcp_server
+    readonly = server.mcp_profiles["readonly"]
+    tools = {tool.name for tool in await readonly.list_tools()}
+    prompts = {prompt.name for prompt in await readonly.list_prompts()}
+    if not tools or any(
+        not name.endswith(("_get", "_get_many", "_search")) for name in tools
+    ):
+        logger.error(f"Read-only profile has write tools: {sorted(tools)}")
+        return False
+    if await readonly.list_resources() or any(p.startswith("create_") for p in prompts):
+        logger.error("Read-only profile has schemas or create prompts")
+        return False
+    if {tool.name for tool in await server.mcp.list_tools()} <= tools:
+        logger.error("The MCP endpoint lost its write tools")
+        return False
+
+    # tools/list of the profile is answered from its own catalogue
+    handler = readonly._mcp_server.request_handlers[ListToolsRequest]
+    catalogue = (await handler(None)).root.tools
+    if {tool.name for tool in catalogue} != tools or len(catalogue) >= len(
+        server.tool_catalogue.root.tools
+    ):
+        logger.error("Profile catalogue does not match its tools")
+        return False
+
+    offers = server.select_families(
+        FastMCP(name="offers"), "read,productOffering,productOfferingPrice", server.mcp
+    )
+    # resource_get_many could read the other resource types, so it is left out
+    expected = {
+        "product_offering_get",
+        "product_offering_price_get",
+        "product_offering_search",
+    }
+    if set(offers._tool_manager._tools) != expected:
+        logger.error(
+            f"Unexpected offering tools: {sorted(offers._tool_manager._tools)}"
+        )
+        return False
+    writes = server.select_families(
+        FastMCP(name="writes"), "write,category", server.mcp
+    )
+    resources = set(writes._resource_manager._resources)
+    if (
+        resources != {"schema://tmf620/category"}
+        or "category_get" in writes._tool_manager._tools
+    ):
+        logger.error(f"Unexpected category write families: {resources}")
+        return False
+    # catalog_cleanup deletes every resource type, so it needs all of them selected
+    if "catalog_cleanup" in writes._tool_manager._tools:
+        logger.error("Cleanup served by a category write profile")
+        return False
+    everything = server.select_families(FastMCP(name="all"), "write", server.mcp)
+    if "catalog_cleanup" not in everything._tool_manager._tools:
+        logger.error("Cleanup missing from the write profile of every type")
+        return False
+
+    logger.info(
+        f"Read-only profile serves {len(tools)} tools and {len(prompts)} prompts"
+    )
+    return True
+
+
+async def main():
+    """Run all tests and report the results."""
+    results = {}
+    for name, test in [
+        ("Full scan", run_full_scan_tests),
+        ("Cache", run_cache_tests),
+        ("Concurrent GET", run_concurrent_get_tests),
+        ("ETag revalidation", run_etag_revalidation_tests),
+        ("No validators", run_no_validator_tests),
+        ("Event", run_event_tests),
+        ("Retry", run_retry_tests),
+        ("Circuit breaker", run_circuit_breaker_tests),
+        ("Rate limiter", run_rate_limiter_tests),
+        ("Concurrency limiter", run_concurrency_limiter_tests),
+        ("Bulk create", run_create_many_tests),
+        ("Multi-ID fetch", run_get_many_tests),
+        ("Reference expansion", run_expand_tests),
+        ("Loader", run_loader_tests),
+        ("Cleanup", run_cleanup_tests),
+        ("Catalog graph", run_graph_tests),
+        ("Search without a graph", run_search_tests),
+        ("Writes read back", run_write_through_tests),
+        ("Delta sync", run_delta_sync_tests),
+        ("Snapshot", run_snapshot_tests),
+        ("Token budget", run_token_budget_tests),
+        ("Projection", run_projection_tests),
+        ("Table output", run_table_tests),
+        ("Tool catalogue", run_tool_catalogue_tests),
+        ("FastMCP internals", run_fastmcp_internals_tests),
+        ("Profiles", run_profile_tests),
+    ]:
+        try:
+            results[name] = await test()
+        except Exception as e:
+            logger.error(f"{name} tests raised an unexpected error: {str(e)}")
+            logger.error(traceback.format_exc())
+            results[name] = False
+
+    logger.info("=========================================================")
+    logger.info("TEST RESULTS SUMMARY:")
+    for name, passed in results.items():
+        logger.info(f"{name} Tests: {'PASSED' if passed else 'FAILED'}")
+    logger.info("=========================================================")
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
@@ -191,6 +191,8 @@ exports.patchCategory = function(req, res, next) {
           }
 
           payload = swaggerUtils.updatePayloadServiceType(payload, req, 'id');
+          // record the modification time, as on create, so that changes can be listed by lastUpdate
+          payload.lastUpdate = (new Date()).toISOString();
           
           // then update and return the complete resource
           db.collection(resourceType)